@@ -1,14 +1,21 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
 import time
 from traceback import format_exception
-from typing import Any, Callable, Optional, Sequence, Union, cast
+from typing import Any, Callable, Mapping, Optional, Sequence, Union, cast
 from google.protobuf.duration import to_timedelta
 from google.protobuf.timestamp import to_datetime
 from cadence._internal.activity._context import _Context, _SyncContext
+from cadence._internal.concurrency import CountingThreadPoolExecutor
 from cadence._internal.context import header_to_dict
+from cadence._internal.tracing import (
+    ACTIVITY_EXECUTE_SPAN,
+    ACTIVITY_RESPOND_SPAN,
+    ACTIVITY_TASK_SPAN,
+    NOOP_TASK_TRACER,
+    TaskTracer,
+)
 from cadence._internal.activity._definition import BaseDefinition, ExecutionStrategy
 from cadence._internal.activity._heartbeat import _HeartbeatSender
 from cadence.activity import ActivityInfo, ActivityDefinition
@@ -27,6 +34,7 @@ from cadence.metrics import (
     MetricsEmitter,
     NoOpMetricsEmitter,
 )
+from cadence.metrics.metrics import TaggedEmitterCache
 from cadence.metrics.constants import (
     ACTIVITY_END_TO_END_LATENCY,
     ACTIVITY_EXECUTION_FAILED_COUNTER,
@@ -56,6 +64,7 @@ class ActivityExecutor:
         registry: Callable[[str], ActivityDefinition],
         metrics_emitter: MetricsEmitter | None = None,
         context_propagators: Sequence[ContextPropagator] = (),
+        tracer: TaskTracer = NOOP_TASK_TRACER,
     ):
         self._client = client
         self._data_converter = client.data_converter
@@ -65,29 +74,57 @@ class ActivityExecutor:
         self._metrics_emitter: MetricsEmitter = (
             metrics_emitter if metrics_emitter is not None else NoOpMetricsEmitter()
         )
+        self._activity_emitters = TaggedEmitterCache(
+            self._metrics_emitter,
+            (TAG_ACTIVITY_TYPE, TAG_WORKFLOW_TYPE, TAG_DOMAIN, TAG_TASK_LIST),
+        )
         self._context_propagators = tuple(context_propagators)
-        self._thread_pool = ThreadPoolExecutor(
+        self._tracer = tracer
+        self._thread_pool = CountingThreadPoolExecutor(
             max_workers=max_workers, thread_name_prefix=f"{task_list}-activity-"
         )
 
+    @property
+    def thread_pool(self) -> CountingThreadPoolExecutor:
+        return self._thread_pool
+
     async def execute(self, task: PollForActivityTaskResponse) -> None:
         activity_type = task.activity_type.name if task.activity_type else ""
         wf_type = task.workflow_type.name if task.workflow_type else ""
-        emitter = self._metrics_emitter.with_tags(
-            {
-                TAG_ACTIVITY_TYPE: activity_type,
-                TAG_WORKFLOW_TYPE: wf_type,
-                TAG_DOMAIN: self._client.domain,
-                TAG_TASK_LIST: self._task_list,
-            }
+        emitter = self._activity_emitters.get(
+            activity_type, wf_type, self._client.domain, self._task_list
         )
+        headers = header_to_dict(task.header)
+        with self._tracer.span(
+            ACTIVITY_TASK_SPAN,
+            headers,
+            {
+                "cadence.activity_type": activity_type,
+                "cadence.activity_id": task.activity_id,
+                "cadence.workflow_type": wf_type,
+                "cadence.workflow_id": task.workflow_execution.workflow_id,
+                "cadence.run_id": task.workflow_execution.run_id,
+                "cadence.attempt": task.attempt,
+            },
+        ):
+            await self._execute(task, headers, emitter)
+
+    async def _execute(
+        self,
+        task: PollForActivityTaskResponse,
+        headers: dict[str, bytes],
+        emitter: MetricsEmitter,
+    ) -> None:
         context: Union[_Context, _SyncContext] | None = None
         error: Optional[Exception] = None
         result: Any = None
         exec_start_ns = time.monotonic_ns()
         try:
-            context = self._create_context(task)
-            result = await context.execute(task.input)
+            with self._tracer.span(ACTIVITY_EXECUTE_SPAN):
+                context = self._create_context(
+                    task, self._tracer.with_span_headers(headers)
+                )
+                result = await context.execute(task.input)
         except asyncio.CancelledError as e:
             if context is not None and context.is_cancelled():
                 details = list(e.args) if e.args else None
@@ -124,7 +161,7 @@ class ActivityExecutor:
             await self._report_success(task, result, emitter, e2e_latency)
 
     def _create_context(
-        self, task: PollForActivityTaskResponse
+        self, task: PollForActivityTaskResponse, headers: Mapping[str, bytes]
     ) -> Union[_Context, _SyncContext]:
         activity_type = task.activity_type.name
         try:
@@ -148,7 +185,7 @@ class ActivityExecutor:
                 activity_def,
                 heartbeat_sender,
                 self._context_propagators,
-                header_to_dict(task.header),
+                headers,
             )
         return _SyncContext(
             self._client,
@@ -157,7 +194,7 @@ class ActivityExecutor:
             self._thread_pool,
             heartbeat_sender,
             self._context_propagators,
-            header_to_dict(task.header),
+            headers,
         )
 
     async def _report_failure(
@@ -169,13 +206,14 @@ class ActivityExecutor:
     ):
         resp_start_ns = time.monotonic_ns()
         try:
-            await self._client.worker_stub.RespondActivityTaskFailed(
-                RespondActivityTaskFailedRequest(
-                    task_token=task.task_token,
-                    failure=_to_failure(error),
-                    identity=self._identity,
+            with self._tracer.span(ACTIVITY_RESPOND_SPAN):
+                await self._client.worker_stub.RespondActivityTaskFailed(
+                    RespondActivityTaskFailedRequest(
+                        task_token=task.task_token,
+                        failure=_to_failure(error),
+                        identity=self._identity,
+                    )
                 )
-            )
             emitter.counter(ACTIVITY_TASK_FAILED_COUNTER)
             if e2e_latency is not None and e2e_latency >= timedelta(0):
                 emitter.histogram(ACTIVITY_END_TO_END_LATENCY, e2e_latency)
@@ -197,13 +235,14 @@ class ActivityExecutor:
         as_payload = self._data_converter.to_data(details) if details else Payload()
         resp_start_ns = time.monotonic_ns()
         try:
-            await self._client.worker_stub.RespondActivityTaskCanceled(
-                RespondActivityTaskCanceledRequest(
-                    task_token=task.task_token,
-                    details=as_payload,
-                    identity=self._identity,
+            with self._tracer.span(ACTIVITY_RESPOND_SPAN):
+                await self._client.worker_stub.RespondActivityTaskCanceled(
+                    RespondActivityTaskCanceledRequest(
+                        task_token=task.task_token,
+                        details=as_payload,
+                        identity=self._identity,
+                    )
                 )
-            )
             emitter.counter(ACTIVITY_TASK_CANCELED_COUNTER)
         except Exception:
             emitter.counter(ACTIVITY_RESPONSE_FAILED_COUNTER)
@@ -224,13 +263,14 @@ class ActivityExecutor:
         as_payload = self._data_converter.to_data([result])
         resp_start_ns = time.monotonic_ns()
         try:
-            await self._client.worker_stub.RespondActivityTaskCompleted(
-                RespondActivityTaskCompletedRequest(
-                    task_token=task.task_token,
-                    result=as_payload,
-                    identity=self._identity,
+            with self._tracer.span(ACTIVITY_RESPOND_SPAN):
+                await self._client.worker_stub.RespondActivityTaskCompleted(
+                    RespondActivityTaskCompletedRequest(
+                        task_token=task.task_token,
+                        result=as_payload,
+                        identity=self._identity,
+                    )
                 )
-            )
             emitter.counter(ACTIVITY_TASK_COMPLETED_COUNTER)
             if e2e_latency is not None and e2e_latency >= timedelta(0):
                 emitter.histogram(ACTIVITY_END_TO_END_LATENCY, e2e_latency)
@@ -10,6 +10,7 @@ from cadence import Client
 from cadence._internal.activity._definition import BaseDefinition
 from cadence._internal.activity._heartbeat import _HeartbeatSender
 from cadence._internal.context import extract_headers
+from cadence._internal.profiler import task_label
 from cadence.activity import ActivityInfo, ActivityContext
 from cadence.api.v1.common_pb2 import Payload
 from cadence.context import ContextPropagator
@@ -153,7 +154,7 @@ class _SyncContext(_Context):
             await self._wait_pending_heartbeats()
 
     def _run(self, args: list[Any]) -> Any:
-        with self._activate():
+        with task_label("activity", self._info.activity_type), self._activate():
             with extract_headers(self._context_propagators, self._headers):
                 return self._activity_def.impl_fn(*args)
 
@@ -0,0 +1,113 @@
+"""Helpers for fanning out many coroutines with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, ParamSpec, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+P = ParamSpec("P")
+
+
+async def map_bounded(
+    items: Iterable[T] | AsyncIterable[T],
+    fn: Callable[[int, T], Awaitable[R]],
+    limit: int,
+) -> AsyncGenerator[R, None]:
+    """Run ``fn(index, item)`` for every item with at most ``limit`` in flight.
+
+    Items are pulled lazily, so arbitrarily large (or unbounded) sources are never
+    materialized. Results are yielded in completion order; ``fn`` should capture
+    per-item failures itself, since an exception raised by ``fn`` cancels the
+    remaining work and propagates to the consumer.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be greater than 0")
+
+    source = _aiter(items)
+    pending: set[asyncio.Future[R]] = set()
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(fn(index, item)))
+                index += 1
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _aiter(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class CountingThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that counts submitted work still waiting for a thread."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._count_lock = threading.Lock()
+        self._queued = 0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def submit(
+        self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        with self._count_lock:
+            self._queued += 1
+        try:
+            future = super().submit(self._run, fn, *args, **kwargs)
+        except BaseException:
+            self._dequeue()
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _run(self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+        self._dequeue()
+        return fn(*args, **kwargs)
+
+    def _on_done(self, future: Future[Any]) -> None:
+        # Work cancelled while queued never reaches _run
+        if future.cancelled():
+            self._dequeue()
+
+    def _dequeue(self) -> None:
+        with self._count_lock:
+            self._queued -= 1
@@ -1,9 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from typing import Any, TypeVar
 
 import grpc
 from grpc.aio import Metadata, UnaryUnaryCall
 
+from cadence.error import CadenceRpcError
+
 RequestType = TypeVar("RequestType")
 ResponseType = TypeVar("ResponseType")
 
@@ -44,3 +46,47 @@ class UnaryUnaryCallWrapper(UnaryUnaryCall[RequestType, ResponseType]):
 
     def add_done_callback(self, callback: Callable[[Any], None]) -> None:
         self._wrapped.add_done_callback(callback)
+
+
+class FailedUnaryUnaryCall(UnaryUnaryCall[RequestType, ResponseType]):
+    """A call that was never sent and raises ``error`` when awaited."""
+
+    def __init__(self, error: CadenceRpcError):
+        super().__init__()
+        self._error = error
+
+    def __await__(self) -> Generator[Any, None, ResponseType]:
+        return self._raise().__await__()
+
+    async def _raise(self) -> ResponseType:
+        raise self._error
+
+    async def initial_metadata(self) -> Metadata:
+        return Metadata()
+
+    async def trailing_metadata(self) -> Metadata:
+        return Metadata()
+
+    async def code(self) -> grpc.StatusCode:
+        return self._error.code
+
+    async def details(self) -> str:
+        return str(self._error)
+
+    async def wait_for_connection(self) -> None:
+        return None
+
+    def cancelled(self) -> bool:
+        return False
+
+    def done(self) -> bool:
+        return True
+
+    def time_remaining(self) -> float | None:
+        return None
+
+    def cancel(self) -> bool:
+        return False
+
+    def add_done_callback(self, callback: Callable[[Any], None]) -> None:
+        callback(self)
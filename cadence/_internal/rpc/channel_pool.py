@@ -0,0 +1,104 @@
+import asyncio
+from itertools import count
+from typing import Any, Callable, Sequence
+
+from grpc.aio import Channel
+
+from cadence._internal.rpc.hedging import Hedger
+
+POLL_FOR_DECISION_TASK = "/uber.cadence.api.v1.WorkerAPI/PollForDecisionTask"
+POLL_FOR_ACTIVITY_TASK = "/uber.cadence.api.v1.WorkerAPI/PollForActivityTask"
+GET_WORKFLOW_HISTORY = "/uber.cadence.api.v1.WorkflowAPI/GetWorkflowExecutionHistory"
+
+LONG_POLL_METHODS = frozenset({POLL_FOR_DECISION_TASK, POLL_FOR_ACTIVITY_TASK})
+
+
+class ChannelPool:
+    """Spreads unary RPCs round-robin across several channels.
+
+    Stands in for a single ``grpc.aio.Channel`` when building the generated
+    stubs. If ``long_poll_channels`` is non-empty, task polls and history
+    long polls (``wait_for_new_event``) only use those channels, so they never
+    occupy HTTP/2 streams needed by responds, heartbeats and other short calls.
+    With a ``hedger``, hedges of idempotent reads go to a different channel
+    than the attempt they hedge.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[Channel],
+        long_poll_channels: Sequence[Channel] = (),
+        hedger: Hedger | None = None,
+    ) -> None:
+        if not channels:
+            raise ValueError("channels must not be empty")
+        self._channels = tuple(channels)
+        self._long_poll_channels = tuple(long_poll_channels)
+        self._hedger = hedger
+
+    @property
+    def channels(self) -> tuple[Channel, ...]:
+        return self._channels + self._long_poll_channels
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Callable[[Any], bytes] | None = None,
+        response_deserializer: Callable[[bytes], Any] | None = None,
+        _registered_method: bool | None = False,
+    ) -> Any:
+        def bind(channels: Sequence[Channel], hedge: bool = False) -> Any:
+            callables = [
+                channel.unary_unary(
+                    method,
+                    request_serializer=request_serializer,
+                    response_deserializer=response_deserializer,
+                    # grpc-stubs does not declare the argument grpcio passes from generated stubs
+                    _registered_method=_registered_method,  # type: ignore[call-arg]
+                )
+                for channel in channels
+            ]
+            if hedge and self._hedger is not None:
+                hedged = self._hedger.multi_callable(method, callables)
+                if hedged is not None:
+                    return hedged
+            return _RoundRobinMultiCallable(callables)
+
+        if not self._long_poll_channels:
+            return bind(self._channels, hedge=True)
+        if method in LONG_POLL_METHODS:
+            return bind(self._long_poll_channels)
+        if method == GET_WORKFLOW_HISTORY:
+            return _HistoryMultiCallable(
+                bind(self._channels, hedge=True), bind(self._long_poll_channels)
+            )
+        return bind(self._channels, hedge=True)
+
+    async def channel_ready(self) -> None:
+        await asyncio.gather(*(channel.channel_ready() for channel in self.channels))
+
+    async def close(self, grace: float | None = None) -> None:
+        await asyncio.gather(*(channel.close(grace) for channel in self.channels))
+
+
+class _RoundRobinMultiCallable:
+    def __init__(self, callables: Sequence[Any]) -> None:
+        self._callables = tuple(callables)
+        self._next = count()
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        callable_ = self._callables[next(self._next) % len(self._callables)]
+        return callable_(request, **kwargs)
+
+
+class _HistoryMultiCallable:
+    """Routes GetWorkflowExecutionHistory by whether the request long polls."""
+
+    def __init__(self, short: Any, long_poll: _RoundRobinMultiCallable) -> None:
+        self._short = short
+        self._long_poll = long_poll
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        if getattr(request, "wait_for_new_event", False):
+            return self._long_poll(request, **kwargs)
+        return self._short(request, **kwargs)
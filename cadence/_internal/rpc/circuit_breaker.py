@@ -0,0 +1,217 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from typing import Any
+
+from grpc import StatusCode
+from grpc.aio import ClientCallDetails, UnaryUnaryClientInterceptor
+
+from cadence._internal.rpc.call import FailedUnaryUnaryCall
+from cadence._internal.rpc.metrics import _extract_method_name, _metric_name
+from cadence.error import CadenceRpcError, CircuitOpenError
+from cadence.metrics import MetricsEmitter, NoOpMetricsEmitter, bind_metric
+from cadence.metrics.constants import CADENCE_CIRCUIT_OPEN, CADENCE_CIRCUIT_REJECTED
+
+# Errors that indicate the frontend is degraded rather than the request being bad
+BREAKER_FAILURE_CODES = frozenset(
+    {
+        StatusCode.UNAVAILABLE,
+        StatusCode.RESOURCE_EXHAUSTED,
+        StatusCode.INTERNAL,
+    }
+)
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    # Fraction of failed calls in the window that opens the circuit
+    failure_rate_threshold: float = 0.5
+    # Number of most recent calls the failure rate is computed over
+    window_size: int = 20
+    # Calls needed in the window before the failure rate is considered
+    minimum_calls: int = 10
+    # How long the circuit stays open before letting probes through
+    open_duration: timedelta = timedelta(seconds=5)
+    # Concurrent probes allowed while half-open
+    half_open_probes: int = 1
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for a single method."""
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy = policy
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=policy.window_size)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def retry_after(self) -> timedelta:
+        """How long a rejected caller should wait before trying again."""
+        if self._state is CircuitState.HALF_OPEN:
+            # The probe may be a long poll, so its outcome can take a while
+            return self._policy.open_duration
+        remaining = self._opened_at + self._policy.open_duration.total_seconds()
+        return timedelta(seconds=max(remaining - self._clock(), 0.0))
+
+    def allow(self) -> bool:
+        if self._state is CircuitState.OPEN:
+            if self.retry_after() > timedelta(0):
+                return False
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probes >= self._policy.half_open_probes:
+                return False
+            self._probes += 1
+        return True
+
+    def record(self, failed: bool) -> bool:
+        """Record a call outcome; return True if this opened the circuit."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes -= 1
+            if failed:
+                self._open()
+                return True
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._failures = 0
+            return False
+        if self._state is CircuitState.OPEN:
+            return False
+
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        self._failures += failed
+        if (
+            len(self._outcomes) >= self._policy.minimum_calls
+            and self._failures / len(self._outcomes)
+            >= self._policy.failure_rate_threshold
+        ):
+            self._open()
+            return True
+        return False
+
+    def discard(self) -> None:
+        """Forget a call allowed by ``allow`` that finished without an outcome."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._failures = 0
+
+
+class _RpcCircuitBreaker:
+    """A method's breaker with its bound metrics, resolved once per method."""
+
+    __slots__ = ("operation", "breaker", "_open", "_rejected")
+
+    def __init__(
+        self, policy: CircuitBreakerPolicy, emitter: MetricsEmitter, operation: str
+    ) -> None:
+        self.operation = operation
+        self.breaker = CircuitBreaker(policy)
+        self._open = bind_metric(emitter, _metric_name(operation, CADENCE_CIRCUIT_OPEN))
+        self._rejected = bind_metric(
+            emitter, _metric_name(operation, CADENCE_CIRCUIT_REJECTED)
+        )
+
+    def reject(self) -> FailedUnaryUnaryCall | None:
+        """Return a failed call if the circuit does not allow this call through."""
+        if self.breaker.allow():
+            return None
+        self._rejected.counter()
+        return FailedUnaryUnaryCall(
+            CircuitOpenError(
+                f"circuit breaker for {self.operation} is open",
+                StatusCode.UNAVAILABLE,
+                self.operation,
+                self.breaker.retry_after(),
+            )
+        )
+
+    def record(self, error: CadenceRpcError | None) -> None:
+        """Record the outcome of a call that ``reject`` let through."""
+        failed = error is not None and error.code in BREAKER_FAILURE_CODES
+        if self.breaker.record(failed):
+            self._open.counter()
+
+    def discard(self) -> None:
+        # Cancellation says nothing about server health
+        self.breaker.discard()
+
+
+class CircuitBreakerInterceptor(UnaryUnaryClientInterceptor):
+    """Fails calls fast with CircuitOpenError while their method's circuit is open.
+
+    Must be placed outside RetryInterceptor so one logical call is one outcome
+    and open circuits are not retried.
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        emitter: MetricsEmitter | None = None,
+    ) -> None:
+        self._policy = policy
+        self._emitter = emitter or NoOpMetricsEmitter()
+        self._breakers: dict[str, _RpcCircuitBreaker] = {}
+
+    def _rpc_breaker(self, operation: str) -> _RpcCircuitBreaker:
+        rpc_breaker = self._breakers.get(operation)
+        if rpc_breaker is None:
+            rpc_breaker = self._breakers[operation] = _RpcCircuitBreaker(
+                self._policy, self._emitter, operation
+            )
+        return rpc_breaker
+
+    def breaker(self, operation: str) -> CircuitBreaker:
+        return self._rpc_breaker(operation).breaker
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        rpc_breaker = self._rpc_breaker(
+            _extract_method_name(client_call_details.method)
+        )
+        rejected = rpc_breaker.reject()
+        if rejected is not None:
+            return rejected
+
+        error: CadenceRpcError | None = None
+        try:
+            rpc_call = await continuation(client_call_details, request)
+            await rpc_call
+        except CadenceRpcError as e:
+            error = e
+        except BaseException:
+            rpc_breaker.discard()
+            raise
+        rpc_breaker.record(error)
+        return rpc_call
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from grpc.aio import (
+    AioRpcError,
+    ClientCallDetails,
+    Metadata,
+    UnaryUnaryClientInterceptor,
+)
+
+from cadence._internal.rpc.circuit_breaker import (
+    CircuitBreakerPolicy,
+    _RpcCircuitBreaker,
+)
+from cadence._internal.rpc.error import CadenceErrorUnaryUnaryCall, map_error
+from cadence._internal.rpc.metrics import _extract_method_name, _RpcMetrics
+from cadence._internal.rpc.retry import (
+    DEFAULT_RETRY_BUDGET,
+    DEFAULT_RETRY_POLICY,
+    ExponentialRetryPolicy,
+    RetryBudget,
+    _RpcRetrier,
+    with_timeout,
+)
+from cadence._internal.rpc.yarpc import (
+    CALLER_KEY,
+    CALLER_TYPE_KEY,
+    CALLER_TYPE_VALUE,
+    ENCODING_KEY,
+    ENCODING_PROTO,
+    SERVICE_KEY,
+)
+from cadence.metrics import MetricsEmitter
+
+_DEFAULT_TIMEOUT = timedelta(seconds=60).total_seconds()
+
+
+@dataclass(slots=True)
+class _MethodState:
+    metrics: _RpcMetrics
+    retrier: _RpcRetrier | None
+    breaker: _RpcCircuitBreaker | None
+
+
+class FusedInterceptor(UnaryUnaryClientInterceptor):
+    """YARPC metadata, circuit breaking, retries, metrics and error mapping in one layer.
+
+    Behaves like chaining YarpcMetadataInterceptor, CircuitBreakerInterceptor,
+    RetryInterceptor, MetricsInterceptor and CadenceErrorInterceptor, and uses
+    the same per-method helpers, but resolves them once per method and returns
+    successful calls to the caller without any wrapper.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        caller: str,
+        emitter: MetricsEmitter,
+        retry_policy: ExponentialRetryPolicy = DEFAULT_RETRY_POLICY,
+        method_policies: Mapping[str, ExponentialRetryPolicy | None] | None = None,
+        budget: RetryBudget | None = DEFAULT_RETRY_BUDGET,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+    ) -> None:
+        self._metadata = Metadata(
+            (SERVICE_KEY, service),
+            (CALLER_KEY, caller),
+            (ENCODING_KEY, ENCODING_PROTO),
+            (CALLER_TYPE_KEY, CALLER_TYPE_VALUE),
+        )
+        self._emitter = emitter
+        self._retry_policy = retry_policy
+        self._method_policies = dict(method_policies or {})
+        self._budget = budget
+        self._circuit_breaker = circuit_breaker
+        self._methods: dict[bytes | str, _MethodState] = {}
+
+    def _method_state(self, method: bytes | str) -> _MethodState:
+        state = self._methods.get(method)
+        if state is None:
+            operation = _extract_method_name(method)
+            emitter = self._emitter
+            retry_policy = self._method_policies.get(operation, self._retry_policy)
+            state = _MethodState(
+                metrics=_RpcMetrics(emitter, operation),
+                retrier=_RpcRetrier(retry_policy, self._budget, emitter, operation)
+                if retry_policy is not None
+                else None,
+                breaker=_RpcCircuitBreaker(self._circuit_breaker, emitter, operation)
+                if self._circuit_breaker is not None
+                else None,
+            )
+            self._methods[method] = state
+        return state
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        state = self._method_state(client_call_details.method)
+        breaker = state.breaker
+        if breaker is not None:
+            rejected = breaker.reject()
+            if rejected is not None:
+                return rejected
+
+        metadata = client_call_details.metadata
+        metadata = self._metadata if metadata is None else metadata + self._metadata
+        timeout = client_call_details.timeout or _DEFAULT_TIMEOUT
+        expiration = timedelta(seconds=timeout)
+        call_details = with_timeout(client_call_details, expiration, metadata)
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        attempts = 0
+        try:
+            while True:
+                attempt_start_ns = time.monotonic_ns()
+                rpc_call = await continuation(call_details, request)
+                state.metrics.request.counter()
+                try:
+                    await rpc_call
+                except AioRpcError as e:
+                    err = map_error(e)
+                    state.metrics.record_completion(attempt_start_ns, err)
+                except asyncio.CancelledError as e:
+                    state.metrics.record_completion(attempt_start_ns, e)
+                    raise
+                else:
+                    state.metrics.record_completion(attempt_start_ns)
+                    if state.retrier is not None:
+                        state.retrier.record_success()
+                    if breaker is not None:
+                        breaker.record(None)
+                    return rpc_call
+
+                if state.retrier is None:
+                    break
+                attempts += 1
+                elapsed = timedelta(seconds=loop.time() - start_time)
+                backoff = state.retrier.next_delay(
+                    err, call_details, attempts, elapsed, expiration
+                )
+                if backoff is None:
+                    break
+                await asyncio.sleep(backoff.total_seconds())
+                elapsed = timedelta(seconds=loop.time() - start_time)
+                call_details = with_timeout(
+                    call_details, expiration - elapsed, metadata
+                )
+        except BaseException:
+            # Without an outcome the half-open probe slot must still be returned
+            if breaker is not None:
+                breaker.discard()
+            raise
+
+        if breaker is not None:
+            breaker.record(err)
+        # Awaiting the finished call again re-raises its error, mapped this time
+        return CadenceErrorUnaryUnaryCall(rpc_call)
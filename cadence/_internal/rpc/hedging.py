@@ -0,0 +1,226 @@
+import asyncio
+import math
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import count
+from typing import Any
+
+from cadence._internal.rpc.metrics import _extract_method_name, _metric_name
+from cadence._internal.rpc.retry import RETRYABLE_CODES
+from cadence.error import CadenceRpcError
+from cadence.metrics import (
+    BoundMetric,
+    MetricsEmitter,
+    NoOpMetricsEmitter,
+    bind_metric,
+)
+from cadence.metrics.constants import CADENCE_HEDGE, CADENCE_HEDGE_WON
+
+# Read-only RPCs that are safe to send more than once
+HEDGEABLE_METHODS = frozenset(
+    {
+        "QueryWorkflow",
+        "DescribeWorkflowExecution",
+        "GetWorkflowExecutionHistory",
+    }
+)
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    # Total attempts per call, including the original
+    max_attempts: int = 2
+    # Latency percentile of recent successful calls after which a hedge is sent
+    percentile: float = 0.95
+    # Hedge delay used until min_samples latencies have been observed
+    initial_delay: timedelta = timedelta(milliseconds=100)
+    min_delay: timedelta = timedelta(milliseconds=10)
+    max_delay: timedelta = timedelta(seconds=1)
+    # Number of recent latencies the percentile is computed over
+    window_size: int = 200
+    min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 2:
+            raise ValueError("max_attempts must be at least 2")
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if self.min_delay > self.max_delay:
+            raise ValueError("min_delay must not exceed max_delay")
+
+
+def validate_hedging_policies(policies: Mapping[str, HedgingPolicy]) -> None:
+    unsupported = set(policies) - HEDGEABLE_METHODS
+    if unsupported:
+        raise ValueError(
+            f"hedging is only supported for {sorted(HEDGEABLE_METHODS)}, "
+            f"got {sorted(unsupported)}"
+        )
+
+
+class HedgeDelay:
+    """Tracks recent latencies of one method to derive its hedge delay."""
+
+    def __init__(self, policy: HedgingPolicy) -> None:
+        self._policy = policy
+        self._latencies: deque[timedelta] = deque(maxlen=policy.window_size)
+
+    def record(self, latency: timedelta) -> None:
+        self._latencies.append(latency)
+
+    def delay(self) -> timedelta:
+        policy = self._policy
+        if len(self._latencies) < policy.min_samples:
+            delay = policy.initial_delay
+        else:
+            latencies = sorted(self._latencies)
+            index = math.ceil(policy.percentile * len(latencies)) - 1
+            delay = latencies[index]
+        return min(max(delay, policy.min_delay), policy.max_delay)
+
+
+@dataclass(slots=True)
+class _HedgedMethod:
+    policy: HedgingPolicy
+    delay: HedgeDelay
+    hedge: BoundMetric
+    hedge_won: BoundMetric
+
+
+class Hedger:
+    """Resolves the hedging policy and latency history of each method.
+
+    Shared by the channels of a ChannelPool, which hands every hedged method
+    a HedgedMultiCallable over its channels.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, HedgingPolicy],
+        emitter: MetricsEmitter = NoOpMetricsEmitter(),
+    ) -> None:
+        validate_hedging_policies(policies)
+        self._policies = dict(policies)
+        self._emitter = emitter
+
+    def multi_callable(
+        self, method: str, callables: Sequence[Any]
+    ) -> "HedgedMultiCallable | None":
+        operation = _extract_method_name(method)
+        policy = self._policies.get(operation)
+        if policy is None:
+            return None
+        return HedgedMultiCallable(
+            callables,
+            _HedgedMethod(
+                policy=policy,
+                delay=HedgeDelay(policy),
+                hedge=bind_metric(
+                    self._emitter, _metric_name(operation, CADENCE_HEDGE)
+                ),
+                hedge_won=bind_metric(
+                    self._emitter, _metric_name(operation, CADENCE_HEDGE_WON)
+                ),
+            ),
+        )
+
+
+class HedgedMultiCallable:
+    """Sends extra attempts of slow idempotent reads and keeps the first success.
+
+    A hedge is sent once the latest attempt has been outstanding longer than
+    the configured percentile of recent latencies, each on the next channel
+    of the pool so it does not queue behind the attempt it is hedging. An
+    attempt failing with a non-retryable code fails the call; after a
+    retryable failure the remaining attempts still run. Remaining attempts
+    are cancelled once one succeeds. History long polls are never hedged.
+    """
+
+    def __init__(self, callables: Sequence[Any], method: _HedgedMethod) -> None:
+        self._callables = tuple(callables)
+        self._method = method
+        self._next = count()
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        first = next(self._next)
+        if getattr(request, "wait_for_new_event", False):
+            return self._callables[first % len(self._callables)](request, **kwargs)
+        return self._hedge(first, request, kwargs)
+
+    async def _hedge(self, first: int, request: Any, kwargs: dict[str, Any]) -> Any:
+        hedged = self._method
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        timeout = kwargs.get("timeout")
+
+        async def attempt(index: int) -> tuple[Any, timedelta]:
+            attempt_kwargs = kwargs
+            if timeout is not None:
+                elapsed = loop.time() - start_time
+                attempt_kwargs = {**kwargs, "timeout": max(timeout - elapsed, 0.0)}
+            callable_ = self._callables[(first + index) % len(self._callables)]
+            attempt_start = loop.time()
+            rpc_call = callable_(request, **attempt_kwargs)
+            try:
+                response = await rpc_call
+            except asyncio.CancelledError:
+                rpc_call.cancel()
+                raise
+            return response, timedelta(seconds=loop.time() - attempt_start)
+
+        max_attempts = hedged.policy.max_attempts
+        pending = {asyncio.create_task(attempt(0)): 0}
+        launched = 1
+        hedge_at = loop.time() + hedged.delay.delay().total_seconds()
+        last_error: CadenceRpcError | None = None
+        try:
+            while True:
+                wait = (
+                    max(hedge_at - loop.time(), 0.0)
+                    if launched < max_attempts
+                    else None
+                )
+                if pending:
+                    done, _ = await asyncio.wait(
+                        pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                    )
+                elif wait is not None:
+                    # Every attempt so far failed retryably; the next waits its turn
+                    await asyncio.sleep(wait)
+                    done = set()
+                else:
+                    assert last_error is not None
+                    raise last_error
+
+                for task in done:
+                    index = pending.pop(task)
+                    try:
+                        response, latency = task.result()
+                    except CadenceRpcError as e:
+                        if e.code not in RETRYABLE_CODES:
+                            raise
+                        last_error = e
+                        continue
+                    hedged.delay.record(latency)
+                    if index > 0:
+                        hedged.hedge_won.counter()
+                    return response
+
+                if launched < max_attempts and loop.time() >= hedge_at:
+                    hedged.hedge.counter()
+                    pending[asyncio.create_task(attempt(launched))] = launched
+                    launched += 1
+                    hedge_at = loop.time() + hedged.delay.delay().total_seconds()
+        finally:
+            for task in pending:
+                task.cancel()
+                # Losers that finished alongside the winner, or fail before the
+                # cancellation lands, must not be logged as never retrieved
+                task.add_done_callback(_retrieve_exception)
+
+
+def _retrieve_exception(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
@@ -22,7 +22,11 @@ from cadence.metrics.constants import (
     CADENCE_METRICS_PREFIX,
     CADENCE_REQUEST,
 )
-from cadence.metrics.metrics import MetricsEmitter, duration_from_nanoseconds
+from cadence.metrics.metrics import (
+    MetricsEmitter,
+    bind_metric,
+    duration_from_nanoseconds,
+)
 
 RequestType = TypeVar("RequestType")
 ResponseType = TypeVar("ResponseType")
@@ -46,19 +50,30 @@ def _is_invalid_request(error: BaseException) -> bool:
     )
 
 
-def _record_rpc_completion(
-    emitter: MetricsEmitter,
-    operation: str,
-    start_ns: int,
-    error: BaseException | None = None,
-) -> None:
-    elapsed = duration_from_nanoseconds(time.monotonic_ns() - start_ns)
-    emitter.histogram(_metric_name(operation, CADENCE_LATENCY), elapsed)
-    if error is not None:
-        outcome = (
-            CADENCE_INVALID_REQUEST if _is_invalid_request(error) else CADENCE_ERROR
+class _RpcMetrics:
+    """Bound per-RPC metrics for one operation, resolved once per method."""
+
+    __slots__ = ("request", "latency", "error", "invalid_request")
+
+    def __init__(self, emitter: MetricsEmitter, operation: str) -> None:
+        self.request = bind_metric(emitter, _metric_name(operation, CADENCE_REQUEST))
+        self.latency = bind_metric(emitter, _metric_name(operation, CADENCE_LATENCY))
+        self.error = bind_metric(emitter, _metric_name(operation, CADENCE_ERROR))
+        self.invalid_request = bind_metric(
+            emitter, _metric_name(operation, CADENCE_INVALID_REQUEST)
+        )
+
+    def record_completion(
+        self, start_ns: int, error: BaseException | None = None
+    ) -> None:
+        self.latency.histogram(
+            duration_from_nanoseconds(time.monotonic_ns() - start_ns)
         )
-        emitter.counter(_metric_name(operation, outcome))
+        if error is not None:
+            if _is_invalid_request(error):
+                self.invalid_request.counter()
+            else:
+                self.error.counter()
 
 
 def _extract_method_name(method: bytes | str) -> str:
@@ -71,24 +86,20 @@ class _MetricsUnaryUnaryCall(UnaryUnaryCallWrapper[RequestType, ResponseType]):
     def __init__(
         self,
         wrapped: UnaryUnaryCall[RequestType, ResponseType],
-        operation: str,
+        metrics: _RpcMetrics,
         start_ns: int,
-        emitter: MetricsEmitter,
     ):
         super().__init__(wrapped)
-        self._operation = operation
+        self._metrics = metrics
         self._start_ns = start_ns
-        self._emitter = emitter
         self._recorded = False
-        self._emitter.counter(_metric_name(operation, CADENCE_REQUEST))
+        metrics.request.counter()
 
     def _record_completion(self, error: BaseException | None = None) -> None:
         if self._recorded:
             return
         self._recorded = True
-        _record_rpc_completion(
-            self._emitter, self._operation, self._start_ns, error=error
-        )
+        self._metrics.record_completion(self._start_ns, error)
 
     def __await__(self) -> Generator[Any, None, ResponseType]:
         try:
@@ -104,6 +115,14 @@ class _MetricsUnaryUnaryCall(UnaryUnaryCallWrapper[RequestType, ResponseType]):
 class MetricsInterceptor(UnaryUnaryClientInterceptor):
     def __init__(self, emitter: MetricsEmitter):
         self._emitter = emitter
+        self._methods: dict[bytes | str, _RpcMetrics] = {}
+
+    def _rpc_metrics(self, method: bytes | str) -> _RpcMetrics:
+        metrics = self._methods.get(method)
+        if metrics is None:
+            metrics = _RpcMetrics(self._emitter, _extract_method_name(method))
+            self._methods[method] = metrics
+        return metrics
 
     async def intercept_unary_unary(
         self,
@@ -112,6 +131,6 @@ class MetricsInterceptor(UnaryUnaryClientInterceptor):
         request: Any,
     ) -> Any:
         start_ns = time.monotonic_ns()
-        operation = _extract_method_name(client_call_details.method)
+        metrics = self._rpc_metrics(client_call_details.method)
         rpc_call = await continuation(client_call_details, request)
-        return _MetricsUnaryUnaryCall(rpc_call, operation, start_ns, self._emitter)
+        return _MetricsUnaryUnaryCall(rpc_call, metrics, start_ns)
@@ -1,4 +1,8 @@
 import asyncio
+import math
+import random
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Callable, Any, cast
@@ -6,7 +10,10 @@ from typing import Callable, Any, cast
 from grpc import StatusCode
 from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails
 
+from cadence._internal.rpc.metrics import _extract_method_name, _metric_name
 from cadence.error import CadenceRpcError, EntityNotExistsError
+from cadence.metrics import MetricsEmitter, NoOpMetricsEmitter, bind_metric
+from cadence.metrics.constants import CADENCE_RETRY, CADENCE_RETRY_BUDGET_EXHAUSTED
 
 RETRYABLE_CODES = {
     StatusCode.INTERNAL,
@@ -23,6 +30,8 @@ class ExponentialRetryPolicy:
     backoff_coefficient: float
     max_interval: timedelta
     max_attempts: int
+    # Full jitter: sleep a uniformly random fraction of the exponential backoff
+    jitter: bool = False
 
     def next_delay(
         self,
@@ -35,29 +44,169 @@ class ExponentialRetryPolicy:
         if self.max_attempts != 0 and attempts >= self.max_attempts:
             return None
 
+        exponent = attempts - 1
+        if self.backoff_coefficient > 1:
+            # Past this the backoff is capped anyway, and timedelta would overflow
+            exponent = min(exponent, self._max_exponent())
         backoff = min(
-            self.initial_interval * pow(self.backoff_coefficient, attempts - 1),
+            self.initial_interval * pow(self.backoff_coefficient, exponent),
             self.max_interval,
         )
+        if self.jitter:
+            backoff *= random.random()
         if expiration is not None and (elapsed + backoff) >= expiration:
             return None
 
         return backoff
 
+    def _max_exponent(self) -> int:
+        """Smallest exponent whose backoff reaches max_interval."""
+        if self.initial_interval <= timedelta(0) or (
+            self.max_interval <= self.initial_interval
+        ):
+            return 0
+        ratio = self.max_interval / self.initial_interval
+        return math.ceil(math.log(ratio, self.backoff_coefficient))
+
 
 DEFAULT_RETRY_POLICY = ExponentialRetryPolicy(
     initial_interval=timedelta(milliseconds=20),
     backoff_coefficient=1.2,
     max_interval=timedelta(seconds=6),
     max_attempts=0,
+    jitter=True,
 )
 GET_WORKFLOW_HISTORY = b"/uber.cadence.api.v1.WorkflowAPI/GetWorkflowExecutionHistory"
 
 
+class RetryBudget:
+    """Token bucket that limits retries relative to successful calls.
+
+    Follows gRPC retry throttling: every retryable failure removes a token,
+    every success adds ``token_ratio`` tokens, and retries are only allowed
+    while more than half of ``max_tokens`` remain. Shared between interceptors
+    and channels, so it is thread safe.
+    """
+
+    def __init__(self, max_tokens: float = 100, token_ratio: float = 0.1) -> None:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be greater than 0")
+        self._max_tokens = max_tokens
+        self._token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+    def acquire_retry(self) -> bool:
+        """Record a retryable failure and return whether a retry is allowed."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self._max_tokens / 2
+
+
+# Process wide, so overload seen by one client also throttles the others
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class _RpcRetrier:
+    """A method's retry policy, budget and bound metrics, resolved once per method."""
+
+    __slots__ = ("_policy", "_budget", "_retry", "_budget_exhausted")
+
+    def __init__(
+        self,
+        policy: ExponentialRetryPolicy,
+        budget: RetryBudget | None,
+        emitter: MetricsEmitter,
+        operation: str,
+    ) -> None:
+        self._policy = policy
+        self._budget = budget
+        self._retry = bind_metric(emitter, _metric_name(operation, CADENCE_RETRY))
+        self._budget_exhausted = bind_metric(
+            emitter, _metric_name(operation, CADENCE_RETRY_BUDGET_EXHAUSTED)
+        )
+
+    def record_success(self) -> None:
+        if self._budget is not None:
+            self._budget.record_success()
+
+    def next_delay(
+        self,
+        err: CadenceRpcError,
+        call_details: ClientCallDetails,
+        attempts: int,
+        elapsed: timedelta,
+        expiration: timedelta | None,
+    ) -> timedelta | None:
+        """Return how long to wait before retrying, or None to give up with ``err``."""
+        backoff = self._policy.next_delay(attempts, elapsed, expiration)
+        if not is_retryable(err, call_details) or backoff is None:
+            return None
+        if self._budget is not None and not self._budget.acquire_retry():
+            self._budget_exhausted.counter()
+            return None
+        self._retry.counter()
+        return backoff
+
+
+def with_timeout(
+    call_details: ClientCallDetails, timeout: timedelta | None, metadata: Any
+) -> ClientCallDetails:
+    """Copy ``call_details`` for another attempt with what is left of the timeout."""
+    return ClientCallDetails(
+        method=call_details.method,
+        timeout=max(timeout, timedelta(0)).total_seconds()
+        if timeout is not None
+        else None,
+        metadata=metadata,
+        credentials=call_details.credentials,
+        wait_for_ready=call_details.wait_for_ready,
+    )
+
+
 class RetryInterceptor(UnaryUnaryClientInterceptor):
-    def __init__(self, retry_policy: ExponentialRetryPolicy = DEFAULT_RETRY_POLICY):
+    def __init__(
+        self,
+        retry_policy: ExponentialRetryPolicy = DEFAULT_RETRY_POLICY,
+        method_policies: Mapping[str, ExponentialRetryPolicy | None] | None = None,
+        budget: RetryBudget | None = DEFAULT_RETRY_BUDGET,
+        emitter: MetricsEmitter | None = None,
+    ):
+        """
+        Args:
+            retry_policy: Policy for methods without an entry in ``method_policies``
+            method_policies: Per-method overrides keyed by method name, e.g.
+                ``"PollForDecisionTask"``; ``None`` disables retries for that method
+            budget: Retry budget shared with other interceptors, or None for unlimited
+            emitter: Receives retry and budget exhaustion counters
+        """
         super().__init__()
         self._retry_policy = retry_policy
+        self._method_policies = dict(method_policies or {})
+        self._budget = budget
+        self._emitter = emitter or NoOpMetricsEmitter()
+        self._retriers: dict[bytes | str, _RpcRetrier | None] = {}
+
+    def _retrier(self, method: bytes | str) -> _RpcRetrier | None:
+        if method in self._retriers:
+            return self._retriers[method]
+        operation = _extract_method_name(method)
+        policy = self._method_policies.get(operation, self._retry_policy)
+        retrier = (
+            _RpcRetrier(policy, self._budget, self._emitter, operation)
+            if policy is not None
+            else None
+        )
+        self._retriers[method] = retrier
+        return retrier
 
     async def intercept_unary_unary(
         self,
@@ -65,6 +214,10 @@ class RetryInterceptor(UnaryUnaryClientInterceptor):
         client_call_details: ClientCallDetails,
         request: Any,
     ) -> Any:
+        retrier = self._retrier(client_call_details.method)
+        if retrier is None:
+            return await continuation(client_call_details, request)
+
         loop = asyncio.get_running_loop()
         expiration_interval = (
             timedelta(seconds=client_call_details.timeout)
@@ -76,23 +229,17 @@ class RetryInterceptor(UnaryUnaryClientInterceptor):
         attempts = 0
         while True:
             elapsed = timedelta(seconds=loop.time() - start_time)
-            remaining = (
+            call_details = with_timeout(
+                client_call_details,
                 expiration_interval - elapsed
                 if expiration_interval is not None
-                else None
-            )
-            call_details = ClientCallDetails(
-                method=client_call_details.method,
-                timeout=max(remaining, timedelta(0)).total_seconds()
-                if remaining is not None
                 else None,
-                metadata=client_call_details.metadata,
-                credentials=client_call_details.credentials,
-                wait_for_ready=client_call_details.wait_for_ready,
+                client_call_details.metadata,
             )
             rpc_call = await continuation(call_details, request)
             try:
                 await rpc_call
+                retrier.record_success()
                 # Return the call object (not the raw response) so outer interceptors
                 # that rely on UnaryUnaryCall methods like add_done_callback still work
                 # (e.g. opentelemetry-instrumentation-grpc).
@@ -102,12 +249,11 @@ class RetryInterceptor(UnaryUnaryClientInterceptor):
 
             attempts += 1
             elapsed = timedelta(seconds=loop.time() - start_time)
-            backoff = self._retry_policy.next_delay(
-                attempts, elapsed, expiration_interval
+            backoff = retrier.next_delay(
+                err, client_call_details, attempts, elapsed, expiration_interval
             )
-            if not is_retryable(err, client_call_details) or backoff is None:
+            if backoff is None:
                 break
-
             await asyncio.sleep(backoff.total_seconds())
 
         # On policy expiration, return the most recent UnaryUnaryCall. It has the error we want
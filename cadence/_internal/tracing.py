@@ -0,0 +1,129 @@
+"""Spans for the worker's decision and activity task lifecycle.
+
+Tracing is opt-in. ``opentelemetry-api`` is only imported when it is enabled,
+so it stays an optional dependency.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from opentelemetry.context import Context
+    from opentelemetry.trace import TracerProvider
+
+TRACER_NAME = "cadence"
+
+ACTIVITY_TASK_SPAN = "cadence.activity_task"
+ACTIVITY_EXECUTE_SPAN = "cadence.activity_task.execute"
+ACTIVITY_RESPOND_SPAN = "cadence.activity_task.respond"
+DECISION_TASK_SPAN = "cadence.decision_task"
+DECISION_FETCH_HISTORY_SPAN = "cadence.decision_task.fetch_history"
+DECISION_REPLAY_SPAN = "cadence.decision_task.replay"
+DECISION_RESPOND_SPAN = "cadence.decision_task.respond"
+
+
+def inject_trace_headers() -> dict[str, bytes]:
+    """Encode the current OpenTelemetry context as Cadence headers."""
+    from opentelemetry import propagate
+
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return {key: value.encode("utf-8") for key, value in carrier.items()}
+
+
+def extract_trace_context(headers: Mapping[str, bytes]) -> Context | None:
+    """Decode an OpenTelemetry context from Cadence headers, if they carry one."""
+    from opentelemetry import propagate
+
+    fields = propagate.get_global_textmap().fields
+    carrier = {
+        key: value.decode("utf-8", errors="replace")
+        for key, value in headers.items()
+        if key in fields
+    }
+    if not carrier:
+        return None
+    return propagate.extract(carrier)
+
+
+class TaskTracer:
+    """Starts task spans; the base class records nothing."""
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def span(
+        self,
+        name: str,
+        headers: Mapping[str, bytes] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        link_headers: Mapping[str, bytes] | None = None,
+    ) -> AbstractContextManager[object]:
+        """Start a span as the current span.
+
+        With ``headers`` the span continues the trace they carry instead of the
+        current span. With ``link_headers`` it starts a new trace that links to
+        the span they carry.
+        """
+        return nullcontext()
+
+    def with_span_headers(self, headers: Mapping[str, bytes]) -> Mapping[str, bytes]:
+        """Return ``headers`` pointing at the current span.
+
+        Workflow and activity code run in their own context, so this is how
+        spans created by user code become children of the task span.
+        """
+        return headers
+
+
+class OpenTelemetryTaskTracer(TaskTracer):
+    def __init__(self, tracer_provider: TracerProvider | None = None) -> None:
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer(TRACER_NAME, tracer_provider=tracer_provider)
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def span(
+        self,
+        name: str,
+        headers: Mapping[str, bytes] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        link_headers: Mapping[str, bytes] | None = None,
+    ) -> AbstractContextManager[object]:
+        from opentelemetry import trace
+        from opentelemetry.context import Context
+
+        parent = extract_trace_context(headers) if headers else None
+        links = None
+        if link_headers is not None:
+            # An empty context makes the span a root rather than a child
+            parent = parent or Context()
+            linked = extract_trace_context(link_headers)
+            if linked is not None:
+                span_context = trace.get_current_span(linked).get_span_context()
+                if span_context.is_valid:
+                    links = [trace.Link(span_context)]
+        return self._tracer.start_as_current_span(
+            name, context=parent, attributes=attributes, links=links
+        )
+
+    def with_span_headers(self, headers: Mapping[str, bytes]) -> Mapping[str, bytes]:
+        return {**headers, **inject_trace_headers()}
+
+
+NOOP_TASK_TRACER = TaskTracer()
+
+
+def create_task_tracer(
+    enabled: bool, tracer_provider: TracerProvider | None = None
+) -> TaskTracer:
+    if not enabled:
+        return NOOP_TASK_TRACER
+    return OpenTelemetryTaskTracer(tracer_provider)
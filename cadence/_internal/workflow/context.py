@@ -6,12 +6,14 @@ from datetime import datetime, timedelta
 from math import ceil
 from typing import Iterator, Optional, Any, Unpack, Type, cast, Callable
 
+from cadence._internal.workflow.decoded_value_cache import DecodedValueCache
 from cadence._internal.workflow.deterministic_event_loop import DeterministicEventLoop
 from cadence._internal.workflow.memo import memo_to_proto
 from cadence._internal.workflow.retry_policy import retry_policy_to_proto
 from cadence._internal.workflow.statemachine.decision_manager import DecisionManager
 from cadence._internal.workflow.statemachine.marker_state_machine import (
     SIDE_EFFECT_MARKER_NAME,
+    marker_context_id,
 )
 from cadence._internal.context import inject_headers, set_header
 from cadence.api.v1 import workflow_pb2
@@ -54,6 +56,7 @@ class Context(WorkflowContext):
         info: WorkflowInfo,
         decision_manager: DecisionManager,
         context_propagators: tuple[ContextPropagator, ...] = (),
+        decoded_values: DecodedValueCache | None = None,
     ):
         self._info = info
         self._replay_mode = True
@@ -61,6 +64,7 @@ class Context(WorkflowContext):
         self._decision_manager = decision_manager
         self._context_propagators = context_propagators
         self._cancellation_info: WorkflowCancellationInfo | None = None
+        self._decoded_values = decoded_values or DecodedValueCache(info.data_converter)
 
     def info(self) -> WorkflowInfo:
         return self._info
@@ -125,7 +129,9 @@ class Context(WorkflowContext):
         future = self._decision_manager.schedule_activity(schedule_attributes)
         result_payload = await future
 
-        result = self.data_converter().from_data(result_payload, [result_type])[0]
+        result = self._decoded_values.decode(
+            ("activity", schedule_attributes.activity_id), result_payload, result_type
+        )
 
         return cast(ResultType, result)
 
@@ -279,15 +285,16 @@ class Context(WorkflowContext):
         details = Payload()
         if not self.is_replay_mode():
             details = self.data_converter().to_data([fn()])
-        result_payload = self._decision_manager.record_marker(
-            RecordMarkerDecisionAttributes(
-                marker_name=SIDE_EFFECT_MARKER_NAME,
-                details=details,
-            )
+        attrs = RecordMarkerDecisionAttributes(
+            marker_name=SIDE_EFFECT_MARKER_NAME,
+            details=details,
         )
+        result_payload = self._decision_manager.record_marker(attrs)
         return cast(
             ResultType,
-            self.data_converter().from_data(result_payload, [result_type])[0],
+            self._decoded_values.decode(
+                ("marker", marker_context_id(attrs)), result_payload, result_type
+            ),
         )
 
     def mutable_side_effect(
@@ -301,6 +308,7 @@ class Context(WorkflowContext):
         if not id:
             raise ValueError("id must not be empty")
 
+        key = ("mutable_side_effect", id)
         access_count, stored_payload, has_history_update = (
             self._decision_manager.mutable_side_effect_value(id)
         )
@@ -316,14 +324,14 @@ class Context(WorkflowContext):
                 )
             return cast(
                 ResultType,
-                self.data_converter().from_data(stored_payload, [result_type])[0],
+                self._decoded_values.decode(key, stored_payload, result_type),
             )
 
         value = fn()
         if stored_payload is not None:
             stored_value = cast(
                 ResultType,
-                self.data_converter().from_data(stored_payload, [result_type])[0],
+                self._decoded_values.decode(key, stored_payload, result_type),
             )
             if not updated(stored_value, value):
                 return stored_value
@@ -335,7 +343,7 @@ class Context(WorkflowContext):
         )
         return cast(
             ResultType,
-            self.data_converter().from_data(result_payload, [result_type])[0],
+            self._decoded_values.decode(key, result_payload, result_type),
         )
 
     def set_replay_current_time(self, current_time: datetime) -> None:
@@ -0,0 +1,97 @@
+"""Per-engine memo of payloads decoded by the workflow context during replay."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import enum
+import time
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Hashable, NamedTuple, Type
+
+from cadence.api.v1.common_pb2 import Payload
+from cadence.data_converter import DataConverter
+
+_IMMUTABLE_SCALARS: tuple[type, ...] = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    enum.Enum,
+    dt.date,
+    dt.time,
+    dt.timedelta,
+    dt.timezone,
+    uuid.UUID,
+)
+
+
+@dataclass
+class DecodeStats:
+    """Payload decoding counters for a single decision task."""
+
+    decoded: int = 0
+    cache_hits: int = 0
+    decode_ns: int = 0
+
+
+class _Entry(NamedTuple):
+    payload: Payload
+    result_type: Any
+    value: Any
+
+
+class DecodedValueCache:
+    """Decode workflow payloads, optionally memoizing immutable results.
+
+    Values are keyed by the decision they belong to (activity ID, marker context ID or
+    mutable side effect ID) and are only reused for the exact ``Payload`` object and
+    result type they were decoded from, so an updated mutable side effect decodes
+    again. Mutable results (lists, dicts, plain dataclasses) are never memoized since
+    workflow code may modify the returned object.
+    """
+
+    def __init__(self, data_converter: DataConverter, enabled: bool = False) -> None:
+        self._data_converter = data_converter
+        self._enabled = enabled
+        self._entries: dict[Hashable, _Entry] = {}
+        self.stats = DecodeStats()
+
+    def decode(self, key: Hashable, payload: Payload, result_type: Type | None) -> Any:
+        if self._enabled:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.payload is payload
+                and entry.result_type == result_type
+            ):
+                self.stats.cache_hits += 1
+                return entry.value
+
+        start_ns = time.perf_counter_ns()
+        value = self._data_converter.from_data(payload, [result_type])[0]
+        self.stats.decode_ns += time.perf_counter_ns() - start_ns
+        self.stats.decoded += 1
+
+        if self._enabled and _is_immutable(value):
+            self._entries[key] = _Entry(payload, result_type, value)
+        return value
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        params = getattr(type(value), "__dataclass_params__", None)
+        return bool(params and params.frozen) and all(
+            _is_immutable(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+    return False
@@ -1,4 +1,5 @@
 import logging
+import time
 import traceback
 from asyncio import CancelledError, InvalidStateError
 from dataclasses import dataclass
@@ -6,7 +7,9 @@ from functools import singledispatchmethod
 from typing import List, Mapping, Optional, Sequence
 
 from cadence._internal.context import extract_headers, set_header_from_dict
+from cadence._internal.profiler import task_label
 from cadence._internal.workflow.context import Context
+from cadence._internal.workflow.decoded_value_cache import DecodedValueCache
 from cadence._internal.workflow.decision_events_iterator import DecisionEventsIterator
 from cadence._internal.workflow.deterministic_event_loop import (
     DeterministicEventLoop,
@@ -41,6 +44,26 @@ from cadence.workflow import WorkflowDefinition, WorkflowInfo
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DecisionStats:
+    """Time spent in each phase of process_decision for a single decision task."""
+
+    # time.monotonic_ns() when process_decision started, to derive executor queueing
+    started_ns: int = 0
+    # Catch-up of decision batches that were already completed in history
+    replay_ns: int = 0
+    # Decision batches that are new to this worker
+    new_events_ns: int = 0
+    # Workflow code run via run_until_yield, included in the two above
+    workflow_code_ns: int = 0
+    # Building the pending decisions sent back to the service
+    serialization_ns: int = 0
+    # CPU time of the executor thread for the whole of process_decision
+    cpu_ns: int = 0
+    # History events of decision batches that were already completed
+    replayed_events: int = 0
+
+
 @dataclass
 class DecisionResult:
     decisions: list[Decision]
@@ -54,6 +77,8 @@ class WorkflowEngine:
         workflow_definition: WorkflowDefinition,
         context_propagators: Sequence[ContextPropagator] = (),
         headers: Mapping[str, bytes] | None = None,
+        decoded_values: DecodedValueCache | None = None,
+        stats: DecisionStats | None = None,
     ):
         self._event_loop = DeterministicEventLoop()
         self._decision_manager = DecisionManager(self._event_loop)
@@ -65,7 +90,13 @@ class WorkflowEngine:
         )
         self._context_propagators = tuple(context_propagators)
         self._headers = dict(headers) if headers is not None else {}
-        self._context = Context(info, self._decision_manager, self._context_propagators)
+        self._context = Context(
+            info,
+            self._decision_manager,
+            self._context_propagators,
+            decoded_values,
+        )
+        self._stats = stats if stats is not None else DecisionStats()
 
     def process_decision(
         self,
@@ -84,9 +115,14 @@ class WorkflowEngine:
         Returns:
             DecisionResult containing the list of decisions
         """
+        self._stats.started_ns = time.monotonic_ns()
+        cpu_start_ns = time.thread_time_ns()
         try:
             # Activate workflow context for the entire decision processing
-            with self._context._activate() as ctx:
+            with (
+                task_label("workflow", self._context.info().workflow_type),
+                self._context._activate() as ctx,
+            ):
                 with extract_headers(self._context_propagators, self._headers):
                     # Log decision task processing start with full context (matches Java ReplayDecisionTaskHandler)
                     logger.info(
@@ -109,7 +145,11 @@ class WorkflowEngine:
                         return self._execute_query(query)
 
                     # Collect all pending decisions from state machines
+                    serialize_start_ns = time.monotonic_ns()
                     decisions = self._decision_manager.collect_pending_decisions()
+                    self._stats.serialization_ns += (
+                        time.monotonic_ns() - serialize_start_ns
+                    )
 
                     return DecisionResult(decisions=decisions, query_result=None)
 
@@ -128,6 +168,8 @@ class WorkflowEngine:
             )
             # Re-raise the exception so the handler can properly handle the failure
             raise
+        finally:
+            self._stats.cpu_ns += time.thread_time_ns() - cpu_start_ns
 
     def _execute_query(self, query: WorkflowQuery) -> DecisionResult:
         query_def = self._workflow_definition.queries.get(query.query_type)
@@ -169,8 +211,10 @@ class WorkflowEngine:
             decision_task: The original decision task
         """
 
+        stats = self._stats
         # Check if there are any decision events to process
         for decision_events in events_iterator:
+            batch_start_ns = time.monotonic_ns()
             # Log decision events batch processing (matches Go client patterns)
             logger.debug(
                 "Processing decision events batch",
@@ -209,7 +253,11 @@ class WorkflowEngine:
                     self._apply_input_event(event)
 
                 # Phase 3: Execute workflow logic
-                self._workflow_instance.run_until_yield()
+                code_start_ns = time.monotonic_ns()
+                try:
+                    self._workflow_instance.run_until_yield()
+                finally:
+                    stats.workflow_code_ns += time.monotonic_ns() - code_start_ns
 
                 # Signal handler failures fail the decision task, not the workflow.
                 if (
@@ -224,6 +272,16 @@ class WorkflowEngine:
             for event in decision_events.output:
                 self._decision_manager.handle_history_event(event)
 
+            elapsed_ns = time.monotonic_ns() - batch_start_ns
+            if decision_events.replay:
+                stats.replay_ns += elapsed_ns
+                # Markers are a subset of the output events
+                stats.replayed_events += len(decision_events.input) + len(
+                    decision_events.output
+                )
+            else:
+                stats.new_events_ns += elapsed_ns
+
     def _maybe_complete_workflow(self) -> Optional[Decision]:
         if not self._workflow_instance.is_done():
             return None
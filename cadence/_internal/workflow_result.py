@@ -0,0 +1,88 @@
+"""Decoding of workflow close events into results or errors for client-side waiters."""
+
+from typing import Any
+
+from cadence.api.v1.common_pb2 import WorkflowExecution
+from cadence.api.v1.history_pb2 import (
+    EVENT_FILTER_TYPE_CLOSE_EVENT,
+    HistoryEvent,
+)
+from cadence.api.v1.service_workflow_pb2 import GetWorkflowExecutionHistoryRequest
+from cadence.data_converter import DataConverter
+from cadence.error import (
+    WorkflowExecutionCanceledError,
+    WorkflowExecutionContinuedAsNewError,
+    WorkflowExecutionFailedError,
+    WorkflowExecutionTerminatedError,
+    WorkflowExecutionTimedOutError,
+)
+
+
+def close_event_request(
+    domain: str, execution: WorkflowExecution
+) -> GetWorkflowExecutionHistoryRequest:
+    """Long-poll request that returns only the close event of ``execution``."""
+    return GetWorkflowExecutionHistoryRequest(
+        domain=domain,
+        workflow_execution=execution,
+        wait_for_new_event=True,
+        history_event_filter_type=EVENT_FILTER_TYPE_CLOSE_EVENT,
+    )
+
+
+def continued_as_new_run_id(event: HistoryEvent) -> str | None:
+    if event.HasField("workflow_execution_continued_as_new_event_attributes"):
+        return event.workflow_execution_continued_as_new_event_attributes.new_execution_run_id
+    return None
+
+
+def result_from_close_event(
+    event: HistoryEvent,
+    execution: WorkflowExecution,
+    data_converter: DataConverter,
+    result_type: type,
+) -> Any:
+    """Decode the result of a completed execution or raise the matching WorkflowExecutionError."""
+    workflow_id = execution.workflow_id
+    run_id = execution.run_id
+    attr = event.WhichOneof("attributes")
+    if attr == "workflow_execution_completed_event_attributes":
+        result = event.workflow_execution_completed_event_attributes.result
+        return data_converter.from_data(result, [result_type])[0]
+    if attr == "workflow_execution_failed_event_attributes":
+        failure = event.workflow_execution_failed_event_attributes.failure
+        raise WorkflowExecutionFailedError(
+            failure.reason, workflow_id, run_id, failure=failure
+        )
+    if attr == "workflow_execution_canceled_event_attributes":
+        raise WorkflowExecutionCanceledError(
+            "workflow canceled",
+            workflow_id,
+            run_id,
+            details=event.workflow_execution_canceled_event_attributes.details,
+        )
+    if attr == "workflow_execution_terminated_event_attributes":
+        terminated = event.workflow_execution_terminated_event_attributes
+        raise WorkflowExecutionTerminatedError(
+            f"workflow terminated: {terminated.reason}",
+            workflow_id,
+            run_id,
+            reason=terminated.reason,
+            details=terminated.details,
+        )
+    if attr == "workflow_execution_timed_out_event_attributes":
+        raise WorkflowExecutionTimedOutError(
+            "workflow timed out",
+            workflow_id,
+            run_id,
+            timeout_type=event.workflow_execution_timed_out_event_attributes.timeout_type,
+        )
+    if attr == "workflow_execution_continued_as_new_event_attributes":
+        new_run_id = event.workflow_execution_continued_as_new_event_attributes.new_execution_run_id
+        raise WorkflowExecutionContinuedAsNewError(
+            f"workflow continued as new run {new_run_id}",
+            workflow_id,
+            run_id,
+            new_run_id=new_run_id,
+        )
+    raise ValueError(f"unexpected workflow close event: {attr}")
@@ -1,22 +1,38 @@
+import asyncio
 import os
 import socket
+import time
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections.abc import Callable
 from typing import Sequence, TypedDict, Unpack, Any, cast, Union
 
-from grpc import ChannelCredentials, Compression
+from grpc import ChannelCredentials, Compression, StatusCode
 
-from cadence._internal.rpc.error import CadenceErrorInterceptor
-from cadence._internal.rpc.metrics import MetricsInterceptor
-from cadence._internal.rpc.retry import RetryInterceptor
-from cadence._internal.rpc.yarpc import YarpcMetadataInterceptor
+from cadence._internal.concurrency import map_bounded
+from cadence._internal.rpc.channel_pool import ChannelPool
+from cadence._internal.rpc.circuit_breaker import CircuitBreakerPolicy
+from cadence._internal.rpc.fused import FusedInterceptor
+from cadence._internal.rpc.hedging import (
+    Hedger,
+    HedgingPolicy,
+    validate_hedging_policies,
+)
+from cadence._internal.rpc.retry import ExponentialRetryPolicy
 from cadence._internal.workflow.active_cluster_selection_policy import (
     active_cluster_selection_policy_to_proto,
 )
 from cadence._internal.workflow.memo import memo_to_proto
 from cadence._internal.workflow.retry_policy import retry_policy_to_proto
+from cadence._internal.workflow_result import (
+    close_event_request,
+    continued_as_new_run_id,
+    result_from_close_event,
+)
 from cadence._internal.context import set_header, validate_propagators
 from cadence.api.v1 import schedule_pb2
 from cadence.api.v1.common_pb2 import (
@@ -58,8 +74,15 @@ from cadence.api.v1.service_workflow_pb2 import (
     StartWorkflowExecutionResponse,
     SignalWithStartWorkflowExecutionRequest,
     SignalWithStartWorkflowExecutionResponse,
+    StartWorkflowExecutionAsyncRequest,
+    SignalWithStartWorkflowExecutionAsyncRequest,
+    GetWorkflowExecutionHistoryRequest,
+    GetWorkflowExecutionHistoryResponse,
+    DescribeWorkflowExecutionRequest,
+    DescribeWorkflowExecutionResponse,
 )
-from cadence.error import QueryFailedError
+from cadence.api.v1.history_pb2 import HistoryEvent
+from cadence.error import CadenceRpcError, QueryFailedError
 from cadence.api.v1 import workflow_pb2
 from cadence.api.v1.tasklist_pb2 import TaskList
 from cadence.data_converter import DataConverter, DefaultDataConverter
@@ -154,6 +177,115 @@ def _validate_and_apply_defaults(
     return options
 
 
+@dataclass
+class WorkflowStartSpec:
+    """A single execution for ``start_workflows_bulk`` or ``signal_with_start_workflows_bulk``.
+
+    Specs that share the same ``options`` object share one validated request
+    template, so build the options once and reuse the object across specs.
+    ``workflow_id`` overrides the id in ``options``; a random id is used if
+    neither is set.
+    """
+
+    workflow: Union[str, WorkflowDefinition]
+    args: Sequence[Any] = ()
+    workflow_id: str | None = None
+    options: StartWorkflowOptions = field(default_factory=StartWorkflowOptions)
+    signal_name: str = ""
+    signal_args: Sequence[Any] = ()
+
+
+@dataclass
+class BulkStartResult:
+    """Outcome of one spec in a bulk start; exactly one of ``execution`` and ``error`` is set."""
+
+    index: int
+    spec: WorkflowStartSpec
+    execution: WorkflowExecution | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _StartRequestTemplates:
+    """Validated start requests for one bulk call, keyed by workflow type and options object."""
+
+    def __init__(
+        self,
+        client: "Client",
+        default_workflow_id_reuse_policy: workflow_pb2.WorkflowIdReusePolicy,
+    ) -> None:
+        self._client = client
+        self._default_workflow_id_reuse_policy = default_workflow_id_reuse_policy
+        # The options object is kept alongside the template so its id() stays unique.
+        self._templates: dict[
+            tuple[str, int],
+            tuple[StartWorkflowOptions, StartWorkflowExecutionRequest],
+        ] = {}
+
+    def build(self, spec: WorkflowStartSpec) -> StartWorkflowExecutionRequest:
+        workflow_type_name = (
+            spec.workflow if isinstance(spec.workflow, str) else spec.workflow.name
+        )
+        key = (workflow_type_name, id(spec.options))
+        cached = self._templates.get(key)
+        if cached is None:
+            options = _validate_and_apply_defaults(
+                StartWorkflowOptions(**spec.options),
+                self._default_workflow_id_reuse_policy,
+            )
+            template = self._client._build_start_workflow_template(
+                spec.workflow, options
+            )
+            cached = (spec.options, template)
+            self._templates[key] = cached
+
+        request = StartWorkflowExecutionRequest()
+        request.CopyFrom(cached[1])
+        return self._client._fill_start_workflow_request(
+            request,
+            spec.workflow_id or spec.options.get("workflow_id"),
+            spec.args,
+        )
+
+
+# Matches the worker poll timeout; the frontend returns an empty page before this.
+_LONG_POLL_TIMEOUT = timedelta(seconds=60)
+_USE_LOCAL_SUBCHANNEL_POOL = "grpc.use_local_subchannel_pool"
+
+
+class ChannelSettings(TypedDict, total=False):
+    """Common gRPC channel settings, translated into ``grpc.*`` channel arguments."""
+
+    keepalive_time: timedelta
+    keepalive_timeout: timedelta
+    keepalive_permit_without_calls: bool
+    max_receive_message_length: int
+    max_send_message_length: int
+
+
+_CHANNEL_SETTING_ARGUMENTS: dict[str, str] = {
+    "keepalive_time": "grpc.keepalive_time_ms",
+    "keepalive_timeout": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "max_receive_message_length": "grpc.max_receive_message_length",
+    "max_send_message_length": "grpc.max_send_message_length",
+}
+
+
+def _channel_settings_to_arguments(settings: ChannelSettings) -> dict[str, Any]:
+    arguments: dict[str, Any] = {}
+    for key, value in settings.items():
+        if isinstance(value, timedelta):
+            value = int(value.total_seconds() * 1000)
+        elif isinstance(value, bool):
+            value = int(value)
+        arguments[_CHANNEL_SETTING_ARGUMENTS[key]] = value
+    return arguments
+
+
 class ClientOptions(TypedDict, total=False):
     domain: str
     target: str
@@ -162,9 +294,25 @@ class ClientOptions(TypedDict, total=False):
     service_name: str
     caller_name: str
     channel_arguments: dict[str, Any]
+    channel_settings: ChannelSettings
+    channel_pool_size: int
+    # Long polls (task polls and history waits) use dedicated channels when any
+    # long_poll_channel_* option is set. Their arguments are channel_arguments and
+    # channel_settings overridden by the long-poll specific ones.
+    long_poll_channel_arguments: dict[str, Any]
+    long_poll_channel_settings: ChannelSettings
+    long_poll_channel_pool_size: int
     credentials: ChannelCredentials | None
     compression: Compression
     metrics_emitter: MetricsEmitter
+    # Per-method retry policy overrides keyed by RPC name; None disables retries
+    rpc_retry_policies: dict[str, ExponentialRetryPolicy | None]
+    # Opt-in per-method circuit breaker; open circuits fail with CircuitOpenError
+    circuit_breaker: CircuitBreakerPolicy | None
+    # Opt-in hedging for idempotent reads (QueryWorkflow, DescribeWorkflowExecution,
+    # GetWorkflowExecutionHistory) keyed by RPC name. Hedges go to another channel
+    # of the pool, so use a channel_pool_size of at least max_attempts
+    rpc_hedging_policies: dict[str, HedgingPolicy]
     interceptors: list[ClientInterceptor]
     context_propagators: Sequence[ContextPropagator]
 
@@ -175,9 +323,12 @@ _DEFAULT_OPTIONS: ClientOptions = {
     "service_name": "cadence-frontend",
     "caller_name": "cadence-client",
     "channel_arguments": {},
+    "channel_pool_size": 1,
+    "long_poll_channel_pool_size": 0,
     "credentials": None,
     "compression": Compression.NoCompression,
     "metrics_emitter": NoOpMetricsEmitter(),
+    "circuit_breaker": None,
     "interceptors": [],
     "context_propagators": (),
 }
@@ -248,16 +399,19 @@ class Client:
         options: StartWorkflowOptions,
     ) -> StartWorkflowExecutionRequest:
         """Build a StartWorkflowExecutionRequest from parameters."""
-        # Generate workflow ID if not provided
-        workflow_id = options.get("workflow_id") or str(uuid.uuid4())
-
-        # Determine workflow type name
-        if isinstance(workflow, str):
-            workflow_type_name = workflow
-        else:
-            # For WorkflowDefinition, use the name property
-            workflow_type_name = workflow.name
+        return self._fill_start_workflow_request(
+            self._build_start_workflow_template(workflow, options),
+            options.get("workflow_id"),
+            args,
+        )
 
+    def _fill_start_workflow_request(
+        self,
+        request: StartWorkflowExecutionRequest,
+        workflow_id: str | None,
+        args: Sequence[Any],
+    ) -> StartWorkflowExecutionRequest:
+        """Set the per-execution fields on a request built by _build_start_workflow_template."""
         # Encode input arguments
         input_payload = None
         if args:
@@ -266,14 +420,34 @@ class Client:
             except Exception as e:
                 raise ValueError(f"Failed to encode workflow arguments: {e}")
 
+        # Generate workflow ID if not provided
+        request.workflow_id = workflow_id or str(uuid.uuid4())
+        request.request_id = str(uuid.uuid4())
+        if input_payload:
+            request.input.CopyFrom(input_payload)
+
+        return request
+
+    def _build_start_workflow_template(
+        self,
+        workflow: Union[str, WorkflowDefinition],
+        options: StartWorkflowOptions,
+    ) -> StartWorkflowExecutionRequest:
+        """Build the fields of a StartWorkflowExecutionRequest shared by every
+        execution started with the same workflow and options."""
+        # Determine workflow type name
+        if isinstance(workflow, str):
+            workflow_type_name = workflow
+        else:
+            # For WorkflowDefinition, use the name property
+            workflow_type_name = workflow.name
+
         # Build the request
         request = StartWorkflowExecutionRequest(
             domain=self.domain,
-            workflow_id=workflow_id,
             workflow_type=WorkflowType(name=workflow_type_name),
             task_list=TaskList(name=options["task_list"]),
             identity=self.identity,
-            request_id=str(uuid.uuid4()),
         )
 
         # Set required timeout fields
@@ -285,8 +459,6 @@ class Client:
         )
 
         # Set optional fields
-        if input_payload:
-            request.input.CopyFrom(input_payload)
         if options.get("cron_schedule"):
             request.cron_schedule = options["cron_schedule"]
         if options.get("cron_overlap_policy") is not None:
@@ -516,6 +688,112 @@ class Client:
         results = self.data_converter.from_data(response.query_result, [result_type])
         return results[0] if results else None
 
+    async def get_workflow_result(
+        self,
+        workflow_id: str,
+        run_id: str = "",
+        *,
+        result_type: type = object,
+        follow_runs: bool = True,
+    ) -> Any:
+        """
+        Wait for a workflow execution to close and return its decoded result.
+
+        Waits with long-poll GetWorkflowExecutionHistory calls that return only
+        the close event, so no history is transferred while the workflow runs.
+
+        Args:
+            workflow_id: The workflow ID
+            run_id: The run ID (can be empty string to wait on the current run,
+                which is resolved with DescribeWorkflowExecution first)
+            result_type: Type to decode the result into
+            follow_runs: Follow continue-as-new to the final run of the chain
+
+        Returns:
+            The workflow result decoded with the client's data converter
+
+        Raises:
+            WorkflowExecutionError: If the workflow failed, was canceled, terminated,
+                timed out, or continued as new while ``follow_runs`` is False
+            Exception: If the gRPC call fails
+        """
+        if not run_id:
+            run_id = await self._current_run_id(workflow_id)
+        execution = WorkflowExecution(workflow_id=workflow_id, run_id=run_id)
+        while True:
+            event = await self._wait_for_close_event(execution)
+            new_run_id = continued_as_new_run_id(event)
+            if follow_runs and new_run_id:
+                execution = WorkflowExecution(
+                    workflow_id=workflow_id, run_id=new_run_id
+                )
+                continue
+            return result_from_close_event(
+                event, execution, self.data_converter, result_type
+            )
+
+    async def _current_run_id(self, workflow_id: str) -> str:
+        # Pin the wait to a run so results and errors report the run that closed
+        response: DescribeWorkflowExecutionResponse = (
+            await self.workflow_stub.DescribeWorkflowExecution(
+                DescribeWorkflowExecutionRequest(
+                    domain=self.domain,
+                    workflow_execution=WorkflowExecution(workflow_id=workflow_id),
+                )
+            )
+        )
+        run_id: str = response.workflow_execution_info.workflow_execution.run_id
+        return run_id
+
+    async def _wait_for_close_event(self, execution: WorkflowExecution) -> HistoryEvent:
+        request = close_event_request(self.domain, execution)
+        while True:
+            try:
+                response: GetWorkflowExecutionHistoryResponse = (
+                    await self.workflow_stub.GetWorkflowExecutionHistory(
+                        request, timeout=_LONG_POLL_TIMEOUT.total_seconds()
+                    )
+                )
+            except CadenceRpcError as e:
+                if e.code != StatusCode.DEADLINE_EXCEEDED:
+                    raise
+                continue
+            if response.history.events:
+                event: HistoryEvent = response.history.events[-1]
+                return event
+            # The long poll expired without the workflow closing
+            request.next_page_token = response.next_page_token
+
+    def result_waiter(
+        self,
+        *,
+        max_concurrent_polls: int = 64,
+        poll_timeout: timedelta = timedelta(seconds=20),
+        min_repoll_interval: timedelta = timedelta(seconds=1),
+    ) -> "WorkflowResultWaiter":
+        """
+        Create a WorkflowResultWaiter that shares long polls across many executions.
+
+        Prefer this over many concurrent ``get_workflow_result`` calls when
+        waiting on a large number of workflows, since each of those holds its
+        own long poll for the whole wait.
+
+        Args:
+            max_concurrent_polls: Maximum number of long polls in flight
+            poll_timeout: How long a single long poll may hold a slot
+            min_repoll_interval: Minimum time between the start of two polls
+                for the same execution, so polls that end early do not spin
+
+        Returns:
+            A WorkflowResultWaiter bound to this client
+        """
+        return WorkflowResultWaiter(
+            self,
+            max_concurrent_polls=max_concurrent_polls,
+            poll_timeout=poll_timeout,
+            min_repoll_interval=min_repoll_interval,
+        )
+
     async def signal_with_start_workflow(
         self,
         workflow: Union[str, WorkflowDefinition],
@@ -552,11 +830,112 @@ class Client:
             workflow, workflow_args, options
         )
 
+        request = self._build_signal_with_start_request(
+            start_request, signal_name, signal_args
+        )
+
+        # Execute the gRPC call
+        try:
+            response: SignalWithStartWorkflowExecutionResponse = (
+                await self.workflow_stub.SignalWithStartWorkflowExecution(request)
+            )
+
+            execution = WorkflowExecution()
+            execution.workflow_id = start_request.workflow_id
+            execution.run_id = response.run_id
+            return execution
+        except Exception:
+            raise
+
+    async def start_workflow_async(
+        self,
+        workflow: Union[str, WorkflowDefinition],
+        *args,
+        **options_kwargs: Unpack[StartWorkflowOptions],
+    ) -> WorkflowExecution:
+        """
+        Enqueue a workflow start on the server and return without waiting for it.
+
+        The server accepts the request into a queue and starts the workflow
+        later, so the returned WorkflowExecution carries only the workflow_id;
+        run_id is empty. Start failures, such as an already running workflow
+        id, are not reported to the caller.
+
+        Args:
+            workflow: WorkflowDefinition or workflow type name string
+            *args: Arguments to pass to the workflow
+            **options_kwargs: StartWorkflowOptions as keyword arguments
+
+        Returns:
+            WorkflowExecution with workflow_id
+
+        Raises:
+            ValueError: If required parameters are missing or invalid
+            Exception: If the gRPC call fails
+        """
+        options = _validate_and_apply_defaults(StartWorkflowOptions(**options_kwargs))
+        request = self._build_start_workflow_request(workflow, args, options)
+
+        await self.workflow_stub.StartWorkflowExecutionAsync(
+            StartWorkflowExecutionAsyncRequest(request=request)
+        )
+        return WorkflowExecution(workflow_id=request.workflow_id)
+
+    async def signal_with_start_workflow_async(
+        self,
+        workflow: Union[str, WorkflowDefinition],
+        signal_name: str,
+        signal_args: list[Any],
+        *workflow_args: Any,
+        **options_kwargs: Unpack[StartWorkflowOptions],
+    ) -> WorkflowExecution:
+        """
+        Enqueue a signal-with-start on the server and return without waiting for it.
+
+        See ``start_workflow_async``; the returned WorkflowExecution carries only
+        the workflow_id.
+
+        Args:
+            workflow: WorkflowDefinition or workflow type name string
+            signal_name: Name of the signal
+            signal_args: List of arguments to pass to the signal handler
+            *workflow_args: Arguments to pass to the workflow if it needs to be started
+            **options_kwargs: StartWorkflowOptions as keyword arguments
+
+        Returns:
+            WorkflowExecution with workflow_id
+
+        Raises:
+            ValueError: If required parameters are missing or invalid
+            Exception: If the gRPC call fails
+        """
+        options = _validate_and_apply_defaults(
+            StartWorkflowOptions(**options_kwargs),
+            workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE,
+        )
+        start_request = self._build_start_workflow_request(
+            workflow, workflow_args, options
+        )
+        request = self._build_signal_with_start_request(
+            start_request, signal_name, signal_args
+        )
+
+        await self.workflow_stub.SignalWithStartWorkflowExecutionAsync(
+            SignalWithStartWorkflowExecutionAsyncRequest(request=request)
+        )
+        return WorkflowExecution(workflow_id=start_request.workflow_id)
+
+    def _build_signal_with_start_request(
+        self,
+        start_request: StartWorkflowExecutionRequest,
+        signal_name: str,
+        signal_args: Sequence[Any],
+    ) -> SignalWithStartWorkflowExecutionRequest:
         # Encode signal input
         signal_payload = None
         if signal_args:
             try:
-                signal_payload = self.data_converter.to_data(signal_args)
+                signal_payload = self.data_converter.to_data(list(signal_args))
             except Exception as e:
                 raise ValueError(f"Failed to encode signal input: {e}")
 
@@ -569,18 +948,109 @@ class Client:
         if signal_payload:
             request.signal_input.CopyFrom(signal_payload)
 
-        # Execute the gRPC call
-        try:
-            response: SignalWithStartWorkflowExecutionResponse = (
-                await self.workflow_stub.SignalWithStartWorkflowExecution(request)
+        return request
+
+    # ------------------------------------------------------------------
+    # Bulk start API
+    # ------------------------------------------------------------------
+
+    async def start_workflows_bulk(
+        self,
+        specs: Iterable[WorkflowStartSpec] | AsyncIterable[WorkflowStartSpec],
+        *,
+        max_concurrency: int = 32,
+    ) -> AsyncIterator[BulkStartResult]:
+        """
+        Start many workflow executions with at most ``max_concurrency`` RPCs in flight.
+
+        Specs are consumed lazily and results are yielded as each start completes,
+        so the order of results does not match the order of ``specs``; use
+        ``BulkStartResult.index`` to correlate them. A failing spec produces a
+        result with ``error`` set and does not stop the remaining starts.
+
+        Args:
+            specs: Executions to start
+            max_concurrency: Maximum number of StartWorkflowExecution calls in flight
+
+        Returns:
+            Async iterator of BulkStartResult in completion order
+        """
+        templates = _StartRequestTemplates(
+            self, workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE_FAILED_ONLY
+        )
+
+        async def start(index: int, spec: WorkflowStartSpec) -> BulkStartResult:
+            try:
+                request = templates.build(spec)
+                response: StartWorkflowExecutionResponse = (
+                    await self.workflow_stub.StartWorkflowExecution(request)
+                )
+            except Exception as e:
+                return BulkStartResult(index, spec, error=e)
+            return BulkStartResult(
+                index,
+                spec,
+                execution=WorkflowExecution(
+                    workflow_id=request.workflow_id, run_id=response.run_id
+                ),
             )
 
-            execution = WorkflowExecution()
-            execution.workflow_id = start_request.workflow_id
-            execution.run_id = response.run_id
-            return execution
-        except Exception:
-            raise
+        async with aclosing(map_bounded(specs, start, max_concurrency)) as results:
+            async for result in results:
+                yield result
+
+    async def signal_with_start_workflows_bulk(
+        self,
+        specs: Iterable[WorkflowStartSpec] | AsyncIterable[WorkflowStartSpec],
+        *,
+        max_concurrency: int = 32,
+    ) -> AsyncIterator[BulkStartResult]:
+        """
+        Signal-with-start many workflow executions with bounded concurrency.
+
+        Behaves like ``start_workflows_bulk`` but issues
+        SignalWithStartWorkflowExecution for each spec, using its
+        ``signal_name`` and ``signal_args``.
+
+        Args:
+            specs: Executions to signal, starting them if they are not running
+            max_concurrency: Maximum number of SignalWithStartWorkflowExecution calls in flight
+
+        Returns:
+            Async iterator of BulkStartResult in completion order
+        """
+        templates = _StartRequestTemplates(
+            self, workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE
+        )
+
+        async def signal_with_start(
+            index: int, spec: WorkflowStartSpec
+        ) -> BulkStartResult:
+            try:
+                if not spec.signal_name:
+                    raise ValueError("signal_name is required")
+                start_request = templates.build(spec)
+                request = self._build_signal_with_start_request(
+                    start_request, spec.signal_name, spec.signal_args
+                )
+                response: SignalWithStartWorkflowExecutionResponse = (
+                    await self.workflow_stub.SignalWithStartWorkflowExecution(request)
+                )
+            except Exception as e:
+                return BulkStartResult(index, spec, error=e)
+            return BulkStartResult(
+                index,
+                spec,
+                execution=WorkflowExecution(
+                    workflow_id=start_request.workflow_id, run_id=response.run_id
+                ),
+            )
+
+        async with aclosing(
+            map_bounded(specs, signal_with_start, max_concurrency)
+        ) as results:
+            async for result in results:
+                yield result
 
     # ------------------------------------------------------------------
     # Schedule API
@@ -772,6 +1242,223 @@ class Client:
             next_page_token = resp.next_page_token
 
 
+@dataclass
+class _ResultWait:
+    execution: WorkflowExecution
+    request: GetWorkflowExecutionHistoryRequest
+    result_type: type
+    follow_runs: bool
+    future: "asyncio.Future[Any]"
+
+
+class WorkflowResultWaiter:
+    """Waits on many workflow executions with a bounded number of long polls.
+
+    Each ``wait`` call registers an execution and returns a future for its
+    result. At most ``max_concurrent_polls`` GetWorkflowExecutionHistory long
+    polls are in flight across all registered executions. Executions take turns
+    in FIFO order: a poll that ends without the workflow closing sends the
+    execution to the back of the queue, so ``poll_timeout`` bounds how long one
+    execution holds a slot while others are waiting. A poll that ends sooner
+    than ``min_repoll_interval``, e.g. with an immediate DEADLINE_EXCEEDED, holds
+    its slot for the rest of that interval before the execution is re-queued.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        *,
+        max_concurrent_polls: int = 64,
+        poll_timeout: timedelta = timedelta(seconds=20),
+        min_repoll_interval: timedelta = timedelta(seconds=1),
+    ) -> None:
+        if max_concurrent_polls <= 0:
+            raise ValueError("max_concurrent_polls must be greater than 0")
+        self._client = client
+        self._max_concurrent_polls = max_concurrent_polls
+        self._poll_timeout = poll_timeout
+        self._min_repoll_interval = min_repoll_interval
+        self._queue: deque[_ResultWait] = deque()
+        self._ready: asyncio.Event | None = None
+        self._pollers: list[asyncio.Task[None]] = []
+        self._unresolved: set[asyncio.Future[Any]] = set()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of executions whose results have not been resolved yet."""
+        return len(self._unresolved)
+
+    def wait(
+        self,
+        workflow_id: str,
+        run_id: str = "",
+        *,
+        result_type: type = object,
+        follow_runs: bool = True,
+    ) -> "asyncio.Future[Any]":
+        """
+        Register an execution and return a future resolved with its result.
+
+        The future is resolved the same way ``Client.get_workflow_result``
+        returns or raises. Cancelling it stops polling for that execution,
+        including a long poll that is already in flight.
+        """
+        if self._closed:
+            raise RuntimeError("WorkflowResultWaiter is closed")
+        execution = WorkflowExecution(workflow_id=workflow_id, run_id=run_id)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._unresolved.add(future)
+        future.add_done_callback(self._unresolved.discard)
+        self._enqueue(
+            _ResultWait(
+                execution=execution,
+                request=close_event_request(self._client.domain, execution),
+                result_type=result_type,
+                follow_runs=follow_runs,
+                future=future,
+            )
+        )
+        self._start_pollers()
+        return future
+
+    async def close(self) -> None:
+        """Stop polling and cancel every unresolved future."""
+        self._closed = True
+        for task in self._pollers:
+            task.cancel()
+        await asyncio.gather(*self._pollers, return_exceptions=True)
+        self._pollers.clear()
+        self._queue.clear()
+        for future in list(self._unresolved):
+            future.cancel()
+
+    async def __aenter__(self) -> "WorkflowResultWaiter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def _enqueue(self, wait: _ResultWait) -> None:
+        self._queue.append(wait)
+        if self._ready is not None:
+            self._ready.set()
+
+    def _start_pollers(self) -> None:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+            self._ready.set()
+        while len(self._pollers) < min(
+            self._max_concurrent_polls, len(self._unresolved)
+        ):
+            self._pollers.append(asyncio.create_task(self._run_poller()))
+
+    async def _run_poller(self) -> None:
+        assert self._ready is not None
+        while True:
+            while not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+            wait = self._queue.popleft()
+            if wait.future.done():
+                continue
+            if await self._take_turn(wait):
+                self._enqueue(wait)
+
+    async def _take_turn(self, wait: _ResultWait) -> bool:
+        """Poll ``wait`` until the turn ends or its future is cancelled."""
+        turn = asyncio.ensure_future(self._poll_at_most_every_interval(wait))
+
+        def cancel_turn(future: "asyncio.Future[Any]") -> None:
+            if future.cancelled():
+                turn.cancel()
+
+        wait.future.add_done_callback(cancel_turn)
+        try:
+            # asyncio.wait does not cancel the turn when it is cancelled itself
+            await asyncio.wait((turn,))
+        except asyncio.CancelledError:
+            turn.cancel()
+            raise
+        finally:
+            wait.future.remove_done_callback(cancel_turn)
+        return not turn.cancelled() and turn.result()
+
+    async def _poll_at_most_every_interval(self, wait: _ResultWait) -> bool:
+        started = time.monotonic()
+        needs_another_turn = await self._poll(wait)
+        if needs_another_turn:
+            remaining = self._min_repoll_interval.total_seconds() - (
+                time.monotonic() - started
+            )
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        return needs_another_turn
+
+    async def _poll(self, wait: _ResultWait) -> bool:
+        """Issue one long poll for ``wait``; return True if it needs another turn."""
+        if not wait.execution.run_id:
+            try:
+                run_id = await self._client._current_run_id(wait.execution.workflow_id)
+            except Exception as e:
+                _resolve(wait.future, exc=e)
+                return False
+            wait.execution = WorkflowExecution(
+                workflow_id=wait.execution.workflow_id, run_id=run_id
+            )
+            wait.request = close_event_request(self._client.domain, wait.execution)
+        try:
+            response: GetWorkflowExecutionHistoryResponse = (
+                await self._client.workflow_stub.GetWorkflowExecutionHistory(
+                    wait.request, timeout=self._poll_timeout.total_seconds()
+                )
+            )
+        except CadenceRpcError as e:
+            if e.code == StatusCode.DEADLINE_EXCEEDED:
+                return True
+            _resolve(wait.future, exc=e)
+            return False
+        except Exception as e:
+            _resolve(wait.future, exc=e)
+            return False
+
+        if not response.history.events:
+            wait.request.next_page_token = response.next_page_token
+            return True
+
+        event = response.history.events[-1]
+        new_run_id = continued_as_new_run_id(event)
+        if wait.follow_runs and new_run_id:
+            wait.execution = WorkflowExecution(
+                workflow_id=wait.execution.workflow_id, run_id=new_run_id
+            )
+            wait.request = close_event_request(self._client.domain, wait.execution)
+            return True
+
+        try:
+            result = result_from_close_event(
+                event, wait.execution, self._client.data_converter, wait.result_type
+            )
+        except Exception as e:
+            _resolve(wait.future, exc=e)
+        else:
+            _resolve(wait.future, result=result)
+        return False
+
+
+def _resolve(
+    future: "asyncio.Future[Any]",
+    result: Any = None,
+    exc: BaseException | None = None,
+) -> None:
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
 def _validate_and_copy_defaults(options: ClientOptions) -> ClientOptions:
     if "target" not in options:
         raise ValueError("target must be specified")
@@ -788,19 +1475,89 @@ def _validate_and_copy_defaults(options: ClientOptions) -> ClientOptions:
     )
     validate_propagators(options["context_propagators"])
 
+    if options["channel_pool_size"] < 1:
+        raise ValueError("channel_pool_size must be at least 1")
+    if options["long_poll_channel_pool_size"] < 0:
+        raise ValueError("long_poll_channel_pool_size cannot be negative")
+    validate_hedging_policies(options.get("rpc_hedging_policies") or {})
+
     return options
 
 
 def _create_channel(options: ClientOptions) -> Channel:
+    channel_arguments = {
+        **(options.get("channel_arguments") or {}),
+        **_channel_settings_to_arguments(options.get("channel_settings") or {}),
+    }
+    long_poll_channel_arguments = {
+        **channel_arguments,
+        **(options.get("long_poll_channel_arguments") or {}),
+        **_channel_settings_to_arguments(
+            options.get("long_poll_channel_settings") or {}
+        ),
+    }
+
+    interceptors = _create_interceptors(options)
+
+    pool_size = options.get("channel_pool_size", 1)
+    long_poll_pool_size = options.get("long_poll_channel_pool_size", 0)
+    if long_poll_pool_size == 0 and (
+        options.get("long_poll_channel_arguments")
+        or options.get("long_poll_channel_settings")
+    ):
+        long_poll_pool_size = 1
+    hedging_policies = options.get("rpc_hedging_policies")
+    if pool_size <= 1 and long_poll_pool_size == 0 and not hedging_policies:
+        return _create_single_channel(options, channel_arguments, interceptors)
+
+    # Channels with equal arguments share subchannels, and so one connection,
+    # through gRPC's global subchannel pool. A local pool per channel gives
+    # each pool member its own connection and HTTP/2 stream limit, and keeps
+    # long polls off the connections used by other calls.
+    pooled_arguments = {**channel_arguments, _USE_LOCAL_SUBCHANNEL_POOL: 1}
+    pool = ChannelPool(
+        [
+            _create_single_channel(options, pooled_arguments, interceptors)
+            for _ in range(pool_size)
+        ],
+        [
+            _create_single_channel(
+                options,
+                {**long_poll_channel_arguments, _USE_LOCAL_SUBCHANNEL_POOL: 1},
+                interceptors,
+            )
+            for _ in range(long_poll_pool_size)
+        ],
+        # Outside the fused interceptor so every hedge is retried and measured
+        Hedger(hedging_policies, options["metrics_emitter"])
+        if hedging_policies
+        else None,
+    )
+    # ChannelPool implements the subset of Channel used by the generated stubs
+    return cast(Channel, pool)
+
+
+def _create_interceptors(options: ClientOptions) -> list[Any]:
+    # Shared by every channel of a client so breaker state spans the pool
     interceptors: list[Any] = list(options["interceptors"])
     interceptors.append(
-        YarpcMetadataInterceptor(options["service_name"], options["caller_name"])
+        FusedInterceptor(
+            options["service_name"],
+            options["caller_name"],
+            options["metrics_emitter"],
+            method_policies=options.get("rpc_retry_policies"),
+            circuit_breaker=options.get("circuit_breaker"),
+        )
     )
-    interceptors.append(RetryInterceptor())
-    interceptors.append(MetricsInterceptor(options["metrics_emitter"]))
-    interceptors.append(CadenceErrorInterceptor())
+    return interceptors
+
+
+def _create_single_channel(
+    options: ClientOptions,
+    channel_arguments: dict[str, Any],
+    interceptors: list[Any],
+) -> Channel:
 
-    channel_arguments = options.get("channel_arguments") or {}
     grpc_channel_options: Sequence[tuple[str, Any]] = tuple(channel_arguments.items())
 
     if options["credentials"]:
@@ -21,8 +21,20 @@ class PydanticDataConverter(DataConverter):
     """DataConverter that handles Pydantic BaseModel and TypedDict types
     (e.g. ResponseInputItemParam) via Pydantic's TypeAdapter."""
 
-    def __init__(self) -> None:
+    def __init__(self, pydantic_encoding: bool = False) -> None:
+        """
+        Args:
+            pydantic_encoding: Serialize every value with pydantic's JSON
+                encoding instead of the legacy ``json`` based one. This is
+                faster for dataclasses and collections of models but changes
+                the payload format: timedeltas become ISO 8601 durations, UTC
+                datetimes end in ``Z``, sets keep their iteration order and
+                bytes are accepted. Only enable it when no workflow history
+                written with the legacy format is replayed and every reader
+                of the payloads accepts the new one.
+        """
         self._decoder = JSONDecoder(strict=False)
+        self._pydantic_encoding = pydantic_encoding
         self._adapter_cache: dict[Any, TypeAdapter[Any] | None] = {}
 
     def _get_adapter(self, type_hint: Any) -> TypeAdapter[Any] | None:
@@ -52,19 +64,40 @@ class PydanticDataConverter(DataConverter):
         if not type_hints:
             return []
 
-        if not payload.data:
+        # Protobuf returns a fresh copy of the bytes on every attribute access
+        data = payload.data
+        if not data:
             if fill_missing_defaults:
                 return [_get_default(th) for th in type_hints]
             return []
 
-        raw_values = self._decode_whitespace_delimited(
-            payload.data.decode(), len(type_hints)
-        )
+        if len(type_hints) == 1:
+            validated = self._validate_single(data, type_hints[0])
+            if validated is not _SENTINEL:
+                return [validated]
+
+        raw_values = self._decode_whitespace_delimited(data.decode(), len(type_hints))
         converted = self._convert_provided_values(raw_values, type_hints)
         if fill_missing_defaults:
             converted.extend(_get_default(th) for th in type_hints[len(raw_values) :])
         return converted
 
+    def _validate_single(self, data: bytes, type_hint: Type | None) -> Any:
+        """Validate a single value straight from the raw JSON bytes.
+
+        Returns _SENTINEL when the payload needs the lenient whitespace
+        delimited path instead (extra values, invalid data or no adapter).
+        """
+        if type_hint is None or type_hint is Any:
+            return _SENTINEL
+        adapter = self._get_adapter(type_hint)
+        if adapter is None:
+            return _SENTINEL
+        try:
+            return adapter.validate_json(data)
+        except Exception:
+            return _SENTINEL
+
     def _convert_provided_values(
         self, raw_values: List[Any], type_hints: Sequence[Type | None]
     ) -> List[Any]:
@@ -88,9 +121,9 @@ class PydanticDataConverter(DataConverter):
         results: List[Any] = []
         start, end = 0, len(payload)
         while start < end and len(results) < max_count:
-            remaining = payload[start:end]
-            value, value_end = self._decoder.raw_decode(remaining)
-            start += value_end + 1
+            # Decode in place by index instead of slicing off the remainder
+            value, value_end = self._decoder.raw_decode(payload, start)
+            start = value_end + 1
             results.append(value)
         return results
 
@@ -100,12 +133,26 @@ class PydanticDataConverter(DataConverter):
         return self._from_payload(payload, type_hints, fill_missing_defaults=False)
 
     def to_data(self, values: List[Any]) -> Payload:
-        result = bytearray()
-        for index, value in enumerate(values):
-            result += _serialize_value(value)
-            if index < len(values) - 1:
-                result += _SPACE
-        return Payload(data=bytes(result))
+        if len(values) == 1:
+            return Payload(data=self._serialize_value(values[0]))
+        # join sizes the output once instead of growing a bytearray and copying it
+        return Payload(
+            data=_SPACE.join(self._serialize_value(value) for value in values)
+        )
+
+    def _serialize_value(self, value: Any) -> bytes:
+        if not self._pydantic_encoding:
+            return _serialize_value(value)
+        adapter = self._get_adapter(type(value))
+        if adapter is not None:
+            try:
+                return adapter.dump_json(value)
+            except Exception:
+                logger.debug(
+                    "TypeAdapter failed to serialize %s, falling back to json",
+                    type(value),
+                )
+        return _serialize_value(value)
 
 
 def _serialize_value(value: Any) -> bytes:
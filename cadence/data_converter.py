@@ -1,9 +1,10 @@
+import threading
 from abc import abstractmethod
 from typing import Protocol, List, Type, Any, Sequence
 
 from cadence.api.v1.common_pb2 import Payload
 from json import JSONDecoder
-from msgspec import json, convert
+from msgspec import json, convert, DecodeError
 
 _SPACE = " ".encode()
 
@@ -23,46 +24,81 @@ class DefaultDataConverter(DataConverter):
         self._encoder = json.Encoder()
         # Need to use std lib decoder in order to decode the custom whitespace delimited data format
         self._decoder = JSONDecoder(strict=False)
+        self._typed_decoders: dict[Any, json.Decoder] = {}
+        # Per-thread scratch buffer for multi-value payloads; sync activities
+        # encode heartbeats and results from the thread pool concurrently.
+        self._local = threading.local()
 
     def from_data(
         self, payload: Payload, type_hints: Sequence[Type | None]
     ) -> List[Any]:
-        if not payload.data:
+        # Protobuf returns a fresh copy of the bytes on every attribute access
+        data = payload.data
+        if not data:
             return DefaultDataConverter._convert_into([], type_hints)
 
         if not type_hints:
             type_hints = [None]
 
-        payload_str = payload.data.decode()
+        if len(type_hints) == 1:
+            try:
+                return [self._decode_single(data, type_hints[0])]
+            except DecodeError:
+                # Multiple values or input msgspec rejects but the std lib
+                # decoder accepts; take the whitespace delimited path below.
+                pass
 
-        return self._decode_whitespace_delimited(payload_str, type_hints)
+        return self._decode_whitespace_delimited(data.decode(), type_hints)
+
+    def _decode_provided_values(
+        self, payload: Payload, type_hints: Sequence[Type | None]
+    ) -> List[Any]:
+        data = payload.data
+        if not data or not type_hints:
+            return []
+
+        values = self._raw_decode_values(data.decode(), len(type_hints))
+        return DefaultDataConverter._convert_into(values, type_hints[: len(values)])
+
+    def _decode_single(self, data: bytes, type_hint: Type | None) -> Any:
+        if not type_hint or type_hint is Any:
+            return json.decode(data)
+
+        try:
+            decoder = self._typed_decoders.get(type_hint)
+        except TypeError:
+            # Unhashable type hint, e.g. Annotated with unhashable metadata
+            return json.decode(data, type=type_hint)
+
+        if decoder is None:
+            decoder = json.Decoder(type_hint)
+            self._typed_decoders[type_hint] = decoder
+        return decoder.decode(data)
 
     def _decode_whitespace_delimited(
         self, payload: str, type_hints: Sequence[Type | None]
     ) -> List[Any]:
+        results = self._raw_decode_values(payload, len(type_hints))
+        return DefaultDataConverter._convert_into(results, type_hints)
+
+    def _raw_decode_values(self, payload: str, max_count: int) -> List[Any]:
         results: List[Any] = []
         start, end = 0, len(payload)
-        while start < end and len(results) < len(type_hints):
-            remaining = payload[start:end]
-            (value, value_end) = self._decoder.raw_decode(remaining)
-            start += value_end + 1
+        while start < end and len(results) < max_count:
+            # Decode in place by index rather than slicing off the remainder,
+            # which would copy the rest of the payload for every value.
+            (value, value_end) = self._decoder.raw_decode(payload, start)
+            start = value_end + 1
             results.append(value)
 
-        return DefaultDataConverter._convert_into(results, type_hints)
+        return results
 
     def _payload_value_count(self, payload: Payload, max_count: int) -> int:
-        if not payload.data or max_count <= 0:
+        data = payload.data
+        if not data or max_count <= 0:
             return 0
 
-        payload_str = payload.data.decode()
-        count = 0
-        start, end = 0, len(payload_str)
-        while start < end and count < max_count:
-            _, value_end = self._decoder.raw_decode(payload_str[start:end])
-            start += value_end + 1
-            count += 1
-
-        return count
+        return len(self._raw_decode_values(data.decode(), max_count))
 
     @staticmethod
     def _convert_into(
@@ -88,10 +124,25 @@ class DefaultDataConverter(DataConverter):
         return None
 
     def to_data(self, values: List[Any]) -> Payload:
-        result = bytearray()
+        if not values:
+            return Payload(data=b"")
+        if len(values) == 1:
+            # msgspec builds the bytes object directly, no intermediate buffer
+            return Payload(data=self._encoder.encode(values[0]))
+
+        buffer = self._buffer()
         for index, value in enumerate(values):
-            self._encoder.encode_into(value, result, -1)
+            self._encoder.encode_into(value, buffer, 0 if index == 0 else -1)
             if index < len(values) - 1:
-                result += _SPACE
-
-        return Payload(data=bytes(result))
+                buffer += _SPACE
+
+        return Payload(data=bytes(buffer))
+
+    def _buffer(self) -> bytearray:
+        # Writing the first value at offset 0 truncates any previous contents
+        # while keeping the allocation around for the next payload.
+        buffer: bytearray | None = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = bytearray()
+            self._local.buffer = buffer
+        return buffer
@@ -87,6 +87,56 @@ class ChildWorkflowExecutionTerminated(ChildWorkflowError):
     pass
 
 
+class WorkflowExecutionError(Exception):
+    """Base class for errors raised when an awaited workflow execution did not complete."""
+
+    def __init__(self, message: str, workflow_id: str, run_id: str) -> None:
+        super().__init__(message)
+        self.workflow_id = workflow_id
+        self.run_id = run_id
+
+
+class WorkflowExecutionFailedError(WorkflowExecutionError):
+    def __init__(
+        self, message: str, workflow_id: str, run_id: str, failure: Any
+    ) -> None:
+        super().__init__(message, workflow_id, run_id)
+        self.failure = failure
+
+
+class WorkflowExecutionCanceledError(WorkflowExecutionError):
+    def __init__(
+        self, message: str, workflow_id: str, run_id: str, details: Any
+    ) -> None:
+        super().__init__(message, workflow_id, run_id)
+        self.details = details
+
+
+class WorkflowExecutionTerminatedError(WorkflowExecutionError):
+    def __init__(
+        self, message: str, workflow_id: str, run_id: str, reason: str, details: Any
+    ) -> None:
+        super().__init__(message, workflow_id, run_id)
+        self.reason = reason
+        self.details = details
+
+
+class WorkflowExecutionTimedOutError(WorkflowExecutionError):
+    def __init__(
+        self, message: str, workflow_id: str, run_id: str, timeout_type: int
+    ) -> None:
+        super().__init__(message, workflow_id, run_id)
+        self.timeout_type = timeout_type
+
+
+class WorkflowExecutionContinuedAsNewError(WorkflowExecutionError):
+    def __init__(
+        self, message: str, workflow_id: str, run_id: str, new_run_id: str
+    ) -> None:
+        super().__init__(message, workflow_id, run_id)
+        self.new_run_id = new_run_id
+
+
 class CadenceRpcError(Exception):
     def __init__(self, message: str | None, code: grpc.StatusCode, *args):
         if message is None:
@@ -194,3 +244,18 @@ class ServiceBusyError(CadenceRpcError):
     def __init__(self, message: str | None, code: grpc.StatusCode, reason: str) -> None:
         super().__init__(message, code, reason)
         self.reason = reason
+
+
+class CircuitOpenError(CadenceRpcError):
+    """Raised without contacting the server while a method's circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str | None,
+        code: grpc.StatusCode,
+        method: str,
+        retry_after: timedelta,
+    ) -> None:
+        super().__init__(message, code, method)
+        self.method = method
+        self.retry_after = retry_after
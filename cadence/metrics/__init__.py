@@ -1,5 +1,7 @@
 """Metrics collection components for Cadence client."""
 
+from .aggregating import AggregatingMetricsEmitter
+from .cardinality import CardinalityLimitingEmitter
 from .histogram_buckets import (
     DEFAULT_1MS_100S,
     HIGH_1MS_24H,
@@ -8,20 +10,38 @@ from .histogram_buckets import (
     default_buckets_for_metric,
 )
 from .metrics import (
+    bind_metric,
+    BoundMetric,
     duration_between,
     duration_from_nanoseconds,
     MetricsEmitter,
     NoOpMetricsEmitter,
     MetricType,
 )
-from .prometheus import PrometheusMetrics, PrometheusConfig
+from .prometheus import (
+    emitter_registry,
+    is_multiprocess,
+    mark_process_dead,
+    multiprocess_registry,
+    PrometheusConfig,
+    PrometheusExporter,
+    PrometheusMetrics,
+)
+from .statsd import StatsdConfig, StatsdMetrics
+
+# OpenTelemetryMetrics lives in cadence.metrics.opentelemetry so that
+# opentelemetry-api stays an optional dependency.
 
 __all__ = [
+    "AggregatingMetricsEmitter",
+    "CardinalityLimitingEmitter",
     "DEFAULT_1MS_100S",
     "HIGH_1MS_24H",
     "LOW_1MS_100S",
     "MID_1MS_24H",
     "default_buckets_for_metric",
+    "bind_metric",
+    "BoundMetric",
     "duration_between",
     "duration_from_nanoseconds",
     "MetricsEmitter",
@@ -29,4 +49,11 @@ __all__ = [
     "MetricType",
     "PrometheusMetrics",
     "PrometheusConfig",
+    "PrometheusExporter",
+    "emitter_registry",
+    "is_multiprocess",
+    "mark_process_dead",
+    "multiprocess_registry",
+    "StatsdConfig",
+    "StatsdMetrics",
 ]
@@ -0,0 +1,277 @@
+"""Metrics emitter that aggregates observations per thread and flushes them in batches."""
+
+import logging
+import threading
+from bisect import bisect_left
+from datetime import timedelta
+from itertools import count
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .histogram_buckets import (
+    DurationBucketResolver,
+    default_buckets_for_metric,
+    resolve_buckets,
+)
+from .metrics import MetricsEmitter, _TaggedEmitter
+
+logger = logging.getLogger(__name__)
+
+_Tags = Optional[Dict[str, str]]
+_SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _Histogram:
+    """Observation count and sum per bucket, plus one overflow bucket."""
+
+    __slots__ = ("bounds", "counts", "sums")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        # Microseconds, the resolution of timedelta
+        self.sums = [0] * (len(bounds) + 1)
+
+    def observe(self, value: timedelta) -> None:
+        micros = value // _MICROSECOND
+        index = bisect_left(self.bounds, micros * 1_000)
+        self.counts[index] += 1
+        self.sums[index] += micros
+
+    def merge(self, other: "_Histogram") -> None:
+        for index, n in enumerate(other.counts):
+            self.counts[index] += n
+            self.sums[index] += other.sums[index]
+
+
+class _Aggregate:
+    """One thread's aggregated series since the last flush."""
+
+    __slots__ = ("thread", "lock", "tags", "counters", "gauges", "histograms")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread = thread
+        # Only contended while a flush swaps the series out
+        self.lock = threading.Lock()
+        self.tags: Dict[_SeriesKey, _Tags] = {}
+        self.counters: Dict[_SeriesKey, int] = {}
+        # (sequence, value), so the last gauge value wins across threads
+        self.gauges: Dict[_SeriesKey, Tuple[int, float]] = {}
+        self.histograms: Dict[_SeriesKey, _Histogram] = {}
+
+    def take(
+        self,
+    ) -> Tuple[
+        Dict[_SeriesKey, _Tags],
+        Dict[_SeriesKey, int],
+        Dict[_SeriesKey, Tuple[int, float]],
+        Dict[_SeriesKey, _Histogram],
+    ]:
+        with self.lock:
+            taken = (self.tags, self.counters, self.gauges, self.histograms)
+            self.tags = {}
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+        return taken
+
+
+class AggregatingMetricsEmitter(MetricsEmitter):
+    """Wraps a backend emitter so hot paths never touch the backend's locks.
+
+    Each thread aggregates into its own series as it records: counters are
+    summed, gauges keep their last value and histograms keep an observation
+    count and sum per bucket, so memory grows with the number of series
+    rather than the number of observations. ``flush`` forwards the result to
+    the backend from a single thread, replaying each non-empty histogram
+    bucket as observations of its mean, which keeps bucket counts and the
+    total sum exact. A daemon thread flushes every ``flush_interval``, and
+    early once a thread holds ``max_series`` series; call ``flush`` directly
+    before an on-demand scrape.
+
+    Histograms are bucketed with the bounds the backend resolves, taking
+    ``histogram_buckets`` and ``duration_bucket_resolver`` from the config of
+    the Prometheus or OpenTelemetry emitter being wrapped unless given here.
+    Metrics the backend leaves to its own defaults use the Go/Java-aligned
+    duration buckets.
+    """
+
+    def __init__(
+        self,
+        backend: MetricsEmitter,
+        flush_interval: Optional[timedelta] = timedelta(seconds=1),
+        max_series: int = 10_000,
+        histogram_buckets: Optional[Mapping[str, Sequence[float]]] = None,
+        duration_bucket_resolver: Optional[DurationBucketResolver] = None,
+    ) -> None:
+        if max_series < 1:
+            raise ValueError("max_series must be at least 1")
+        self._backend = backend
+        self._max_series = max_series
+        config = _backend_config(backend)
+        if histogram_buckets is None:
+            histogram_buckets = getattr(config, "histogram_buckets", None) or {}
+        if duration_bucket_resolver is None:
+            duration_bucket_resolver = getattr(config, "duration_bucket_resolver", None)
+        self._histogram_buckets = histogram_buckets
+        self._duration_bucket_resolver = duration_bucket_resolver
+        self._bounds: Dict[str, Tuple[float, ...]] = {}
+        self._sequence = count()
+        self._local = threading.local()
+        self._aggregates: List[_Aggregate] = []
+        self._aggregates_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._run,
+                args=(flush_interval.total_seconds(),),
+                name="cadence-metrics-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def backend(self) -> MetricsEmitter:
+        return self._backend
+
+    def _aggregate(self) -> _Aggregate:
+        try:
+            aggregate: _Aggregate = self._local.aggregate
+        except AttributeError:
+            aggregate = self._local.aggregate = _Aggregate(threading.current_thread())
+            with self._aggregates_lock:
+                self._aggregates.append(aggregate)
+        return aggregate
+
+    def _new_series(
+        self, aggregate: _Aggregate, series: _SeriesKey, tags: _Tags
+    ) -> None:
+        aggregate.tags[series] = tags
+        if len(aggregate.tags) >= self._max_series:
+            # Wakes the background flusher, if there is one
+            self._flush_requested.set()
+
+    def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
+        return _TaggedEmitter(self, tags)
+
+    def counter(self, key: str, n: int = 1, tags: _Tags = None) -> None:
+        series = (key, tuple(tags.items()) if tags else ())
+        aggregate = self._aggregate()
+        with aggregate.lock:
+            counters = aggregate.counters
+            if series in counters:
+                counters[series] += n
+                return
+            counters[series] = n
+            self._new_series(aggregate, series, tags)
+
+    def gauge(self, key: str, value: float, tags: _Tags = None) -> None:
+        series = (key, tuple(tags.items()) if tags else ())
+        aggregate = self._aggregate()
+        with aggregate.lock:
+            is_new = series not in aggregate.gauges
+            aggregate.gauges[series] = (next(self._sequence), value)
+            if is_new:
+                self._new_series(aggregate, series, tags)
+
+    def histogram(self, key: str, value: timedelta, tags: _Tags = None) -> None:
+        series = (key, tuple(tags.items()) if tags else ())
+        aggregate = self._aggregate()
+        with aggregate.lock:
+            histogram = aggregate.histograms.get(series)
+            if histogram is None:
+                histogram = aggregate.histograms[series] = _Histogram(
+                    self._bucket_bounds(key)
+                )
+                self._new_series(aggregate, series, tags)
+            histogram.observe(value)
+
+    def _bucket_bounds(self, key: str) -> Tuple[float, ...]:
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            buckets = resolve_buckets(
+                key, self._histogram_buckets, self._duration_bucket_resolver
+            )
+            if buckets is None:
+                buckets = default_buckets_for_metric(key)
+            bounds = self._bounds[key] = tuple(sorted(buckets))
+        return bounds
+
+    def flush(self) -> None:
+        """Forward everything recorded so far to the backend."""
+        with self._flush_lock:
+            tags_by_series: Dict[_SeriesKey, _Tags] = {}
+            counters: Dict[_SeriesKey, int] = {}
+            gauges: Dict[_SeriesKey, Tuple[int, float]] = {}
+            histograms: Dict[_SeriesKey, _Histogram] = {}
+
+            with self._aggregates_lock:
+                aggregates = list(self._aggregates)
+                # Drop aggregates of finished threads; they are drained below
+                self._aggregates = [a for a in aggregates if a.thread.is_alive()]
+
+            for aggregate in aggregates:
+                thread_tags, thread_counters, thread_gauges, thread_histograms = (
+                    aggregate.take()
+                )
+                tags_by_series.update(thread_tags)
+                for series, n in thread_counters.items():
+                    counters[series] = counters.get(series, 0) + n
+                for series, gauge in thread_gauges.items():
+                    if series not in gauges or gauges[series] < gauge:
+                        gauges[series] = gauge
+                for series, histogram in thread_histograms.items():
+                    merged = histograms.get(series)
+                    if merged is None:
+                        histograms[series] = histogram
+                    else:
+                        merged.merge(histogram)
+
+            for series, n in counters.items():
+                self._backend.counter(series[0], n, tags_by_series[series])
+            for series, (_, value) in gauges.items():
+                self._backend.gauge(series[0], value, tags_by_series[series])
+            for series, histogram in histograms.items():
+                key, tags = series[0], tags_by_series[series]
+                for n, micros in zip(histogram.counts, histogram.sums):
+                    if not n:
+                        continue
+                    mean = timedelta(microseconds=micros / n)
+                    for _ in range(n):
+                        self._backend.histogram(key, mean, tags)
+
+    def close(self) -> None:
+        """Stop the background flusher and flush what is left."""
+        self._stopped.set()
+        self._flush_requested.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _run(self, interval: float) -> None:
+        while True:
+            self._flush_requested.wait(interval)
+            self._flush_requested.clear()
+            if self._stopped.is_set():
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush aggregated metrics")
+
+
+def _backend_config(emitter: MetricsEmitter) -> Any:
+    """The config of the first emitter ``emitter`` wraps that has one, or None."""
+    while True:
+        config = getattr(emitter, "config", None)
+        if config is not None:
+            return config
+        backend = getattr(emitter, "backend", None)
+        if backend is None:
+            return None
+        emitter = backend
@@ -0,0 +1,145 @@
+"""Metrics emitter that caps the number of distinct tag sets per metric."""
+
+import logging
+import threading
+from datetime import timedelta
+from typing import Collection, Dict, FrozenSet, Optional, Set, Tuple
+
+from .constants import (
+    METRIC_CARDINALITY_OVERFLOW_COUNTER,
+    TAG_ACTIVITY_TYPE,
+    TAG_METRIC_NAME,
+    TAG_WORKFLOW_TYPE,
+)
+from .metrics import BoundMetric, MetricsEmitter, _TaggedEmitter, bind_metric
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_TAG_VALUE = "other"
+
+_TagSet = FrozenSet[Tuple[str, str]]
+
+
+class CardinalityLimitingEmitter(MetricsEmitter):
+    """Wraps a backend emitter so no metric grows more than ``max_tag_sets`` series.
+
+    Workflow and activity type names are used as tags, and backends such as
+    Prometheus keep every series they have seen for the life of the process.
+    Once a metric has ``max_tag_sets`` distinct tag sets, observations with a
+    new tag set have their ``fold_tags`` values replaced by ``"other"`` and a
+    ``metric-cardinality-overflow`` counter is emitted for the metric. Tag sets
+    without any ``fold_tags`` are never folded.
+    """
+
+    def __init__(
+        self,
+        backend: MetricsEmitter,
+        max_tag_sets: int = 1000,
+        fold_tags: Collection[str] = (TAG_WORKFLOW_TYPE, TAG_ACTIVITY_TYPE),
+    ) -> None:
+        if max_tag_sets < 1:
+            raise ValueError("max_tag_sets must be at least 1")
+        self._backend = backend
+        self._max_tag_sets = max_tag_sets
+        self._fold_tags = frozenset(fold_tags)
+        self._lock = threading.Lock()
+        self._seen: Dict[str, Set[_TagSet]] = {}
+        self._overflow: Dict[str, BoundMetric] = {}
+
+    @property
+    def backend(self) -> MetricsEmitter:
+        return self._backend
+
+    def _limit(
+        self, key: str, tags: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        folded = self._fold(key, tags)
+        if folded is None:
+            return tags
+        self._overflow_metric(key).counter()
+        return folded
+
+    def _fold(
+        self, key: str, tags: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """The folded tags if ``tags`` overflows ``key``, or None if it is kept."""
+        if not tags or self._fold_tags.isdisjoint(tags):
+            return None
+        tag_set = frozenset(tags.items())
+        seen = self._seen.get(key)
+        if seen is not None and tag_set in seen:
+            return None
+        with self._lock:
+            seen = self._seen.setdefault(key, set())
+            if tag_set in seen or len(seen) < self._max_tag_sets:
+                seen.add(tag_set)
+                return None
+        return {
+            k: OVERFLOW_TAG_VALUE if k in self._fold_tags else v
+            for k, v in tags.items()
+        }
+
+    def _overflow_metric(self, key: str) -> BoundMetric:
+        bound = self._overflow.get(key)
+        if bound is None:
+            logger.warning(
+                "Metric %s exceeded %d tag sets; folding new %s values into %r",
+                key,
+                self._max_tag_sets,
+                sorted(self._fold_tags),
+                OVERFLOW_TAG_VALUE,
+            )
+            bound = self._overflow[key] = bind_metric(
+                self._backend,
+                METRIC_CARDINALITY_OVERFLOW_COUNTER,
+                {TAG_METRIC_NAME: key},
+            )
+        return bound
+
+    def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
+        return _TaggedEmitter(self, tags)
+
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        folded = self._fold(key, tags)
+        if folded is None:
+            return bind_metric(self._backend, key, tags)
+        return _OverflowBoundMetric(
+            bind_metric(self._backend, key, folded), self._overflow_metric(key)
+        )
+
+    def counter(
+        self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._backend.counter(key, n, self._limit(key, tags))
+
+    def gauge(
+        self, key: str, value: float, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._backend.gauge(key, value, self._limit(key, tags))
+
+    def histogram(
+        self, key: str, value: timedelta, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._backend.histogram(key, value, self._limit(key, tags))
+
+
+class _OverflowBoundMetric:
+    """Bound metric of a folded tag set, counting overflow on every observation."""
+
+    __slots__ = ("_bound", "_overflow")
+
+    def __init__(self, bound: BoundMetric, overflow: BoundMetric) -> None:
+        self._bound = bound
+        self._overflow = overflow
+
+    def counter(self, n: int = 1) -> None:
+        self._overflow.counter()
+        self._bound.counter(n)
+
+    def gauge(self, value: float) -> None:
+        self._overflow.counter()
+        self._bound.gauge(value)
+
+    def histogram(self, value: timedelta) -> None:
+        self._overflow.counter()
+        self._bound.histogram(value)
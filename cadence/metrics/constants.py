@@ -45,6 +45,29 @@ DECISION_RESPONSE_FAILED_COUNTER = CADENCE_METRICS_PREFIX + "decision-response-f
 DECISION_RESPONSE_LATENCY = CADENCE_METRICS_PREFIX + "decision-response-latency_ns"
 DECISION_TASK_PANIC_COUNTER = CADENCE_METRICS_PREFIX + "decision-task-panic"
 DECISION_TASK_COMPLETED_COUNTER = CADENCE_METRICS_PREFIX + "decision-task-completed"
+DECISION_PAYLOAD_DECODE_COUNTER = CADENCE_METRICS_PREFIX + "decision-payload-decode"
+DECISION_PAYLOAD_DECODE_CACHE_HIT_COUNTER = (
+    CADENCE_METRICS_PREFIX + "decision-payload-decode-cache-hit"
+)
+DECISION_PAYLOAD_DECODE_LATENCY = (
+    CADENCE_METRICS_PREFIX + "decision-payload-decode-latency_ns"
+)
+DECISION_HISTORY_FETCH_LATENCY = (
+    CADENCE_METRICS_PREFIX + "decision-history-fetch-latency_ns"
+)
+DECISION_HISTORY_EVENTS_COUNTER = CADENCE_METRICS_PREFIX + "decision-history-events"
+DECISION_HISTORY_BYTES_COUNTER = CADENCE_METRICS_PREFIX + "decision-history-bytes"
+DECISION_EXECUTOR_QUEUE_LATENCY = (
+    CADENCE_METRICS_PREFIX + "decision-executor-queue-latency_ns"
+)
+DECISION_REPLAY_LATENCY = CADENCE_METRICS_PREFIX + "decision-replay-latency_ns"
+DECISION_NEW_EVENTS_LATENCY = CADENCE_METRICS_PREFIX + "decision-new-events-latency_ns"
+DECISION_WORKFLOW_CODE_LATENCY = (
+    CADENCE_METRICS_PREFIX + "decision-workflow-code-latency_ns"
+)
+DECISION_SERIALIZATION_LATENCY = (
+    CADENCE_METRICS_PREFIX + "decision-serialization-latency_ns"
+)
 
 # Activity poll metrics
 ACTIVITY_POLL_COUNTER = CADENCE_METRICS_PREFIX + "activity-poll-total"
@@ -76,15 +99,44 @@ CORRUPTED_SIGNALS_COUNTER = CADENCE_METRICS_PREFIX + "corrupted-signals"
 WORKER_START_COUNTER = CADENCE_METRICS_PREFIX + "worker-start"
 WORKER_PANIC_COUNTER = CADENCE_METRICS_PREFIX + "worker-panic"
 POLLER_START_COUNTER = CADENCE_METRICS_PREFIX + "poller-start"
+POLLER_CONSECUTIVE_FAILURES_GAUGE = (
+    CADENCE_METRICS_PREFIX + "poller-consecutive-failures"
+)
+POLLER_BACKOFF_GAUGE = CADENCE_METRICS_PREFIX + "poller-backoff-seconds"
+POLLER_ACTIVE_GAUGE = CADENCE_METRICS_PREFIX + "poller-active"
+WORKER_TASK_SLOTS_AVAILABLE_GAUGE = (
+    CADENCE_METRICS_PREFIX + "worker-task-slots-available"
+)
+WORKER_TASK_SLOTS_USED_GAUGE = CADENCE_METRICS_PREFIX + "worker-task-slots-used"
+WORKER_IN_FLIGHT_TASKS_GAUGE = CADENCE_METRICS_PREFIX + "worker-in-flight-tasks"
+WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE = (
+    CADENCE_METRICS_PREFIX + "worker-thread-pool-queue-depth"
+)
+WORKER_PERMIT_WAIT_LATENCY = CADENCE_METRICS_PREFIX + "worker-permit-wait-latency_ns"
 
 # Client (gRPC) metrics
 CADENCE_REQUEST = CADENCE_METRICS_PREFIX + "request"
 CADENCE_ERROR = CADENCE_METRICS_PREFIX + "error"
 CADENCE_LATENCY = CADENCE_METRICS_PREFIX + "latency_ns"
 CADENCE_INVALID_REQUEST = CADENCE_METRICS_PREFIX + "invalid-request"
+CADENCE_RETRY = CADENCE_METRICS_PREFIX + "retry"
+CADENCE_RETRY_BUDGET_EXHAUSTED = CADENCE_METRICS_PREFIX + "retry-budget-exhausted"
+CADENCE_CIRCUIT_OPEN = CADENCE_METRICS_PREFIX + "circuit-open"
+CADENCE_CIRCUIT_REJECTED = CADENCE_METRICS_PREFIX + "circuit-rejected"
+CADENCE_HEDGE = CADENCE_METRICS_PREFIX + "hedge"
+CADENCE_HEDGE_WON = CADENCE_METRICS_PREFIX + "hedge-won"
 
 # Replay metrics
 NON_DETERMINISTIC_ERROR = CADENCE_METRICS_PREFIX + "non-deterministic-error"
+# Decision tasks that rebuilt workflow state from history (no cached workflow state)
+WORKFLOW_REPLAY_COUNTER = CADENCE_METRICS_PREFIX + "workflow-replay"
+WORKFLOW_REPLAYED_EVENTS_COUNTER = CADENCE_METRICS_PREFIX + "workflow-replayed-events"
+DECISION_CPU_TIME = CADENCE_METRICS_PREFIX + "decision-cpu-time_ns"
+
+# Emitted by CardinalityLimitingEmitter when it folds a tag set into "other"
+METRIC_CARDINALITY_OVERFLOW_COUNTER = (
+    CADENCE_METRICS_PREFIX + "metric-cardinality-overflow"
+)
 
 # Metric tag keys — match Go SDK internal_logging_tags.go
 TAG_DOMAIN = "Domain"
@@ -95,3 +147,4 @@ TAG_WORKFLOW_ID = "WorkflowID"
 TAG_RUN_ID = "RunID"
 TAG_ATTEMPT = "Attempt"
 TAG_WORKER_TYPE = "WorkerType"
+TAG_METRIC_NAME = "MetricName"
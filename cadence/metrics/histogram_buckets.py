@@ -14,7 +14,7 @@ This module follows the Java SDK's approach (explicit values) since Python has
 no equivalent of the Go client's exponential-histogram builder to port.
 """
 
-from typing import Callable, Sequence, Tuple
+from typing import Callable, Mapping, Optional, Sequence, Tuple
 
 _NS_PER_MS = 1_000_000
 _NS_PER_S = 1_000_000_000
@@ -89,3 +89,21 @@ def default_buckets_for_metric(metric_name: str) -> Tuple[int, ...]:
     if "endtoend" in metric_name:
         return HIGH_1MS_24H
     return DEFAULT_1MS_100S
+
+
+def resolve_buckets(
+    metric_name: str,
+    overrides: Mapping[str, Sequence[float]],
+    resolver: Optional[DurationBucketResolver] = None,
+) -> Optional[Sequence[float]]:
+    """Resolve bucket boundaries for a histogram, or None for the backend's defaults.
+
+    Precedence: per-metric override, then custom resolver, then Go/Java-aligned
+    defaults for `_ns` metrics, then the backend's own defaults otherwise.
+    """
+    override = overrides.get(metric_name)
+    if override is not None:
+        return override
+    if not metric_name.endswith("_ns"):
+        return None
+    return (resolver or default_buckets_for_metric)(metric_name)
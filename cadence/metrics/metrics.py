@@ -3,7 +3,8 @@
 import logging
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, Optional, Protocol
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Protocol, Sequence, Tuple
 
 from google.protobuf.timestamp import to_datetime
 from google.protobuf.timestamp_pb2 import Timestamp
@@ -19,11 +20,25 @@ class MetricType(Enum):
     HISTOGRAM = "histogram"
 
 
+class BoundMetric(Protocol):
+    """A metric key and tag set resolved once for repeated observations."""
+
+    def counter(self, n: int = 1) -> None: ...
+
+    def gauge(self, value: float) -> None: ...
+
+    def histogram(self, value: timedelta) -> None: ...
+
+
 class MetricsEmitter(Protocol):
     """Protocol for metrics collection backends."""
 
     def with_tags(self, tags: Dict[str, str]) -> "MetricsEmitter": ...
 
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        """Resolve ``key`` and ``tags`` once; observe through the returned handle."""
+        return _EmitterBoundMetric(self, key, tags)
+
     def counter(
         self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
     ) -> None:
@@ -43,6 +58,29 @@ class MetricsEmitter(Protocol):
         ...
 
 
+def bind_metric(
+    emitter: MetricsEmitter, key: str, tags: Optional[Dict[str, str]] = None
+) -> BoundMetric:
+    """``emitter.bind(key, tags)``, falling back for emitters that predate ``bind``."""
+    if getattr(type(emitter), "bind", None) is None:
+        return _EmitterBoundMetric(emitter, key, tags)
+    return emitter.bind(key, tags)
+
+
+class _EmitterBoundMetric:
+    """BoundMetric that forwards to the emitter's keyed methods."""
+
+    __slots__ = ("counter", "gauge", "histogram")
+
+    def __init__(
+        self, emitter: MetricsEmitter, key: str, tags: Optional[Dict[str, str]]
+    ) -> None:
+        extra: Dict[str, Any] = {} if tags is None else {"tags": tags}
+        self.counter: Callable[..., None] = partial(emitter.counter, key, **extra)
+        self.gauge: Callable[..., None] = partial(emitter.gauge, key, **extra)
+        self.histogram: Callable[..., None] = partial(emitter.histogram, key, **extra)
+
+
 def duration_between(
     start: Timestamp | datetime, end: Timestamp | datetime
 ) -> Optional[timedelta]:
@@ -83,24 +121,73 @@ class _TaggedEmitter:
     def __init__(self, base: MetricsEmitter, tags: Dict[str, str]) -> None:
         self._base = base
         self._tags = tags
+        self._bound: Dict[str, BoundMetric] = {}
+
+    def _bound_metric(self, key: str) -> BoundMetric:
+        bound = self._bound.get(key)
+        if bound is None:
+            bound = self._bound[key] = bind_metric(self._base, key, self._tags)
+        return bound
 
     def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
         return _TaggedEmitter(self._base, {**self._tags, **tags})
 
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        if not tags:
+            return self._bound_metric(key)
+        return bind_metric(self._base, key, {**self._tags, **tags})
+
     def counter(
         self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
     ) -> None:
-        self._base.counter(key, n, tags={**self._tags, **(tags or {})})
+        if tags:
+            self._base.counter(key, n, tags={**self._tags, **tags})
+        else:
+            self._bound_metric(key).counter(n)
 
     def gauge(
         self, key: str, value: float, tags: Optional[Dict[str, str]] = None
     ) -> None:
-        self._base.gauge(key, value, tags={**self._tags, **(tags or {})})
+        if tags:
+            self._base.gauge(key, value, tags={**self._tags, **tags})
+        else:
+            self._bound_metric(key).gauge(value)
 
     def histogram(
         self, key: str, value: timedelta, tags: Optional[Dict[str, str]] = None
     ) -> None:
-        self._base.histogram(key, value, tags={**self._tags, **(tags or {})})
+        if tags:
+            self._base.histogram(key, value, tags={**self._tags, **tags})
+        else:
+            self._bound_metric(key).histogram(value)
+
+
+class TaggedEmitterCache:
+    """Reuses one tagged emitter per tag set for a fixed list of tag keys.
+
+    Tagged emitters bind their metrics on first use, so reusing them across
+    tasks avoids re-resolving metrics and re-merging tags on every task.
+    """
+
+    def __init__(
+        self,
+        base: MetricsEmitter,
+        tag_keys: Sequence[str],
+        max_size: int = 1024,
+    ) -> None:
+        self._base = base
+        self._tag_keys = tuple(tag_keys)
+        self._max_size = max_size
+        self._emitters: Dict[Tuple[str, ...], MetricsEmitter] = {}
+
+    def get(self, *tag_values: str) -> MetricsEmitter:
+        emitter = self._emitters.get(tag_values)
+        if emitter is None:
+            if len(self._emitters) >= self._max_size:
+                self._emitters.clear()
+            emitter = self._base.with_tags(dict(zip(self._tag_keys, tag_values)))
+            self._emitters[tag_values] = emitter
+        return emitter
 
 
 class NoOpMetricsEmitter:
@@ -109,6 +196,9 @@ class NoOpMetricsEmitter:
     def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
         return self
 
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        return _NOOP_BOUND_METRIC
+
     def counter(
         self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
     ) -> None:
@@ -123,3 +213,17 @@ class NoOpMetricsEmitter:
         self, key: str, value: timedelta, tags: Optional[Dict[str, str]] = None
     ) -> None:
         pass
+
+
+class _NoOpBoundMetric:
+    def counter(self, n: int = 1) -> None:
+        pass
+
+    def gauge(self, value: float) -> None:
+        pass
+
+    def histogram(self, value: timedelta) -> None:
+        pass
+
+
+_NOOP_BOUND_METRIC = _NoOpBoundMetric()
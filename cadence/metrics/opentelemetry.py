@@ -0,0 +1,189 @@
+"""OpenTelemetry metrics integration for Cadence client.
+
+Requires the ``opentelemetry-api`` package (``cadence-python-client[opentelemetry]``).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, Optional, Protocol, Sequence, Union
+
+from opentelemetry.metrics import (
+    Counter,
+    Histogram,
+    Meter,
+    MeterProvider,
+    get_meter_provider,
+)
+
+from .histogram_buckets import DurationBucketResolver, resolve_buckets
+from .metrics import BoundMetric, MetricsEmitter, _TaggedEmitter
+from .prometheus import _timedelta_to_nanoseconds
+
+logger = logging.getLogger(__name__)
+
+
+class Gauge(Protocol):
+    """The synchronous gauge returned by ``Meter.create_gauge``.
+
+    opentelemetry-api only exports its type under a provisional private name.
+    """
+
+    def set(
+        self, amount: Union[int, float], attributes: Optional[Dict[str, str]] = None
+    ) -> None: ...
+
+
+@dataclass
+class OpenTelemetryConfig:
+    """Configuration for OpenTelemetry metrics."""
+
+    # Default attributes to apply to all metrics
+    default_attributes: Dict[str, str] = field(default_factory=dict)
+
+    # Meter provider (if None, uses the global meter provider)
+    meter_provider: Optional[MeterProvider] = None
+
+    # Name of the meter the instruments are created on
+    meter_name: str = "cadence"
+
+    # Per-metric bucket overrides, keyed by exact metric name. Passed to the SDK
+    # as explicit bucket boundary advice, with the same precedence as
+    # PrometheusConfig.histogram_buckets.
+    histogram_buckets: Dict[str, Sequence[float]] = field(default_factory=dict)
+
+    # Overrides how default buckets are chosen for `_ns`-suffixed metrics.
+    duration_bucket_resolver: Optional[DurationBucketResolver] = None
+
+
+class OpenTelemetryMetrics(MetricsEmitter):
+    """OpenTelemetry metrics emitter. Durations are recorded in nanoseconds."""
+
+    def __init__(self, config: Optional[OpenTelemetryConfig] = None):
+        self.config = config or OpenTelemetryConfig()
+        provider = self.config.meter_provider or get_meter_provider()
+        self._meter: Meter = provider.get_meter(self.config.meter_name)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def _attributes(self, tags: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return {**self.config.default_attributes, **(tags or {})}
+
+    def _counter(self, name: str) -> Counter:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = self._meter.create_counter(name)
+                    self._counters[name] = counter
+        return counter
+
+    def _gauge(self, name: str) -> Gauge:
+        gauge = self._gauges.get(name)
+        if gauge is None:
+            with self._lock:
+                gauge = self._gauges.get(name)
+                if gauge is None:
+                    gauge = self._meter.create_gauge(name)
+                    self._gauges[name] = gauge
+        return gauge
+
+    def _histogram(self, name: str) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    buckets = resolve_buckets(
+                        name,
+                        self.config.histogram_buckets,
+                        self.config.duration_bucket_resolver,
+                    )
+                    histogram = self._meter.create_histogram(
+                        name,
+                        unit="ns" if name.endswith("_ns") else "",
+                        explicit_bucket_boundaries_advisory=(
+                            list(buckets) if buckets is not None else None
+                        ),
+                    )
+                    self._histograms[name] = histogram
+        return histogram
+
+    def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
+        return _TaggedEmitter(self, tags)
+
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        return _OpenTelemetryBoundMetric(self, key, self._attributes(tags))
+
+    def counter(
+        self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a counter metric."""
+        try:
+            self._counter(key).add(n, self._attributes(tags))
+        except Exception as e:
+            logger.error(f"Failed to send counter {key}: {e}")
+
+    def gauge(
+        self, key: str, value: float, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a gauge metric."""
+        try:
+            self._gauge(key).set(value, self._attributes(tags))
+        except Exception as e:
+            logger.error(f"Failed to send gauge {key}: {e}")
+
+    def histogram(
+        self, key: str, value: timedelta, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a duration histogram metric."""
+        try:
+            self._histogram(key).record(
+                _timedelta_to_nanoseconds(value), self._attributes(tags)
+            )
+        except Exception as e:
+            logger.error(f"Failed to send histogram {key}: {e}")
+
+
+class _OpenTelemetryBoundMetric:
+    """Holds the instrument and merged attributes for repeated observations."""
+
+    __slots__ = ("_metrics", "_key", "_attributes", "_counter", "_gauge", "_histogram")
+
+    def __init__(
+        self, metrics: OpenTelemetryMetrics, key: str, attributes: Dict[str, str]
+    ) -> None:
+        self._metrics = metrics
+        self._key = key
+        self._attributes = attributes
+        self._counter: Optional[Counter] = None
+        self._gauge: Optional[Gauge] = None
+        self._histogram: Optional[Histogram] = None
+
+    def counter(self, n: int = 1) -> None:
+        try:
+            if self._counter is None:
+                self._counter = self._metrics._counter(self._key)
+            self._counter.add(n, self._attributes)
+        except Exception as e:
+            logger.error(f"Failed to send counter {self._key}: {e}")
+
+    def gauge(self, value: float) -> None:
+        try:
+            if self._gauge is None:
+                self._gauge = self._metrics._gauge(self._key)
+            self._gauge.set(value, self._attributes)
+        except Exception as e:
+            logger.error(f"Failed to send gauge {self._key}: {e}")
+
+    def histogram(self, value: timedelta) -> None:
+        try:
+            if self._histogram is None:
+                self._histogram = self._metrics._histogram(self._key)
+            self._histogram.record(_timedelta_to_nanoseconds(value), self._attributes)
+        except Exception as e:
+            logger.error(f"Failed to send histogram {self._key}: {e}")
@@ -1,9 +1,12 @@
 """Prometheus metrics integration for Cadence client."""
 
+import errno
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Dict, Optional, Sequence
+from typing import Any, Dict, Literal, Optional, Sequence
 
 from prometheus_client import (  # type: ignore[import-not-found]
     REGISTRY,
@@ -12,10 +15,12 @@ from prometheus_client import (  # type: ignore[import-not-found]
     Gauge,
     Histogram,
     generate_latest,
+    multiprocess,
+    start_http_server,
 )
 
-from .histogram_buckets import DurationBucketResolver, default_buckets_for_metric
-from .metrics import MetricsEmitter, _TaggedEmitter
+from .histogram_buckets import DurationBucketResolver, resolve_buckets
+from .metrics import BoundMetric, MetricsEmitter, _TaggedEmitter
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +45,21 @@ class PrometheusConfig:
     # covered by histogram_buckets. Defaults to histogram_buckets.default_buckets_for_metric.
     duration_bucket_resolver: Optional[DurationBucketResolver] = None
 
+    # How gauges from several processes are combined in multiprocess mode (see
+    # is_multiprocess). Ignored otherwise.
+    gauge_multiprocess_mode: Literal[
+        "all",
+        "liveall",
+        "min",
+        "livemin",
+        "max",
+        "livemax",
+        "sum",
+        "livesum",
+        "mostrecent",
+        "livemostrecent",
+    ] = "all"
+
 
 class PrometheusMetrics(MetricsEmitter):
     """Prometheus metrics collector implementation."""
@@ -95,6 +115,7 @@ class PrometheusMetrics(MetricsEmitter):
                 f"Gauge metric for {name}",
                 labelnames=label_names,
                 registry=self.registry,
+                multiprocess_mode=self.config.gauge_multiprocess_mode,
             )
             logger.debug(f"Created gauge metric: {metric_name}")
 
@@ -130,34 +151,33 @@ class PrometheusMetrics(MetricsEmitter):
         return self._histograms[metric_name]
 
     def _resolve_buckets(self, metric_name: str) -> Optional[Sequence[float]]:
-        """Resolve bucket boundaries for a histogram, or None for Prometheus's defaults.
-
-        Precedence: per-metric override, then custom resolver, then Go/Java-aligned
-        defaults for `_ns` metrics, then Prometheus's own defaults otherwise.
-        """
-        override = self.config.histogram_buckets.get(metric_name)
-        if override is not None:
-            return override
-        if not metric_name.endswith("_ns"):
-            return None
-        resolver = self.config.duration_bucket_resolver or default_buckets_for_metric
-        return resolver(metric_name)
+        """Resolve bucket boundaries for a histogram, or None for Prometheus's defaults."""
+        return resolve_buckets(
+            metric_name,
+            self.config.histogram_buckets,
+            self.config.duration_bucket_resolver,
+        )
 
     def with_tags(self, tags: Dict[str, str]) -> "MetricsEmitter":
         return _TaggedEmitter(self, tags)
 
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        return _PrometheusBoundMetric(self, key, tags)
+
+    def _child(self, metric: Any, tags: Optional[Dict[str, str]]) -> Any:
+        """The labelled child of ``metric`` for ``tags``, or the metric itself."""
+        merged_tags = self._merge_labels(tags)
+        if merged_tags:
+            return metric.labels(**merged_tags)
+        return metric
+
     def counter(
         self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
     ) -> None:
         """Send a counter metric."""
         try:
             counter = self._get_or_create_counter(key, tags)
-            merged_tags = self._merge_labels(tags)
-
-            if merged_tags:
-                counter.labels(**merged_tags).inc(n)
-            else:
-                counter.inc(n)
+            self._child(counter, tags).inc(n)
 
         except Exception as e:
             logger.error(f"Failed to send counter {key}: {e}")
@@ -168,12 +188,7 @@ class PrometheusMetrics(MetricsEmitter):
         """Send a gauge metric."""
         try:
             gauge = self._get_or_create_gauge(key, tags)
-            merged_tags = self._merge_labels(tags)
-
-            if merged_tags:
-                gauge.labels(**merged_tags).set(value)
-            else:
-                gauge.set(value)
+            self._child(gauge, tags).set(value)
 
         except Exception as e:
             logger.error(f"Failed to send gauge {key}: {e}")
@@ -184,13 +199,7 @@ class PrometheusMetrics(MetricsEmitter):
         """Send a duration histogram metric."""
         try:
             histogram = self._get_or_create_histogram(key, tags)
-            merged_tags = self._merge_labels(tags)
-            value_ns = _timedelta_to_nanoseconds(value)
-
-            if merged_tags:
-                histogram.labels(**merged_tags).observe(value_ns)
-            else:
-                histogram.observe(value_ns)
+            self._child(histogram, tags).observe(_timedelta_to_nanoseconds(value))
 
         except Exception as e:
             logger.error(f"Failed to send histogram {key}: {e}")
@@ -205,6 +214,157 @@ class PrometheusMetrics(MetricsEmitter):
             return ""
 
 
+def is_multiprocess() -> bool:
+    """Whether prometheus_client runs in multiprocess mode.
+
+    Multiprocess mode is enabled by pointing ``PROMETHEUS_MULTIPROC_DIR`` at a
+    directory shared by all worker processes on the host, before they start.
+    Every process then writes its metrics to mmap'd files there, and a single
+    exporter merges them into one scrape target.
+    """
+    return bool(
+        os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+        or os.environ.get("prometheus_multiproc_dir")
+    )
+
+
+def multiprocess_registry() -> CollectorRegistry:
+    """A registry that merges the metrics of every process in multiprocess mode."""
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def emitter_registry(emitter: MetricsEmitter) -> Optional[CollectorRegistry]:
+    """The registry an exporter should serve for ``emitter``.
+
+    In multiprocess mode this merges every process's metrics. Otherwise it is
+    the registry of the PrometheusMetrics ``emitter`` wraps, or None, and so
+    the global registry, if it does not wrap one.
+    """
+    if is_multiprocess():
+        return multiprocess_registry()
+    while not isinstance(emitter, PrometheusMetrics):
+        backend = getattr(emitter, "backend", None)
+        if backend is None:
+            return None
+        emitter = backend
+    return emitter.registry
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drop this process's live gauges from the merged multiprocess metrics.
+
+    Call when the process stops recording metrics; does nothing outside
+    multiprocess mode.
+    """
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid() if pid is None else pid)
+
+
+class PrometheusExporter:
+    """Serves Prometheus metrics over HTTP from a background thread.
+
+    In multiprocess mode the exporter serves the merged metrics of all
+    processes, so only one process per host needs to bind the port. Other
+    processes that try the same port skip serving instead of failing. They
+    do not take the port over if the serving process exits, so on hosts
+    where worker processes come and go, bind the port from a process that
+    outlives them.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        addr: str = "0.0.0.0",
+        registry: Optional[CollectorRegistry] = None,
+    ) -> None:
+        self.port = port
+        self.addr = addr
+        self._registry = registry
+        self._server: Any = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def serving(self) -> bool:
+        return self._server is not None
+
+    def start(self) -> bool:
+        """Start serving; returns False if another process already owns the port."""
+        if self._server is not None:
+            return True
+        registry = self._registry
+        if registry is None:
+            registry = multiprocess_registry() if is_multiprocess() else REGISTRY
+        try:
+            self._server, self._thread = start_http_server(
+                self.port, self.addr, registry
+            )
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE:
+                raise
+            log = logger.info if is_multiprocess() else logger.warning
+            log(f"Metrics port {self.port} is already in use; not serving metrics")
+            return False
+        if self.port == 0:
+            self.port = self._server.server_port
+        logger.info(f"Serving Prometheus metrics on {self.addr}:{self.port}")
+        return True
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+
+class _PrometheusBoundMetric:
+    """Caches the labelled Prometheus child per metric type on first use."""
+
+    __slots__ = ("_metrics", "_key", "_tags", "_counter", "_gauge", "_histogram")
+
+    def __init__(
+        self, metrics: PrometheusMetrics, key: str, tags: Optional[Dict[str, str]]
+    ) -> None:
+        self._metrics = metrics
+        self._key = key
+        self._tags = dict(tags) if tags else None
+        self._counter: Any = None
+        self._gauge: Any = None
+        self._histogram: Any = None
+
+    def counter(self, n: int = 1) -> None:
+        try:
+            if self._counter is None:
+                metric = self._metrics._get_or_create_counter(self._key, self._tags)
+                self._counter = self._metrics._child(metric, self._tags)
+            self._counter.inc(n)
+        except Exception as e:
+            logger.error(f"Failed to send counter {self._key}: {e}")
+
+    def gauge(self, value: float) -> None:
+        try:
+            if self._gauge is None:
+                metric = self._metrics._get_or_create_gauge(self._key, self._tags)
+                self._gauge = self._metrics._child(metric, self._tags)
+            self._gauge.set(value)
+        except Exception as e:
+            logger.error(f"Failed to send gauge {self._key}: {e}")
+
+    def histogram(self, value: timedelta) -> None:
+        try:
+            if self._histogram is None:
+                metric = self._metrics._get_or_create_histogram(self._key, self._tags)
+                self._histogram = self._metrics._child(metric, self._tags)
+            self._histogram.observe(_timedelta_to_nanoseconds(value))
+        except Exception as e:
+            logger.error(f"Failed to send histogram {self._key}: {e}")
+
+
 def _timedelta_to_nanoseconds(value: timedelta) -> int:
     """Convert a Python duration to the nanoseconds used by Cadence metrics."""
     return (
@@ -0,0 +1,186 @@
+"""StatsD and DogStatsD metrics integration for Cadence client."""
+
+import logging
+import socket
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from .metrics import BoundMetric, MetricsEmitter, _TaggedEmitter
+
+logger = logging.getLogger(__name__)
+
+# Characters that delimit tags, values and lines in the DogStatsD format
+_TAG_RESERVED = str.maketrans({c: "_" for c in ",|:\n"})
+
+
+@dataclass
+class StatsdConfig:
+    """Configuration for StatsD metrics."""
+
+    host: str = "127.0.0.1"
+    port: int = 8125
+
+    # Prepended to every metric name, e.g. "myservice."
+    prefix: str = ""
+
+    # Emit tags in DogStatsD format ("|#key:value"). Plain StatsD has no tags,
+    # so they are dropped unless this is set.
+    dogstatsd: bool = False
+
+    # Default tags to apply to all metrics (DogStatsD only)
+    default_tags: Dict[str, str] = field(default_factory=dict)
+
+    # Lines are batched into datagrams of at most this many bytes. The default
+    # fits a 1500 byte Ethernet MTU after IP and UDP headers.
+    max_packet_size: int = 1432
+
+    # How often a partially filled datagram is sent. None sends only when a
+    # datagram is full or flush() is called.
+    flush_interval: Optional[timedelta] = timedelta(milliseconds=100)
+
+
+class StatsdMetrics(MetricsEmitter):
+    """StatsD/DogStatsD metrics emitter that batches lines into UDP datagrams.
+
+    Durations are sent as timers in milliseconds, so histogram buckets are
+    configured on the StatsD server or agent rather than here. A ``_ns``
+    suffix on a duration metric's name is sent as ``_ms`` to match.
+    """
+
+    def __init__(self, config: Optional[StatsdConfig] = None):
+        self.config = config or StatsdConfig()
+        self._address = (self.config.host, self.config.port)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._lock = threading.Lock()
+        self._lines: List[bytes] = []
+        self._size = 0
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if self.config.flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._run,
+                args=(self.config.flush_interval.total_seconds(),),
+                name="cadence-statsd-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _metric_name(self, key: str) -> str:
+        return f"{self.config.prefix}{key}"
+
+    def _timer_name(self, key: str) -> str:
+        if key.endswith("_ns"):
+            key = key[: -len("_ns")] + "_ms"
+        return self._metric_name(key)
+
+    def _tag_suffix(self, tags: Optional[Dict[str, str]]) -> str:
+        if not self.config.dogstatsd:
+            return ""
+        merged = {**self.config.default_tags, **(tags or {})}
+        if not merged:
+            return ""
+        return "|#" + ",".join(
+            f"{_sanitize_tag(k)}:{_sanitize_tag(v)}" for k, v in merged.items()
+        )
+
+    def with_tags(self, tags: Dict[str, str]) -> MetricsEmitter:
+        return _TaggedEmitter(self, tags)
+
+    def bind(self, key: str, tags: Optional[Dict[str, str]] = None) -> BoundMetric:
+        return _StatsdBoundMetric(
+            self, self._metric_name(key), self._timer_name(key), self._tag_suffix(tags)
+        )
+
+    def counter(
+        self, key: str, n: int = 1, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a counter metric."""
+        self._send(f"{self._metric_name(key)}:{n}|c{self._tag_suffix(tags)}")
+
+    def gauge(
+        self, key: str, value: float, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a gauge metric."""
+        self._send(f"{self._metric_name(key)}:{value}|g{self._tag_suffix(tags)}")
+
+    def histogram(
+        self, key: str, value: timedelta, tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a duration as a timer in milliseconds."""
+        self._send(
+            f"{self._timer_name(key)}:{_milliseconds(value)}|ms{self._tag_suffix(tags)}"
+        )
+
+    def _send(self, line: str) -> None:
+        data = line.encode("utf-8")
+        with self._lock:
+            # Account for the newline separating this line from the previous one
+            if self._lines and self._size + 1 + len(data) > self.config.max_packet_size:
+                self._write(self._take())
+            self._size += len(data) + (1 if self._lines else 0)
+            self._lines.append(data)
+
+    def _take(self) -> bytes:
+        packet = b"\n".join(self._lines)
+        self._lines = []
+        self._size = 0
+        return packet
+
+    def _write(self, packet: bytes) -> None:
+        try:
+            self._socket.sendto(packet, self._address)
+        except OSError as e:
+            logger.debug(f"Failed to send StatsD packet: {e}")
+
+    def flush(self) -> None:
+        """Send any buffered lines now."""
+        with self._lock:
+            if self._lines:
+                self._write(self._take())
+
+    def close(self) -> None:
+        """Stop the background flusher, send buffered lines and close the socket."""
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        self._socket.close()
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.flush()
+
+
+class _StatsdBoundMetric:
+    """Keeps the formatted metric names and tag suffix for repeated sends."""
+
+    __slots__ = ("_statsd", "_name", "_timer_name", "_tags")
+
+    def __init__(
+        self, statsd: StatsdMetrics, name: str, timer_name: str, tags: str
+    ) -> None:
+        self._statsd = statsd
+        self._name = name
+        self._timer_name = timer_name
+        self._tags = tags
+
+    def counter(self, n: int = 1) -> None:
+        self._statsd._send(f"{self._name}:{n}|c{self._tags}")
+
+    def gauge(self, value: float) -> None:
+        self._statsd._send(f"{self._name}:{value}|g{self._tags}")
+
+    def histogram(self, value: timedelta) -> None:
+        self._statsd._send(f"{self._timer_name}:{_milliseconds(value)}|ms{self._tags}")
+
+
+def _sanitize_tag(value: str) -> str:
+    return str(value).translate(_TAG_RESERVED)
+
+
+def _milliseconds(value: timedelta) -> float:
+    return value / timedelta(milliseconds=1)
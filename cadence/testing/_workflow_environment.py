@@ -507,6 +507,16 @@ class _MockClient(Client):
             workflow_id, query_type, query_args, result_type
         )
 
+    async def get_workflow_result(
+        self,
+        workflow_id: str,
+        run_id: str = "",
+        *,
+        result_type: type = object,
+        follow_runs: bool = True,
+    ) -> Any:
+        return self._env.get_workflow_result(result_type, workflow_id, run_id)
+
     async def signal_with_start_workflow(
         self,
         workflow: Union[str, WorkflowDefinition],
@@ -0,0 +1,39 @@
+"""OpenTelemetry trace propagation for Cadence workflows and activities.
+
+Requires the ``opentelemetry-api`` package (``cadence-python-client[opentelemetry]``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+from opentelemetry import context
+
+from cadence._internal.tracing import extract_trace_context, inject_trace_headers
+from cadence.context import ContextPropagator
+
+
+class OpenTelemetryPropagator(ContextPropagator):
+    """Carries the active OpenTelemetry trace in Cadence headers.
+
+    Register it in ``context_propagators`` so spans started by workflow and
+    activity code join the trace of the code that started them. With the
+    worker's ``enable_tracing`` option this is the decision or activity task
+    span that ran them.
+    """
+
+    def inject(self) -> Mapping[str, bytes]:
+        return inject_trace_headers()
+
+    @contextmanager
+    def extract(self, headers: Mapping[str, bytes]) -> Iterator[None]:
+        trace_context = extract_trace_context(headers)
+        if trace_context is None:
+            yield
+            return
+        token = context.attach(trace_context)
+        try:
+            yield
+        finally:
+            context.detach(token)
@@ -2,6 +2,7 @@ import asyncio
 from typing import Optional
 
 from cadence._internal.activity import ActivityExecutor
+from cadence._internal.tracing import create_task_tracer
 from cadence.api.v1.service_worker_pb2 import (
     PollForActivityTaskResponse,
     PollForActivityTaskRequest,
@@ -26,7 +27,12 @@ from cadence.metrics.constants import (
 from cadence.worker._poll_metrics import PollMetrics
 from cadence.worker._poller import Poller
 from cadence.worker._registry import Registry
-from cadence.worker._types import WorkerOptions, _LONG_POLL_TIMEOUT
+from cadence.worker._types import (
+    _DEFAULT_WORKER_OPTIONS,
+    _LONG_POLL_TIMEOUT,
+    WorkerOptions,
+)
+from cadence.worker._worker_gauges import WorkerGauges
 
 
 class ActivityWorker:
@@ -50,6 +56,7 @@ class ActivityWorker:
             failed=ACTIVITY_POLL_FAILED_COUNTER,
             transient_failed=ACTIVITY_POLL_TRANSIENT_FAILED_COUNTER,
             scheduled_to_start=ACTIVITY_SCHEDULED_TO_START_LATENCY,
+            worker_type="ActivityWorker",
         )
         max_concurrent = options["max_concurrent_activity_execution_size"]
         permits = asyncio.Semaphore(max_concurrent)
@@ -61,6 +68,9 @@ class ActivityWorker:
             registry.get_activity,
             options["metrics_emitter"],
             context_propagators=options.get("context_propagators", ()),
+            tracer=create_task_tracer(
+                options.get("enable_tracing", False), options.get("tracer_provider")
+            ),
         )
         self._poller = Poller[PollForActivityTaskResponse](
             self._num_pollers,
@@ -70,16 +80,32 @@ class ActivityWorker:
             on_start=lambda num_pollers: self._tagged_emitter.counter(
                 POLLER_START_COUNTER, num_pollers
             ),
+            on_backoff=self._poll_metrics.record_backoff,
+            on_permit_wait=lambda wait: self._gauges.record_permit_wait(wait),
+        )
+        self._gauges = WorkerGauges(
+            emitter=self._tagged_emitter,
+            worker_type="ActivityWorker",
+            max_slots=max_concurrent,
+            poller=self._poller,
+            thread_pool=self._executor.thread_pool,
+        )
+        self._sample_interval = options.get(
+            "metrics_sample_interval",
+            _DEFAULT_WORKER_OPTIONS["metrics_sample_interval"],
         )
         # TODO: Local dispatch, local activities, actually running activities, etc
 
     async def run(self) -> None:
         self._tagged_emitter.counter(WORKER_START_COUNTER)
+        sampler = asyncio.create_task(self._gauges.run(self._sample_interval))
         try:
             await self._poller.run()
         except Exception:
             self._tagged_emitter.counter(WORKER_PANIC_COUNTER)
             raise
+        finally:
+            sampler.cancel()
 
     async def _poll(self) -> Optional[PollForActivityTaskResponse]:
         async with self._poll_metrics.track():
@@ -1,7 +1,7 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from cadence._internal.concurrency import CountingThreadPoolExecutor
 from cadence.api.v1.service_worker_pb2 import (
     PollForDecisionTaskRequest,
     PollForDecisionTaskResponse,
@@ -27,7 +27,12 @@ from cadence.worker._decision_task_handler import DecisionTaskHandler
 from cadence.worker._poll_metrics import PollMetrics
 from cadence.worker._poller import Poller
 from cadence.worker._registry import Registry
-from cadence.worker._types import _LONG_POLL_TIMEOUT, WorkerOptions
+from cadence.worker._types import (
+    _DEFAULT_WORKER_OPTIONS,
+    _LONG_POLL_TIMEOUT,
+    WorkerOptions,
+)
+from cadence.worker._worker_gauges import WorkerGauges
 
 
 class DecisionWorker:
@@ -52,11 +57,12 @@ class DecisionWorker:
             failed=DECISION_POLL_FAILED_COUNTER,
             transient_failed=DECISION_POLL_TRANSIENT_FAILED_COUNTER,
             scheduled_to_start=DECISION_SCHEDULED_TO_START_LATENCY,
+            worker_type="DecisionWorker",
         )
         permits = asyncio.Semaphore(
             options["max_concurrent_decision_task_execution_size"]
         )
-        executor = ThreadPoolExecutor(
+        executor = CountingThreadPoolExecutor(
             max_workers=options["max_concurrent_decision_task_execution_size"]
         )
         self._decision_handler = DecisionTaskHandler(
@@ -70,16 +76,40 @@ class DecisionWorker:
             on_start=lambda num_pollers: self._tagged_emitter.counter(
                 POLLER_START_COUNTER, num_pollers
             ),
+            on_backoff=self._poll_metrics.record_backoff,
+            on_permit_wait=lambda wait: self._gauges.record_permit_wait(wait),
+        )
+        self._gauges = WorkerGauges(
+            emitter=self._tagged_emitter,
+            worker_type="DecisionWorker",
+            max_slots=options["max_concurrent_decision_task_execution_size"],
+            poller=self._poller,
+            thread_pool=executor,
         )
+        self._sample_interval = options.get(
+            "metrics_sample_interval",
+            _DEFAULT_WORKER_OPTIONS["metrics_sample_interval"],
+        )
+        self._replay_cost_log_interval = options.get("replay_cost_log_interval")
         # TODO: Sticky poller, actually running workflows, etc.
 
     async def run(self) -> None:
         self._tagged_emitter.counter(WORKER_START_COUNTER)
+        sampler = asyncio.create_task(self._gauges.run(self._sample_interval))
+        background = [sampler]
+        replay_costs = self._decision_handler.replay_costs
+        if replay_costs is not None and self._replay_cost_log_interval is not None:
+            background.append(
+                asyncio.create_task(replay_costs.run(self._replay_cost_log_interval))
+            )
         try:
             await self._poller.run()
         except Exception:
             self._tagged_emitter.counter(WORKER_PANIC_COUNTER)
             raise
+        finally:
+            for task in background:
+                task.cancel()
 
     async def _poll(self) -> Optional[PollForDecisionTaskResponse]:
         async with self._poll_metrics.track():
@@ -5,8 +5,19 @@ from datetime import datetime, timedelta, timezone
 import logging
 from typing import Optional, Sequence
 
+from cadence._internal.workflow.decoded_value_cache import (
+    DecodedValueCache,
+    DecodeStats,
+)
 from cadence._internal.workflow.history_event_iterator import iterate_history_events
 from cadence._internal.context import header_to_dict
+from cadence._internal.tracing import (
+    DECISION_FETCH_HISTORY_SPAN,
+    DECISION_REPLAY_SPAN,
+    DECISION_RESPOND_SPAN,
+    DECISION_TASK_SPAN,
+    create_task_tracer,
+)
 from cadence._internal.workflow.memo import memo_from_proto
 from cadence.api.v1.common_pb2 import Payload
 from cadence.api.v1.decision_pb2 import Decision
@@ -27,13 +38,26 @@ from cadence.metrics import (
     duration_from_nanoseconds,
     MetricsEmitter,
 )
+from cadence.metrics.metrics import TaggedEmitterCache
 from cadence.metrics.constants import (
+    DECISION_CPU_TIME,
     DECISION_EXECUTION_FAILED_COUNTER,
     DECISION_EXECUTION_LATENCY,
+    DECISION_EXECUTOR_QUEUE_LATENCY,
+    DECISION_HISTORY_BYTES_COUNTER,
+    DECISION_HISTORY_EVENTS_COUNTER,
+    DECISION_HISTORY_FETCH_LATENCY,
+    DECISION_NEW_EVENTS_LATENCY,
+    DECISION_PAYLOAD_DECODE_CACHE_HIT_COUNTER,
+    DECISION_PAYLOAD_DECODE_COUNTER,
+    DECISION_PAYLOAD_DECODE_LATENCY,
     DECISION_RESPONSE_FAILED_COUNTER,
+    DECISION_REPLAY_LATENCY,
     DECISION_RESPONSE_LATENCY,
+    DECISION_SERIALIZATION_LATENCY,
     DECISION_TASK_COMPLETED_COUNTER,
     DECISION_TASK_PANIC_COUNTER,
+    DECISION_WORKFLOW_CODE_LATENCY,
     TAG_DOMAIN,
     TAG_TASK_LIST,
     TAG_WORKFLOW_TYPE,
@@ -42,15 +66,19 @@ from cadence.metrics.constants import (
     WORKFLOW_CONTINUE_AS_NEW_COUNTER,
     WORKFLOW_END_TO_END_LATENCY,
     WORKFLOW_FAILED_COUNTER,
+    WORKFLOW_REPLAY_COUNTER,
+    WORKFLOW_REPLAYED_EVENTS_COUNTER,
 )
 from cadence.worker._base_task_handler import BaseTaskHandler
 from cadence._internal.workflow.workflow_engine import (
     WorkflowEngine,
     DecisionResult,
+    DecisionStats,
     _outcome_from_decision,
 )
-from cadence.workflow import WorkflowInfo
+from cadence.workflow import WorkflowDefinition, WorkflowInfo
 from cadence.worker._registry import Registry
+from cadence.worker._replay_cost import ReplayCostTracker, RunKey
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +120,23 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
         super().__init__(client, task_list, identity, **options)
         self._registry = registry
         self._executor = executor
+        self._workflow_emitters = TaggedEmitterCache(
+            self._metrics_emitter, (TAG_WORKFLOW_TYPE, TAG_DOMAIN, TAG_TASK_LIST)
+        )
         self._context_propagators = tuple(options.get("context_propagators", ()))
+        self._cache_decoded_values = bool(
+            options.get("enable_decoded_value_cache", False)
+        )
+        self._replay_costs: Optional[ReplayCostTracker] = None
+        if options.get("replay_cost_log_interval") is not None:
+            self._replay_costs = ReplayCostTracker(options.get("replay_cost_top_n", 10))
+        self._tracer = create_task_tracer(
+            options.get("enable_tracing", False), options.get("tracer_provider")
+        )
+
+    @property
+    def replay_costs(self) -> Optional[ReplayCostTracker]:
+        return self._replay_costs
 
     async def _handle_task_implementation(
         self, task: PollForDecisionTaskResponse
@@ -119,12 +163,9 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
 
         is_query_task = task.HasField("query")
 
-        wf_tags = {
-            TAG_WORKFLOW_TYPE: workflow_type_name,
-            TAG_DOMAIN: self._client.domain,
-            TAG_TASK_LIST: self.task_list,
-        }
-        emitter = self._metrics_emitter.with_tags(wf_tags)
+        emitter = self._workflow_emitters.get(
+            workflow_type_name, self._client.domain, self.task_list
+        )
 
         logger.info(
             "Received decision task for workflow",
@@ -158,11 +199,53 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
                 return
             raise KeyError(f"Workflow type '{workflow_type_name}' not found")
 
+        # Each decision task is its own trace, linked to the workflow starter's
+        # rather than making every task of a long-running workflow its child
+        with self._tracer.span(
+            DECISION_TASK_SPAN,
+            attributes={
+                "cadence.workflow_type": workflow_type_name,
+                "cadence.workflow_id": workflow_id,
+                "cadence.run_id": run_id,
+                "cadence.attempt": task.attempt,
+                "cadence.query": is_query_task,
+            },
+            link_headers=self._started_event_headers(task)
+            if self._tracer.enabled
+            else None,
+        ):
+            await self._process_decision_task(
+                task, workflow_definition, is_query_task, emitter
+            )
+
+    async def _process_decision_task(
+        self,
+        task: PollForDecisionTaskResponse,
+        workflow_definition: WorkflowDefinition,
+        is_query_task: bool,
+        emitter: MetricsEmitter,
+    ) -> None:
+        workflow_id = task.workflow_execution.workflow_id
+        run_id = task.workflow_execution.run_id
+        workflow_type_name = task.workflow_type.name
+
         # fetch full workflow history
         # TODO sticky cache
-        workflow_events = [
-            event async for event in iterate_history_events(task, self._client, emitter)
-        ]
+        fetch_start_ns = time.monotonic_ns()
+        with self._tracer.span(DECISION_FETCH_HISTORY_SPAN):
+            workflow_events = [
+                event
+                async for event in iterate_history_events(task, self._client, emitter)
+            ]
+        emitter.histogram(
+            DECISION_HISTORY_FETCH_LATENCY,
+            duration_from_nanoseconds(time.monotonic_ns() - fetch_start_ns),
+        )
+        emitter.counter(DECISION_HISTORY_EVENTS_COUNTER, len(workflow_events))
+        emitter.counter(
+            DECISION_HISTORY_BYTES_COUNTER,
+            sum(event.ByteSize() for event in workflow_events),
+        )
 
         if not workflow_events:
             raise ValueError(
@@ -193,36 +276,59 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
             memo=memo,
         )
 
-        workflow_engine = WorkflowEngine(
-            info=workflow_info,
-            workflow_definition=workflow_definition,
-            context_propagators=self._context_propagators,
-            headers=header_to_dict(started_attrs.header),
+        decoded_values = DecodedValueCache(
+            self._client.data_converter, enabled=self._cache_decoded_values
         )
-
-        exec_start_ns = time.monotonic_ns()
-        try:
-            decision_result = await asyncio.get_running_loop().run_in_executor(
-                self._executor,
-                workflow_engine.process_decision,
-                workflow_events,
-                task.query if is_query_task else None,
-            )
-        except Exception:
-            emitter.counter(DECISION_EXECUTION_FAILED_COUNTER)
-            emitter.counter(DECISION_TASK_PANIC_COUNTER)
-            raise
-        finally:
-            emitter.histogram(
-                DECISION_EXECUTION_LATENCY,
-                duration_from_nanoseconds(time.monotonic_ns() - exec_start_ns),
+        with self._tracer.span(DECISION_REPLAY_SPAN):
+            decision_stats = DecisionStats()
+            workflow_engine = WorkflowEngine(
+                info=workflow_info,
+                workflow_definition=workflow_definition,
+                context_propagators=self._context_propagators,
+                headers=self._tracer.with_span_headers(
+                    header_to_dict(started_attrs.header)
+                ),
+                decoded_values=decoded_values,
+                stats=decision_stats,
             )
+
+            exec_start_ns = time.monotonic_ns()
+            try:
+                decision_result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    workflow_engine.process_decision,
+                    workflow_events,
+                    task.query if is_query_task else None,
+                )
+            except Exception:
+                emitter.counter(DECISION_EXECUTION_FAILED_COUNTER)
+                emitter.counter(DECISION_TASK_PANIC_COUNTER)
+                raise
+            finally:
+                emitter.histogram(
+                    DECISION_EXECUTION_LATENCY,
+                    duration_from_nanoseconds(time.monotonic_ns() - exec_start_ns),
+                )
+                self._emit_decode_metrics(decoded_values.stats, emitter)
+                self._emit_decision_stats(decision_stats, exec_start_ns, emitter)
+                if self._replay_costs is not None and decision_stats.started_ns:
+                    self._replay_costs.record(
+                        RunKey(workflow_type_name, workflow_id, run_id),
+                        decision_stats.cpu_ns,
+                        len(workflow_events),
+                    )
         if is_query_task:
             if not decision_result.query_result:
                 raise ValueError("Query result is empty")
-            await self._respond_query_task_completed(task, decision_result.query_result)
+            with self._tracer.span(DECISION_RESPOND_SPAN):
+                await self._respond_query_task_completed(
+                    task, decision_result.query_result
+                )
         else:
-            await self._respond_decision_task_completed(task, decision_result, emitter)
+            with self._tracer.span(DECISION_RESPOND_SPAN):
+                await self._respond_decision_task_completed(
+                    task, decision_result, emitter
+                )
             self._emit_workflow_outcome_metrics(
                 decision_result.decisions,
                 duration_between(
@@ -242,6 +348,19 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
             },
         )
 
+    @staticmethod
+    def _started_event_headers(task: PollForDecisionTaskResponse) -> dict[str, bytes]:
+        # The first history page always starts with the started event, which
+        # carries the headers of whoever started the workflow.
+        events = task.history.events
+        if not events or not events[0].HasField(
+            "workflow_execution_started_event_attributes"
+        ):
+            return {}
+        return header_to_dict(
+            events[0].workflow_execution_started_event_attributes.header
+        )
+
     async def handle_task_failure(
         self, task: PollForDecisionTaskResponse, error: Exception
     ) -> None:
@@ -347,6 +466,45 @@ class DecisionTaskHandler(BaseTaskHandler[PollForDecisionTaskResponse]):
         if workflow_duration is not None and workflow_duration >= timedelta(0):
             emitter.histogram(WORKFLOW_END_TO_END_LATENCY, workflow_duration)
 
+    def _emit_decision_stats(
+        self, stats: DecisionStats, submitted_ns: int, emitter: MetricsEmitter
+    ) -> None:
+        if not stats.started_ns:
+            # process_decision never ran, e.g. the executor was shut down
+            return
+        emitter.histogram(
+            DECISION_EXECUTOR_QUEUE_LATENCY,
+            duration_from_nanoseconds(max(stats.started_ns - submitted_ns, 0)),
+        )
+        emitter.histogram(DECISION_CPU_TIME, duration_from_nanoseconds(stats.cpu_ns))
+        emitter.histogram(
+            DECISION_REPLAY_LATENCY, duration_from_nanoseconds(stats.replay_ns)
+        )
+        if stats.replayed_events:
+            emitter.counter(WORKFLOW_REPLAY_COUNTER)
+            emitter.counter(WORKFLOW_REPLAYED_EVENTS_COUNTER, stats.replayed_events)
+        emitter.histogram(
+            DECISION_NEW_EVENTS_LATENCY, duration_from_nanoseconds(stats.new_events_ns)
+        )
+        emitter.histogram(
+            DECISION_WORKFLOW_CODE_LATENCY,
+            duration_from_nanoseconds(stats.workflow_code_ns),
+        )
+        emitter.histogram(
+            DECISION_SERIALIZATION_LATENCY,
+            duration_from_nanoseconds(stats.serialization_ns),
+        )
+
+    def _emit_decode_metrics(self, stats: DecodeStats, emitter: MetricsEmitter) -> None:
+        if stats.decoded:
+            emitter.counter(DECISION_PAYLOAD_DECODE_COUNTER, stats.decoded)
+            emitter.histogram(
+                DECISION_PAYLOAD_DECODE_LATENCY,
+                duration_from_nanoseconds(stats.decode_ns),
+            )
+        if stats.cache_hits:
+            emitter.counter(DECISION_PAYLOAD_DECODE_CACHE_HIT_COUNTER, stats.cache_hits)
+
     async def _respond_decision_task_completed(
         self,
         task: PollForDecisionTaskResponse,
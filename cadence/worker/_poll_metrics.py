@@ -16,6 +16,11 @@ from cadence.metrics import (
     duration_from_nanoseconds,
     MetricsEmitter,
 )
+from cadence.metrics.constants import (
+    POLLER_BACKOFF_GAUGE,
+    POLLER_CONSECUTIVE_FAILURES_GAUGE,
+    TAG_WORKER_TYPE,
+)
 
 
 class PollTask(Protocol):
@@ -34,6 +39,7 @@ class PollMetrics:
     failed: str
     transient_failed: str
     scheduled_to_start: str
+    worker_type: str = ""
 
     @contextlib.asynccontextmanager
     async def track(self) -> AsyncIterator[None]:
@@ -55,6 +61,12 @@ class PollMetrics:
                 duration_from_nanoseconds(time.monotonic_ns() - start),
             )
 
+    def record_backoff(self, failures: int, delay: timedelta) -> None:
+        """Report poll-loop backoff state; both gauges drop to 0 on recovery."""
+        tags = {TAG_WORKER_TYPE: self.worker_type} if self.worker_type else None
+        self.emitter.gauge(POLLER_CONSECUTIVE_FAILURES_GAUGE, failures, tags)
+        self.emitter.gauge(POLLER_BACKOFF_GAUGE, delay.total_seconds(), tags)
+
     def record_result(self, task: PollTask) -> None:
         """Record succeed vs idle and optional schedule-to-start latency."""
         if not (task and task.task_token):
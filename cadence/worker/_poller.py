@@ -1,12 +1,29 @@
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
+from datetime import timedelta
 from typing import Generic, TypeVar
 
+from cadence._internal.rpc.retry import ExponentialRetryPolicy
+from cadence.error import CircuitOpenError, ServiceBusyError
+from cadence.metrics import duration_from_nanoseconds
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Delay between failed polls, keyed on consecutive failures of one poll loop
+DEFAULT_POLL_BACKOFF = ExponentialRetryPolicy(
+    initial_interval=timedelta(milliseconds=100),
+    backoff_coefficient=2,
+    max_interval=timedelta(seconds=10),
+    max_attempts=0,
+    jitter=True,
+)
+# ServiceBusyError means the frontend is shedding load, so never retry sooner
+SERVICE_BUSY_MIN_BACKOFF = timedelta(seconds=1)
+
 
 class Poller(Generic[T]):
     def __init__(
@@ -16,13 +33,36 @@ class Poller(Generic[T]):
         poll: Callable[[], Awaitable[T | None]],
         callback: Callable[[T], Awaitable[None]],
         on_start: Callable[[int], None] | None = None,
+        backoff: ExponentialRetryPolicy = DEFAULT_POLL_BACKOFF,
+        on_backoff: Callable[[int, timedelta], None] | None = None,
+        on_permit_wait: Callable[[timedelta], None] | None = None,
     ) -> None:
         self._num_tasks = num_tasks
         self._permits = permits
         self._poll = poll
         self._callback = callback
         self._on_start = on_start
+        self._backoff = backoff
+        # Called with (consecutive failures, delay) before sleeping, and (0, 0) on recovery
+        self._on_backoff = on_backoff
+        # Called with the time each poll loop waited for an execution permit
+        self._on_permit_wait = on_permit_wait
         self._background_tasks: set[asyncio.Task[None]] = set()
+        self._active_pollers = 0
+        self._held_permits = 0
+
+    @property
+    def active_pollers(self) -> int:
+        return self._active_pollers
+
+    @property
+    def in_flight_tasks(self) -> int:
+        return len(self._background_tasks)
+
+    @property
+    def held_permits(self) -> int:
+        """Permits held by polls in progress and by tasks being executed."""
+        return self._held_permits
 
     async def run(self) -> None:
         try:
@@ -35,24 +75,58 @@ class Poller(Generic[T]):
             pass
 
     async def _poll_loop(self) -> None:
+        self._active_pollers += 1
+        try:
+            await self._poll_until_cancelled()
+        finally:
+            self._active_pollers -= 1
+
+    async def _poll_until_cancelled(self) -> None:
+        failures = 0
         while True:
             try:
                 await self._poll_and_dispatch()
             except asyncio.CancelledError as e:
                 raise e
+            except CircuitOpenError as e:
+                # Wait for the breaker to half-open instead of spinning on rejections
+                logger.debug("Poll rejected by open circuit breaker: %s", e.method)
+                delay = max(e.retry_after, self._backoff.initial_interval)
+            except ServiceBusyError:
+                failures += 1
+                delay = max(self._next_delay(failures), SERVICE_BUSY_MIN_BACKOFF)
+                logger.warning("Service busy while polling, backing off for %s", delay)
             except Exception:
-                logger.exception("Exception while polling")
+                failures += 1
+                delay = self._next_delay(failures)
+                logger.exception("Exception while polling, backing off for %s", delay)
+            else:
+                if failures:
+                    failures = 0
+                    self._report_backoff(0, timedelta(0))
+                continue
+
+            self._report_backoff(failures, delay)
+            await asyncio.sleep(delay.total_seconds())
+
+    def _next_delay(self, failures: int) -> timedelta:
+        delay = self._backoff.next_delay(failures, timedelta(0), None)
+        return delay if delay is not None else self._backoff.max_interval
+
+    def _report_backoff(self, failures: int, delay: timedelta) -> None:
+        if self._on_backoff is not None:
+            self._on_backoff(failures, delay)
 
     async def _poll_and_dispatch(self) -> None:
-        await self._permits.acquire()
+        await self._acquire_permit()
         try:
             task = await self._poll()
         except Exception as e:
-            self._permits.release()
+            self._release_permit()
             raise e
 
         if task is None:
-            self._permits.release()
+            self._release_permit()
             return
 
         # Need to store a reference to the async task or it may be garbage collected
@@ -66,4 +140,17 @@ class Poller(Generic[T]):
         except Exception:
             logger.exception("Exception during callback")
         finally:
-            self._permits.release()
+            self._release_permit()
+
+    async def _acquire_permit(self) -> None:
+        if self._on_permit_wait is None:
+            await self._permits.acquire()
+        else:
+            start = time.monotonic_ns()
+            await self._permits.acquire()
+            self._on_permit_wait(duration_from_nanoseconds(time.monotonic_ns() - start))
+        self._held_permits += 1
+
+    def _release_permit(self) -> None:
+        self._held_permits -= 1
+        self._permits.release()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class RunKey(NamedTuple):
+    workflow_type: str
+    workflow_id: str
+    run_id: str
+
+
+@dataclass
+class RunCost:
+    cpu_ns: int = 0
+    events: int = 0
+    decision_tasks: int = 0
+
+
+class ReplayCostTracker:
+    """Accumulates decision CPU time per workflow run and logs the heaviest runs.
+
+    Runs that keep replaying long histories show up here first, which makes them
+    candidates for continue-as-new. Costs are reset every time they are logged.
+    """
+
+    def __init__(self, top_n: int = 10) -> None:
+        self._top_n = top_n
+        self._lock = threading.Lock()
+        self._costs: dict[RunKey, RunCost] = {}
+
+    def record(self, key: RunKey, cpu_ns: int, events: int) -> None:
+        with self._lock:
+            cost = self._costs.get(key)
+            if cost is None:
+                cost = self._costs[key] = RunCost()
+            cost.cpu_ns += cpu_ns
+            cost.events += events
+            cost.decision_tasks += 1
+
+    def heaviest(self, reset: bool = False) -> list[tuple[RunKey, RunCost]]:
+        with self._lock:
+            items = list(self._costs.items())
+            if reset:
+                self._costs = {}
+        return heapq.nlargest(self._top_n, items, key=lambda item: item[1].cpu_ns)
+
+    def log_heaviest(self) -> None:
+        """Log the runs with the most CPU time since the last call, then reset."""
+        for key, cost in self.heaviest(reset=True):
+            logger.info(
+                "Workflow run decision cost",
+                extra={
+                    "workflow_type": key.workflow_type,
+                    "workflow_id": key.workflow_id,
+                    "run_id": key.run_id,
+                    "cpu_ms": cost.cpu_ns / 1_000_000,
+                    "events": cost.events,
+                    "decision_tasks": cost.decision_tasks,
+                },
+            )
+
+    async def run(self, interval: timedelta) -> None:
+        """Log the heaviest runs every interval until cancelled."""
+        while True:
+            await asyncio.sleep(interval.total_seconds())
+            self.log_heaviest()
@@ -4,6 +4,8 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, Sequence, TypedDict
 
 if TYPE_CHECKING:
+    from opentelemetry.trace import TracerProvider
+
     from cadence.context import ContextPropagator
     from cadence.metrics import MetricsEmitter
 
@@ -20,6 +22,29 @@ class WorkerOptions(TypedDict, total=False):
     identity: str
     metrics_emitter: MetricsEmitter
     context_propagators: Sequence[ContextPropagator]
+    # Memoize immutable activity results and marker values decoded during replay
+    enable_decoded_value_cache: bool
+    # Serve Prometheus metrics over HTTP on this port while the worker runs. With
+    # PROMETHEUS_MULTIPROC_DIR set, the first process to bind it serves the metrics
+    # of every worker process on the host until it exits; the others do not take
+    # the port over. Otherwise it serves the registry of metrics_emitter.
+    metrics_server_port: int | None
+    metrics_server_address: str
+    # How often task slot, poller and thread pool gauges are sampled
+    metrics_sample_interval: timedelta
+    # Sample the stacks of decision tasks and sync activities at this interval,
+    # attributed to their workflow or activity type. Disabled when None.
+    profiler_sample_interval: timedelta | None
+    # Write the collapsed profiler stacks to this file when the worker closes
+    profiler_output_path: str | None
+    # Log the workflow runs with the most decision CPU time at this interval.
+    # Disabled when None.
+    replay_cost_log_interval: timedelta | None
+    replay_cost_top_n: int
+    # Record OpenTelemetry spans for decision and activity tasks. Requires
+    # opentelemetry-api; uses the global tracer provider unless one is given.
+    enable_tracing: bool
+    tracer_provider: TracerProvider | None
 
 
 _DEFAULT_WORKER_OPTIONS: WorkerOptions = {
@@ -31,6 +56,16 @@ _DEFAULT_WORKER_OPTIONS: WorkerOptions = {
     "disable_workflow_worker": False,
     "disable_activity_worker": False,
     "context_propagators": (),
+    "enable_decoded_value_cache": False,
+    "metrics_server_port": None,
+    "metrics_server_address": "0.0.0.0",
+    "metrics_sample_interval": timedelta(seconds=10),
+    "profiler_sample_interval": None,
+    "profiler_output_path": None,
+    "replay_cost_log_interval": None,
+    "replay_cost_top_n": 10,
+    "enable_tracing": False,
+    "tracer_provider": None,
 }
 
 _LONG_POLL_TIMEOUT = timedelta(seconds=60)
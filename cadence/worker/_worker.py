@@ -4,11 +4,13 @@ import uuid
 from typing import Unpack, cast
 
 from cadence.client import Client
+from cadence.metrics import PrometheusExporter, emitter_registry, mark_process_dead
 from cadence.worker._registry import Registry
 from cadence.worker._activity import ActivityWorker
 from cadence.worker._decision import DecisionWorker
 from cadence.worker._types import WorkerOptions, _DEFAULT_WORKER_OPTIONS
 from cadence._internal.context import validate_propagators
+from cadence._internal.profiler import SamplingProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,16 @@ class Worker:
         self._options = options
         self._activity_worker = ActivityWorker(client, task_list, registry, options)
         self._decision_worker = DecisionWorker(client, task_list, registry, options)
+        self._metrics_exporter: PrometheusExporter | None = None
+        if options["metrics_server_port"] is not None:
+            self._metrics_exporter = PrometheusExporter(
+                options["metrics_server_port"],
+                options["metrics_server_address"],
+                emitter_registry(options["metrics_emitter"]),
+            )
+        self._profiler: SamplingProfiler | None = None
+        if options["profiler_sample_interval"] is not None:
+            self._profiler = SamplingProfiler(options["profiler_sample_interval"])
 
     @property
     def client(self) -> Client:
@@ -39,7 +51,16 @@ class Worker:
     def task_list(self) -> str:
         return self._task_list
 
+    @property
+    def profiler(self) -> SamplingProfiler | None:
+        """The sampling profiler, when enabled via ``profiler_sample_interval``."""
+        return self._profiler
+
     async def run(self) -> None:
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.start()
+        if self._profiler is not None:
+            self._profiler.start()
         if not self._options["disable_workflow_worker"]:
             self._tasks.append(asyncio.create_task(self._decision_worker.run()))
         if not self._options["disable_activity_worker"]:
@@ -54,6 +75,14 @@ class Worker:
                 result, asyncio.CancelledError
             ):
                 logger.error("Worker task failed", exc_info=result)
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.stop()
+        # This process's live gauges would otherwise stay in the merged metrics
+        mark_process_dead()
+        if self._profiler is not None:
+            self._profiler.stop()
+            if self._options["profiler_output_path"] is not None:
+                self._profiler.dump(self._options["profiler_output_path"])
 
     async def __aenter__(self) -> "Worker":
         await self.run()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from cadence._internal.concurrency import CountingThreadPoolExecutor
+from cadence.metrics import BoundMetric, MetricsEmitter, bind_metric
+from cadence.metrics.constants import (
+    POLLER_ACTIVE_GAUGE,
+    TAG_WORKER_TYPE,
+    WORKER_IN_FLIGHT_TASKS_GAUGE,
+    WORKER_PERMIT_WAIT_LATENCY,
+    WORKER_TASK_SLOTS_AVAILABLE_GAUGE,
+    WORKER_TASK_SLOTS_USED_GAUGE,
+    WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE,
+)
+from cadence.worker._poller import Poller
+
+
+@dataclass
+class WorkerGauges:
+    emitter: MetricsEmitter  # should be pre-tagged via emitter.with_tags(...)
+    worker_type: str
+    max_slots: int
+    poller: Poller[Any]
+    thread_pool: CountingThreadPoolExecutor | None = None
+    _metrics: dict[str, BoundMetric] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        tags = {TAG_WORKER_TYPE: self.worker_type}
+        self._metrics = {
+            key: bind_metric(self.emitter, key, tags)
+            for key in (
+                POLLER_ACTIVE_GAUGE,
+                WORKER_TASK_SLOTS_AVAILABLE_GAUGE,
+                WORKER_TASK_SLOTS_USED_GAUGE,
+                WORKER_IN_FLIGHT_TASKS_GAUGE,
+                WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE,
+                WORKER_PERMIT_WAIT_LATENCY,
+            )
+        }
+
+    def sample(self) -> None:
+        """Report slot usage, poll loops and queued thread pool work."""
+        metrics = self._metrics
+        # Polls in progress hold a slot too, so used may exceed in-flight tasks
+        used = self.poller.held_permits
+        metrics[WORKER_TASK_SLOTS_USED_GAUGE].gauge(used)
+        metrics[WORKER_TASK_SLOTS_AVAILABLE_GAUGE].gauge(self.max_slots - used)
+        metrics[WORKER_IN_FLIGHT_TASKS_GAUGE].gauge(self.poller.in_flight_tasks)
+        metrics[POLLER_ACTIVE_GAUGE].gauge(self.poller.active_pollers)
+        if self.thread_pool is not None:
+            metrics[WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE].gauge(self.thread_pool.queued)
+
+    def record_permit_wait(self, wait: timedelta) -> None:
+        self._metrics[WORKER_PERMIT_WAIT_LATENCY].histogram(wait)
+
+    async def run(self, interval: timedelta) -> None:
+        """Sample every interval until cancelled."""
+        while True:
+            self.sample()
+            await asyncio.sleep(interval.total_seconds())
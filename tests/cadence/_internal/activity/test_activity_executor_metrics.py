@@ -262,3 +262,19 @@ class TestActivityExecutionFailure:
         await executor.execute(_make_task())
 
         emitter.with_tags.assert_called_once_with(EXPECTED_TAGS)
+
+    @pytest.mark.asyncio
+    async def test_tagged_emitter_reused_across_tasks(self):
+        emitter = _mock_emitter()
+        reg = Registry()
+
+        @reg.activity(name=ACTIVITY_TYPE)
+        async def my_activity():
+            return "done"
+
+        executor = _make_executor(emitter, reg)
+        await executor.execute(_make_task())
+        await executor.execute(_make_task())
+
+        emitter.with_tags.assert_called_once_with(EXPECTED_TAGS)
+        assert _tagged(emitter).counter.call_count == 2
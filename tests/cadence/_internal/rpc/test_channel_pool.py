@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from cadence._internal.rpc.channel_pool import (
+    GET_WORKFLOW_HISTORY,
+    POLL_FOR_DECISION_TASK,
+    ChannelPool,
+)
+from cadence._internal.rpc.hedging import Hedger, HedgedMultiCallable, HedgingPolicy
+from cadence.api.v1.service_workflow_pb2 import GetWorkflowExecutionHistoryRequest
+
+RESPOND = "/uber.cadence.api.v1.WorkerAPI/RespondDecisionTaskCompleted"
+DESCRIBE = "/uber.cadence.api.v1.WorkflowAPI/DescribeWorkflowExecution"
+
+
+def _channel(name: str) -> Mock:
+    channel = Mock()
+    channel.unary_unary.side_effect = lambda method, **kwargs: Mock(
+        side_effect=lambda request, **kw: (name, method)
+    )
+    channel.channel_ready = AsyncMock()
+    channel.close = AsyncMock()
+    return channel
+
+
+def test_round_robins_across_channels():
+    pool = ChannelPool([_channel("a"), _channel("b")])
+    call = pool.unary_unary(RESPOND)
+
+    assert [call(object())[0] for _ in range(4)] == ["a", "b", "a", "b"]
+
+
+def test_long_polls_use_dedicated_channels():
+    pool = ChannelPool([_channel("short")], [_channel("long-1"), _channel("long-2")])
+
+    poll = pool.unary_unary(POLL_FOR_DECISION_TASK)
+    respond = pool.unary_unary(RESPOND)
+    history = pool.unary_unary(GET_WORKFLOW_HISTORY)
+
+    assert [poll(object())[0] for _ in range(2)] == ["long-1", "long-2"]
+    assert respond(object())[0] == "short"
+    assert history(GetWorkflowExecutionHistoryRequest())[0] == "short"
+    assert (
+        history(GetWorkflowExecutionHistoryRequest(wait_for_new_event=True))[0]
+        == "long-1"
+    )
+
+
+def test_passes_call_arguments_through():
+    channel = _channel("a")
+    pool = ChannelPool([channel])
+    serializer = Mock()
+
+    pool.unary_unary(RESPOND, request_serializer=serializer)(object(), timeout=5)
+
+    channel.unary_unary.assert_called_once_with(
+        RESPOND,
+        request_serializer=serializer,
+        response_deserializer=None,
+        _registered_method=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ready_and_close_cover_every_channel():
+    channels = [_channel("a"), _channel("b"), _channel("long")]
+    pool = ChannelPool(channels[:2], channels[2:])
+
+    await pool.channel_ready()
+    await pool.close()
+
+    for channel in channels:
+        channel.channel_ready.assert_awaited_once()
+        channel.close.assert_awaited_once_with(None)
+
+
+def test_hedged_methods_use_the_hedger():
+    hedger = Hedger({"DescribeWorkflowExecution": HedgingPolicy()})
+    pool = ChannelPool([_channel("a"), _channel("b")], hedger=hedger)
+
+    assert isinstance(pool.unary_unary(DESCRIBE), HedgedMultiCallable)
+    assert not isinstance(pool.unary_unary(RESPOND), HedgedMultiCallable)
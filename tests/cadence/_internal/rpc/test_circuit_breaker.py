@@ -0,0 +1,176 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from grpc import StatusCode
+from grpc.aio import ClientCallDetails
+
+from cadence._internal.rpc.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerInterceptor,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from cadence.error import CadenceRpcError, CircuitOpenError
+
+POLICY = CircuitBreakerPolicy(
+    failure_rate_threshold=0.5,
+    window_size=4,
+    minimum_calls=4,
+    open_duration=timedelta(seconds=5),
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    # Read through a call so mypy does not narrow the state between transitions
+    return breaker.state
+
+
+def test_opens_at_failure_rate_and_half_opens_after_duration():
+    clock = FakeClock()
+    breaker = CircuitBreaker(POLICY, clock)
+
+    for failed in (False, True, False):
+        assert breaker.allow()
+        assert not breaker.record(failed)
+    assert breaker.allow()
+    assert breaker.record(True)
+    assert _state(breaker) is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == timedelta(seconds=5)
+
+    clock.now = 5
+    assert breaker.allow()
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record(False)
+    assert _state(breaker) is CircuitState.CLOSED
+
+
+def test_half_open_rejections_wait_for_the_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(POLICY, clock)
+    for _ in range(4):
+        breaker.record(True)
+
+    clock.now = 5
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    # Rejected callers must not retry immediately while the probe is in flight
+    assert breaker.retry_after() == POLICY.open_duration
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(POLICY, clock)
+    for _ in range(4):
+        breaker.record(True)
+
+    clock.now = 5
+    assert breaker.allow()
+    assert breaker.record(True)
+    assert _state(breaker) is CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_window_forgets_old_failures():
+    breaker = CircuitBreaker(POLICY, FakeClock())
+    breaker.record(True)
+    for _ in range(4):
+        assert not breaker.record(False)
+    breaker.record(True)
+    assert _state(breaker) is CircuitState.CLOSED
+
+
+class FakeCall:
+    def __init__(self, error: CadenceRpcError | None) -> None:
+        self._error = error
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    async def _wait(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+def _details() -> ClientCallDetails:
+    return ClientCallDetails(
+        method="/uber.cadence.api.v1.WorkerAPI/PollForDecisionTask",
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_interceptor_fails_fast_while_open():
+    emitter = Mock()
+    interceptor = CircuitBreakerInterceptor(POLICY, emitter)
+    calls = 0
+
+    async def continuation(call_details, request):
+        nonlocal calls
+        calls += 1
+        return FakeCall(CadenceRpcError("busy", StatusCode.RESOURCE_EXHAUSTED))
+
+    for _ in range(4):
+        call = await interceptor.intercept_unary_unary(continuation, _details(), None)
+        with pytest.raises(CadenceRpcError):
+            await call
+
+    rejected = await interceptor.intercept_unary_unary(continuation, _details(), None)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await rejected
+
+    assert calls == 4
+    assert exc_info.value.method == "PollForDecisionTask"
+    assert exc_info.value.code == StatusCode.UNAVAILABLE
+    assert [c.args[0] for c in emitter.counter.call_args_list] == [
+        "cadence-PollForDecisionTask.cadence-circuit-open",
+        "cadence-PollForDecisionTask.cadence-circuit-rejected",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_interceptor_ignores_request_errors():
+    interceptor = CircuitBreakerInterceptor(POLICY)
+
+    async def continuation(call_details, request):
+        return FakeCall(CadenceRpcError("bad", StatusCode.INVALID_ARGUMENT))
+
+    for _ in range(10):
+        call = await interceptor.intercept_unary_unary(continuation, _details(), None)
+        with pytest.raises(CadenceRpcError):
+            await call
+
+    assert _state(interceptor.breaker("PollForDecisionTask")) is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_interceptor_returns_probe_when_continuation_raises():
+    interceptor = CircuitBreakerInterceptor(
+        CircuitBreakerPolicy(window_size=1, minimum_calls=1, open_duration=timedelta(0))
+    )
+    breaker = interceptor.breaker("PollForDecisionTask")
+    breaker.record(True)
+
+    async def continuation(call_details, request):
+        raise RuntimeError("channel closed")
+
+    with pytest.raises(RuntimeError):
+        await interceptor.intercept_unary_unary(continuation, _details(), None)
+
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    assert breaker.allow()
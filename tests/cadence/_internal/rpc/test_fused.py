@@ -0,0 +1,335 @@
+import asyncio
+from concurrent import futures
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, call
+
+import pytest
+from google.protobuf import any_pb2
+from google.rpc import code_pb2, status_pb2
+from grpc import StatusCode, server
+from grpc.aio import AioRpcError, ClientCallDetails, Metadata, insecure_channel
+from grpc_status.rpc_status import to_status
+
+from cadence._internal.rpc.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from cadence._internal.rpc.fused import FusedInterceptor
+from cadence._internal.rpc.retry import ExponentialRetryPolicy, RetryBudget
+from cadence.api.v1 import error_pb2, service_workflow_pb2_grpc
+from cadence.api.v1.service_workflow_pb2 import (
+    DescribeWorkflowExecutionRequest,
+    DescribeWorkflowExecutionResponse,
+)
+from cadence.error import (
+    CadenceRpcError,
+    CircuitOpenError,
+    FeatureNotEnabledError,
+)
+
+TEST_POLICY = ExponentialRetryPolicy(
+    initial_interval=timedelta(milliseconds=1),
+    backoff_coefficient=1,
+    max_interval=timedelta(milliseconds=10),
+    max_attempts=5,
+)
+
+OPERATION = "DescribeWorkflowExecution"
+
+
+def _metric(name: str) -> str:
+    return f"cadence-{OPERATION}.cadence-{name}"
+
+
+class FakeService(service_workflow_pb2_grpc.WorkflowAPIServicer):
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.metadata: list[dict[str, str]] = []
+        self.deadlines: list[float | None] = []
+
+    def DescribeWorkflowExecution(self, request, context):
+        self.calls[request.domain] = self.calls.get(request.domain, 0) + 1
+        self.metadata.append(dict(context.invocation_metadata()))
+        self.deadlines.append(context.time_remaining())
+        if request.domain == "success":
+            return DescribeWorkflowExecutionResponse()
+        if request.domain == "retry-success" and self.calls[request.domain] >= 3:
+            return DescribeWorkflowExecutionResponse()
+
+        detail = any_pb2.Any()
+        detail.Pack(error_pb2.FeatureNotEnabledError(feature_flag="flag"))
+        context.abort_with_status(
+            to_status(
+                status_pb2.Status(
+                    code=(
+                        code_pb2.PERMISSION_DENIED
+                        if request.domain == "fail"
+                        else code_pb2.UNAVAILABLE
+                    ),
+                    message="nope",
+                    details=[detail],
+                )
+            )
+        )
+
+
+@pytest.fixture
+def fake_service():
+    svc = FakeService()
+    sync_server = server(futures.ThreadPoolExecutor(max_workers=1))
+    service_workflow_pb2_grpc.add_WorkflowAPIServicer_to_server(svc, sync_server)
+    port = sync_server.add_insecure_port("[::]:0")
+    sync_server.start()
+    yield svc, port
+    sync_server.stop(grace=None)
+
+
+async def _describe(port: int, interceptor: FusedInterceptor, domain: str) -> Any:
+    interceptors: list[Any] = [interceptor]
+    async with insecure_channel(f"[::]:{port}", interceptors=interceptors) as channel:
+        stub = service_workflow_pb2_grpc.WorkflowAPIStub(channel)
+        return await stub.DescribeWorkflowExecution(
+            DescribeWorkflowExecutionRequest(domain=domain)
+        )
+
+
+@pytest.mark.asyncio
+async def test_success_adds_yarpc_metadata_and_default_timeout(fake_service):
+    service, port = fake_service
+    emitter = MagicMock()
+    interceptor = FusedInterceptor("cadence-frontend", "caller", emitter)
+
+    response = await _describe(port, interceptor, "success")
+
+    assert response == DescribeWorkflowExecutionResponse()
+    metadata = service.metadata[0]
+    assert metadata["rpc-service"] == "cadence-frontend"
+    assert metadata["rpc-caller"] == "caller"
+    assert metadata["rpc-encoding"] == "proto"
+    assert metadata["cadence-caller-type"] == "sdk"
+    # The server's deadline clock is coarse and can overshoot by ~100ms
+    assert 59 < service.deadlines[0] < 61
+    emitter.counter.assert_called_once_with(_metric("request"))
+    emitter.histogram.assert_called_once()
+    assert emitter.histogram.call_args[0][0] == _metric("latency_ns")
+
+
+@pytest.mark.asyncio
+async def test_error_is_mapped(fake_service):
+    service, port = fake_service
+    emitter = MagicMock()
+    interceptor = FusedInterceptor("svc", "caller", emitter, retry_policy=TEST_POLICY)
+
+    with pytest.raises(FeatureNotEnabledError) as exc_info:
+        await _describe(port, interceptor, "fail")
+
+    assert exc_info.value.code == StatusCode.PERMISSION_DENIED
+    assert service.calls["fail"] == 1
+    assert emitter.counter.call_args_list == [
+        call(_metric("request")),
+        call(_metric("error")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retries_with_per_attempt_metrics(fake_service):
+    service, port = fake_service
+    emitter = MagicMock()
+    interceptor = FusedInterceptor(
+        "svc", "caller", emitter, retry_policy=TEST_POLICY, budget=RetryBudget()
+    )
+
+    await _describe(port, interceptor, "retry-success")
+
+    assert service.calls["retry-success"] == 3
+    counters = emitter.counter.call_args_list
+    assert counters.count(call(_metric("request"))) == 3
+    assert counters.count(call(_metric("error"))) == 2
+    assert counters.count(call(_metric("retry"))) == 2
+    assert emitter.histogram.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_method_policy_none_disables_retries(fake_service):
+    service, port = fake_service
+    interceptor = FusedInterceptor(
+        "svc",
+        "caller",
+        MagicMock(),
+        retry_policy=TEST_POLICY,
+        method_policies={OPERATION: None},
+    )
+
+    with pytest.raises(CadenceRpcError) as exc_info:
+        await _describe(port, interceptor, "unavailable")
+
+    assert exc_info.value.code == StatusCode.UNAVAILABLE
+    assert service.calls["unavailable"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_exhausted(fake_service):
+    service, port = fake_service
+    emitter = MagicMock()
+    budget = RetryBudget(max_tokens=2, token_ratio=0.1)
+    interceptor = FusedInterceptor(
+        "svc", "caller", emitter, retry_policy=TEST_POLICY, budget=budget
+    )
+
+    with pytest.raises(CadenceRpcError):
+        await _describe(port, interceptor, "unavailable")
+
+    assert service.calls["unavailable"] == 1
+    emitter.counter.assert_any_call(_metric("retry-budget-exhausted"))
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_rejects_while_open(fake_service):
+    service, port = fake_service
+    emitter = MagicMock()
+    interceptor = FusedInterceptor(
+        "svc",
+        "caller",
+        emitter,
+        method_policies={OPERATION: None},
+        circuit_breaker=CircuitBreakerPolicy(window_size=2, minimum_calls=2),
+    )
+
+    for _ in range(2):
+        with pytest.raises(CadenceRpcError):
+            await _describe(port, interceptor, "unavailable")
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await _describe(port, interceptor, "unavailable")
+
+    assert exc_info.value.method == OPERATION
+    assert service.calls["unavailable"] == 2
+    emitter.counter.assert_any_call(_metric("circuit-open"))
+    emitter.counter.assert_any_call(_metric("circuit-rejected"))
+
+
+class _CompletedCall:
+    def __await__(self):
+        return self._result().__await__()
+
+    async def _result(self) -> DescribeWorkflowExecutionResponse:
+        return DescribeWorkflowExecutionResponse()
+
+
+@pytest.mark.asyncio
+async def test_latency_includes_starting_the_call():
+    emitter = MagicMock()
+    interceptor = FusedInterceptor("svc", "caller", emitter)
+
+    async def continuation(call_details, request):
+        # e.g. waiting for the channel to connect
+        await asyncio.sleep(0.05)
+        return _CompletedCall()
+
+    await interceptor.intercept_unary_unary(
+        continuation,
+        ClientCallDetails(
+            method="/uber.cadence.api.v1.WorkflowAPI/DescribeWorkflowExecution",
+            timeout=None,
+            metadata=None,
+            credentials=None,
+            wait_for_ready=None,
+        ),
+        DescribeWorkflowExecutionRequest(),
+    )
+
+    name, latency = emitter.histogram.call_args[0]
+    assert name == _metric("latency_ns")
+    assert latency >= timedelta(milliseconds=50)
+
+
+DESCRIBE = "/uber.cadence.api.v1.WorkflowAPI/DescribeWorkflowExecution"
+
+
+def _half_open_interceptor(**kwargs: Any) -> tuple[FusedInterceptor, CircuitBreaker]:
+    interceptor = FusedInterceptor(
+        "svc",
+        "caller",
+        MagicMock(),
+        circuit_breaker=CircuitBreakerPolicy(
+            window_size=1, minimum_calls=1, open_duration=timedelta(0)
+        ),
+        **kwargs,
+    )
+    rpc_breaker = interceptor._method_state(DESCRIBE).breaker
+    assert rpc_breaker is not None
+    # Opened with no open duration, so the next call is the half-open probe
+    rpc_breaker.breaker.record(True)
+    return interceptor, rpc_breaker.breaker
+
+
+def _call_details() -> ClientCallDetails:
+    return ClientCallDetails(
+        method=DESCRIBE,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+    )
+
+
+class _UnavailableCall:
+    def __await__(self):
+        return self._result().__await__()
+
+    async def _result(self) -> None:
+        raise AioRpcError(StatusCode.UNAVAILABLE, Metadata(), Metadata(), "down", None)
+
+
+@pytest.mark.asyncio
+async def test_probe_cancelled_during_backoff_is_discarded():
+    slow_retries = ExponentialRetryPolicy(
+        initial_interval=timedelta(seconds=10),
+        backoff_coefficient=1,
+        max_interval=timedelta(seconds=10),
+        max_attempts=0,
+    )
+    interceptor, breaker = _half_open_interceptor(
+        retry_policy=slow_retries, budget=None
+    )
+    attempted = asyncio.Event()
+
+    async def continuation(call_details, request):
+        attempted.set()
+        return _UnavailableCall()
+
+    probe = asyncio.create_task(
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(), DescribeWorkflowExecutionRequest()
+        )
+    )
+    await attempted.wait()
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_probe_is_discarded_when_continuation_raises():
+    interceptor, breaker = _half_open_interceptor()
+
+    async def continuation(call_details, request):
+        raise RuntimeError("channel closed")
+
+    with pytest.raises(RuntimeError):
+        await interceptor.intercept_unary_unary(
+            continuation, _call_details(), DescribeWorkflowExecutionRequest()
+        )
+
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    assert breaker.allow()
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    # Read through a call so mypy does not narrow the state between transitions
+    return breaker.state
@@ -0,0 +1,243 @@
+import asyncio
+import gc
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from grpc import StatusCode
+
+from cadence._internal.rpc.hedging import (
+    HedgeDelay,
+    Hedger,
+    HedgingPolicy,
+)
+from cadence._internal.rpc.metrics import _extract_method_name
+from cadence.api.v1.service_workflow_pb2 import GetWorkflowExecutionHistoryRequest
+from cadence.error import CadenceRpcError
+from cadence.metrics import NoOpMetricsEmitter
+
+DESCRIBE = "/uber.cadence.api.v1.WorkflowAPI/DescribeWorkflowExecution"
+HISTORY = "/uber.cadence.api.v1.WorkflowAPI/GetWorkflowExecutionHistory"
+QUERY = "/uber.cadence.api.v1.WorkflowAPI/QueryWorkflow"
+
+POLICY = HedgingPolicy(
+    initial_delay=timedelta(milliseconds=20),
+    min_delay=timedelta(milliseconds=1),
+)
+
+
+class FakeCall:
+    def __init__(
+        self, delay: float, result: Any = None, error: Exception | None = None
+    ):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.cancelled = False
+        self.kwargs: dict[str, Any] = {}
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    def cancel(self) -> bool:
+        self.cancelled = True
+        return True
+
+    async def _wait(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _callables(calls: list[FakeCall], channels: int = 2):
+    """One callable per channel, recording which channel sent each call."""
+    sent: list[tuple[int, FakeCall]] = []
+
+    def channel(index: int):
+        def callable_(request, **kwargs):
+            call = calls[len(sent)]
+            call.kwargs = kwargs
+            sent.append((index, call))
+            return call
+
+        return callable_
+
+    return [channel(i) for i in range(channels)], sent
+
+
+def _hedged(
+    calls: list[FakeCall],
+    emitter: Any = None,
+    method: str = DESCRIBE,
+    policy: HedgingPolicy = POLICY,
+):
+    callables, sent = _callables(calls)
+    hedger = Hedger(
+        {_extract_method_name(method): policy},
+        emitter if emitter is not None else NoOpMetricsEmitter(),
+    )
+    multi_callable = hedger.multi_callable(method, callables)
+    assert multi_callable is not None
+    return multi_callable, sent
+
+
+def test_delay_uses_percentile_of_recent_latencies():
+    policy = HedgingPolicy(min_samples=10, max_delay=timedelta(seconds=10))
+    delay = HedgeDelay(policy)
+    assert delay.delay() == timedelta(milliseconds=100)
+
+    for latency in range(1, 21):
+        delay.record(timedelta(milliseconds=latency * 100))
+
+    assert delay.delay() == timedelta(milliseconds=1900)
+
+
+def test_delay_is_clamped():
+    delay = HedgeDelay(HedgingPolicy(min_samples=1))
+    delay.record(timedelta(seconds=30))
+    assert delay.delay() == timedelta(seconds=1)
+
+
+def test_only_idempotent_methods_can_be_hedged():
+    with pytest.raises(ValueError, match="StartWorkflowExecution"):
+        Hedger({"StartWorkflowExecution": HedgingPolicy()})
+
+
+def test_policy_requires_a_hedge():
+    with pytest.raises(ValueError, match="max_attempts"):
+        HedgingPolicy(max_attempts=1)
+
+
+def test_unhedged_method_has_no_multi_callable():
+    hedger = Hedger({"DescribeWorkflowExecution": POLICY})
+    assert hedger.multi_callable(QUERY, []) is None
+
+
+@pytest.mark.asyncio
+async def test_fast_call_is_not_hedged():
+    emitter = MagicMock()
+    hedged, sent = _hedged([FakeCall(0, "primary")], emitter)
+
+    assert await hedged(None, timeout=10) == "primary"
+    assert len(sent) == 1
+    emitter.counter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_on_another_channel_and_loser_cancelled():
+    emitter = MagicMock()
+    slow = FakeCall(5, "primary")
+    hedged, sent = _hedged([slow, FakeCall(0, "hedge")], emitter)
+
+    assert await hedged(None, timeout=10) == "hedge"
+    await asyncio.sleep(0)
+
+    assert [channel for channel, _ in sent] == [0, 1]
+    assert sent[1][1].kwargs["timeout"] < 10
+    assert slow.cancelled
+    assert [c.args[0] for c in emitter.counter.call_args_list] == [
+        "cadence-DescribeWorkflowExecution.cadence-hedge",
+        "cadence-DescribeWorkflowExecution.cadence-hedge-won",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calls_start_on_successive_channels():
+    hedged, sent = _hedged([FakeCall(0, "a"), FakeCall(0, "b")])
+
+    await hedged(None)
+    await hedged(None)
+
+    assert [channel for channel, _ in sent] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_retryable_failure_hedges_only_after_the_delay():
+    policy = HedgingPolicy(
+        initial_delay=timedelta(milliseconds=50),
+        min_delay=timedelta(milliseconds=1),
+    )
+    first = CadenceRpcError("first", StatusCode.UNAVAILABLE)
+    hedged, sent = _hedged(
+        [FakeCall(0, error=first), FakeCall(0, "hedge")], policy=policy
+    )
+
+    task = asyncio.create_task(hedged(None))
+    await asyncio.sleep(0.02)
+    assert len(sent) == 1
+
+    assert await task == "hedge"
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_failure_is_returned_without_hedging():
+    error = CadenceRpcError("invalid", StatusCode.INVALID_ARGUMENT)
+    slow = FakeCall(5, "primary")
+    hedged, sent = _hedged([slow, FakeCall(0, error=error)])
+
+    with pytest.raises(CadenceRpcError, match="invalid"):
+        await hedged(None)
+    await asyncio.sleep(0)
+
+    assert len(sent) == 2
+    assert slow.cancelled
+
+
+class FailingOnCancelCall(FakeCall):
+    """Fails instead of being cancelled, like a call whose error races the cancel."""
+
+    async def _wait(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+        raise CadenceRpcError("unavailable", StatusCode.UNAVAILABLE)
+
+
+@pytest.mark.asyncio
+async def test_failed_losers_are_retrieved():
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        loser = FailingOnCancelCall(1)
+        hedged, _ = _hedged([loser, FakeCall(0, "hedge")])
+
+        assert await hedged(None) == "hedge"
+        # Let the cancelled loser finish, then collect it
+        await asyncio.sleep(0.01)
+        del hedged
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert loser.cancelled
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_last_retryable_failure_surfaces():
+    first = CadenceRpcError("first", StatusCode.UNAVAILABLE)
+    second = CadenceRpcError("second", StatusCode.UNAVAILABLE)
+    hedged, sent = _hedged([FakeCall(0, error=first), FakeCall(0, error=second)])
+
+    with pytest.raises(CadenceRpcError, match="second"):
+        await hedged(None)
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_history_long_poll_is_not_hedged():
+    hedged, sent = _hedged([FakeCall(0.05, "history")], method=HISTORY)
+
+    call = hedged(GetWorkflowExecutionHistoryRequest(wait_for_new_event=True))
+
+    assert await call == "history"
+    assert len(sent) == 1
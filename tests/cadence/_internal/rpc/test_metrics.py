@@ -2,7 +2,7 @@ import asyncio
 from concurrent import futures
 from datetime import timedelta
 from typing import Any
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from google.protobuf import any_pb2
@@ -271,3 +271,27 @@ async def test_metrics_emitted_on_cancellation():
 )
 def test_extract_method_name(method, expected):
     assert _extract_method_name(method) == expected
+
+
+@pytest.mark.asyncio
+async def test_metric_names_resolved_once_per_method():
+    emitter = _make_mock_emitter()
+    interceptor = MetricsInterceptor(emitter)
+    details = MagicMock(method=b"/cadence.WorkflowAPI/DescribeWorkflowExecution")
+
+    async def continuation(_details, _request):
+        return _FakeCall()
+
+    with patch(
+        "cadence._internal.rpc.metrics._extract_method_name",
+        wraps=_extract_method_name,
+    ) as extract:
+        for _ in range(3):
+            await (
+                await interceptor.intercept_unary_unary(continuation, details, object())
+            )
+
+    extract.assert_called_once()
+    request = call(_operation_metric("DescribeWorkflowExecution", CADENCE_REQUEST))
+    assert emitter.counter.call_args_list == [request] * 3
+    assert emitter.histogram.call_count == 3
@@ -1,6 +1,7 @@
 from concurrent import futures
 from datetime import timedelta
 from typing import Any, Tuple, Type
+from unittest.mock import Mock
 
 import pytest
 from google.protobuf import any_pb2
@@ -12,7 +13,11 @@ from grpc_status.rpc_status import to_status
 from cadence._internal.rpc.error import CadenceErrorInterceptor
 from cadence.api.v1 import error_pb2, service_workflow_pb2_grpc
 
-from cadence._internal.rpc.retry import ExponentialRetryPolicy, RetryInterceptor
+from cadence._internal.rpc.retry import (
+    ExponentialRetryPolicy,
+    RetryBudget,
+    RetryInterceptor,
+)
 from cadence.api.v1.service_workflow_pb2 import (
     DescribeWorkflowExecutionResponse,
     DescribeWorkflowExecutionRequest,
@@ -271,3 +276,94 @@ async def test_retry_interceptor_clamps_expired_timeout(monkeypatch):
 
     assert isinstance(result, SuccessfulCall)
     assert timeouts == [0]
+
+
+def test_next_delay_full_jitter(monkeypatch):
+    policy = ExponentialRetryPolicy(
+        initial_interval=timedelta(seconds=1),
+        backoff_coefficient=2,
+        max_interval=timedelta(seconds=10),
+        max_attempts=0,
+        jitter=True,
+    )
+    monkeypatch.setattr("cadence._internal.rpc.retry.random.random", lambda: 0.25)
+
+    assert policy.next_delay(3, timedelta(0), None) == timedelta(seconds=1)
+
+
+def test_next_delay_does_not_overflow_after_many_attempts():
+    policy = ExponentialRetryPolicy(
+        initial_interval=timedelta(milliseconds=100),
+        backoff_coefficient=2,
+        max_interval=timedelta(seconds=10),
+        max_attempts=0,
+    )
+
+    assert policy.next_delay(8, timedelta(0), None) == timedelta(seconds=10)
+    assert policy.next_delay(10_000, timedelta(0), None) == timedelta(seconds=10)
+
+
+def test_retry_budget():
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+
+    assert budget.acquire_retry()  # 3 tokens left
+    assert not budget.acquire_retry()  # 2 tokens left, not above half
+    budget.record_success()
+    assert budget.tokens == 2.5
+    assert not budget.acquire_retry()
+    for _ in range(10):
+        budget.record_success()
+    assert budget.tokens == 4
+
+
+@pytest.mark.usefixtures("fake_service")
+@pytest.mark.asyncio
+async def test_budget_exhaustion_stops_retries(fake_service):
+    fake_service.counter = 0
+    emitter = Mock()
+    interceptors: list[Any] = [
+        RetryInterceptor(
+            TEST_POLICY, budget=RetryBudget(max_tokens=6), emitter=emitter
+        ),
+        CadenceErrorInterceptor(),
+    ]
+    async with insecure_channel(
+        f"[::]:{fake_service.port}",
+        interceptors=interceptors,
+    ) as channel:
+        stub = service_workflow_pb2_grpc.WorkflowAPIStub(channel)
+        with pytest.raises(FeatureNotEnabledError):
+            await stub.DescribeWorkflowExecution(
+                DescribeWorkflowExecutionRequest(domain="retryable"), timeout=10
+            )
+
+    # Tokens go 6 -> 5 -> 4 -> 3, and the third failure is not retried.
+    assert fake_service.counter == 3
+    assert [c.args[0] for c in emitter.counter.call_args_list] == [
+        "cadence-DescribeWorkflowExecution.cadence-retry",
+        "cadence-DescribeWorkflowExecution.cadence-retry",
+        "cadence-DescribeWorkflowExecution.cadence-retry-budget-exhausted",
+    ]
+
+
+@pytest.mark.usefixtures("fake_service")
+@pytest.mark.asyncio
+async def test_method_policy_override_disables_retries(fake_service):
+    fake_service.counter = 0
+    interceptors: list[Any] = [
+        RetryInterceptor(
+            TEST_POLICY, method_policies={"DescribeWorkflowExecution": None}
+        ),
+        CadenceErrorInterceptor(),
+    ]
+    async with insecure_channel(
+        f"[::]:{fake_service.port}",
+        interceptors=interceptors,
+    ) as channel:
+        stub = service_workflow_pb2_grpc.WorkflowAPIStub(channel)
+        with pytest.raises(FeatureNotEnabledError):
+            await stub.DescribeWorkflowExecution(
+                DescribeWorkflowExecutionRequest(domain="retryable"), timeout=10
+            )
+
+    assert fake_service.counter == 1
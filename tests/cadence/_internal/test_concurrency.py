@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from cadence._internal.concurrency import CountingThreadPoolExecutor, map_bounded
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_limits_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def work(index: int, item: int) -> tuple[int, int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return index, item * 2
+
+    results = [r async for r in map_bounded(range(10), work, 3)]
+
+    assert sorted(results) == [(i, i * 2) for i in range(10)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_accepts_async_iterable():
+    async def items():
+        for i in range(3):
+            yield i
+
+    async def work(index: int, item: int) -> int:
+        return item
+
+    assert sorted([r async for r in map_bounded(items(), work, 2)]) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_cancels_pending_on_close():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def work(index: int, item: int) -> int:
+        if index == 0:
+            return item
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return item
+
+    results = map_bounded(range(3), work, 3)
+    assert await anext(results) == 0
+    await started.wait()
+    await results.aclose()
+
+    assert sorted(cancelled) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_rejects_non_positive_limit():
+    async def work(index: int, item: int) -> int:
+        return item
+
+    with pytest.raises(ValueError):
+        async for _ in map_bounded([1], work, 0):
+            pass
+
+
+def test_counting_executor_counts_queued_work():
+    pool = CountingThreadPoolExecutor(max_workers=1)
+    running = threading.Event()
+    release = threading.Event()
+
+    def block() -> str:
+        running.set()
+        release.wait()
+        return "done"
+
+    try:
+        blocking = pool.submit(block)
+        running.wait()
+        queued = [pool.submit(lambda: None) for _ in range(3)]
+        assert pool.queued == 3
+
+        # Cancelled before reaching a thread, so it never runs
+        assert queued[0].cancel()
+        assert pool.queued == 2
+
+        release.set()
+        assert blocking.result() == "done"
+        for future in queued[1:]:
+            future.result()
+        assert pool.queued == 0
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,92 @@
+import threading
+from datetime import timedelta
+
+from cadence._internal.profiler import SamplingProfiler, _task_labels, task_label
+
+
+def _busy_until(stop: threading.Event, started: threading.Event) -> None:
+    started.set()
+    while not stop.is_set():
+        pass
+
+
+def _run_labelled(
+    kind: str, name: str, stop: threading.Event, started: threading.Event
+) -> None:
+    with task_label(kind, name):
+        _busy_until(stop, started)
+
+
+def test_task_label_restores_previous_label():
+    ident = threading.get_ident()
+    with task_label("workflow", "Outer"):
+        with task_label("activity", "Inner"):
+            assert _task_labels[ident] == "activity:Inner"
+        assert _task_labels[ident] == "workflow:Outer"
+    assert ident not in _task_labels
+
+
+def test_sample_attributes_stacks_to_task_label():
+    profiler = SamplingProfiler()
+    stop = threading.Event()
+    started = threading.Event()
+    thread = threading.Thread(
+        target=_run_labelled, args=("workflow", "My Workflow", stop, started)
+    )
+    thread.start()
+    try:
+        started.wait()
+        profiler.sample()
+        profiler.sample()
+    finally:
+        stop.set()
+        thread.join()
+
+    total = 0
+    for line in profiler.collapsed().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        assert frames[0] == "workflow:My_Workflow"
+        assert "test_profiler.py:_busy_until" in frames
+        total += int(count)
+    assert total == 2
+
+
+def test_unlabelled_threads_are_not_sampled():
+    profiler = SamplingProfiler()
+    stop = threading.Event()
+    started = threading.Event()
+    thread = threading.Thread(target=_busy_until, args=(stop, started))
+    thread.start()
+    try:
+        started.wait()
+        profiler.sample()
+    finally:
+        stop.set()
+        thread.join()
+
+    assert profiler.collapsed() == ""
+
+
+def test_background_sampling_and_dump(tmp_path):
+    profiler = SamplingProfiler(timedelta(milliseconds=1))
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_run_labelled, args=("activity", "Busy", stop, threading.Event())
+    )
+    thread.start()
+    profiler.start()
+    try:
+        timer = threading.Timer(0.05, stop.set)
+        timer.start()
+        thread.join()
+    finally:
+        profiler.stop()
+
+    assert not profiler.running
+    output = tmp_path / "profile.folded"
+    profiler.dump(output)
+    assert output.read_text().startswith("activity:Busy;")
+
+    profiler.reset()
+    assert profiler.collapsed() == ""
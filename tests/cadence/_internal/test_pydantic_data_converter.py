@@ -0,0 +1,102 @@
+import dataclasses
+import datetime as dt
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from cadence._internal.pydantic_data_converter import PydanticDataConverter
+from cadence.api.v1.common_pb2 import Payload
+
+UTC_TIME = dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc)
+
+
+@dataclasses.dataclass
+class _Durations:
+    duration: dt.timedelta
+    tags: set[int]
+
+
+class _Model(BaseModel):
+    duration: dt.timedelta
+    when: dt.datetime
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param(dt.timedelta(seconds=5), b"5.0", id="timedelta"),
+        pytest.param({"b", "a", "c"}, b'["a","b","c"]', id="set"),
+        pytest.param(UTC_TIME, b'"2024-01-02T03:04:05+00:00"', id="utc datetime"),
+        pytest.param(dt.date(2024, 1, 2), b'"2024-01-02"', id="date"),
+        pytest.param("é", b'"\\u00e9"', id="non-ascii string"),
+        pytest.param(
+            _Durations(dt.timedelta(seconds=1.5), {3, 1, 2}),
+            b'{"duration":1.5,"tags":[1,2,3]}',
+            id="dataclass",
+        ),
+        pytest.param(
+            [dt.date(2024, 1, 2), dt.timedelta(days=1)],
+            b'["2024-01-02",86400.0]',
+            id="list",
+        ),
+        pytest.param(
+            _Model(duration=dt.timedelta(seconds=5), when=UTC_TIME),
+            b'{"duration":"PT5S","when":"2024-01-02T03:04:05Z"}',
+            id="model",
+        ),
+    ],
+)
+def test_legacy_encoding(value: Any, expected: bytes) -> None:
+    assert PydanticDataConverter().to_data([value]).data == expected
+
+
+def test_legacy_encoding_rejects_bytes() -> None:
+    with pytest.raises(TypeError):
+        PydanticDataConverter().to_data([b"data"])
+
+
+@pytest.mark.parametrize(
+    "value,type_hint",
+    [
+        pytest.param(dt.timedelta(seconds=5), dt.timedelta, id="timedelta"),
+        pytest.param({"b", "a", "c"}, set[str], id="set"),
+        pytest.param(UTC_TIME, dt.datetime, id="utc datetime"),
+        pytest.param(
+            _Durations(dt.timedelta(seconds=1.5), {3, 1, 2}), _Durations, id="dataclass"
+        ),
+        pytest.param(
+            _Model(duration=dt.timedelta(seconds=5), when=UTC_TIME), _Model, id="model"
+        ),
+    ],
+)
+@pytest.mark.parametrize("pydantic_encoding", [False, True])
+def test_round_trip(value: Any, type_hint: Any, pydantic_encoding: bool) -> None:
+    converter = PydanticDataConverter(pydantic_encoding=pydantic_encoding)
+
+    payload = converter.to_data([value, 1])
+
+    assert converter.from_data(payload, [type_hint, int]) == [value, 1]
+    assert converter.from_data(converter.to_data([value]), [type_hint]) == [value]
+
+
+def test_legacy_timedelta_decodes_as_float() -> None:
+    payload = PydanticDataConverter().to_data([dt.timedelta(seconds=5)])
+
+    assert PydanticDataConverter().from_data(payload, [float]) == [5.0]
+
+
+def test_pydantic_encoding_decodes_legacy_payloads() -> None:
+    converter = PydanticDataConverter(pydantic_encoding=True)
+
+    assert converter.from_data(
+        Payload(data=b'{"duration":1.5,"tags":[1,2,3]}'), [_Durations]
+    ) == [_Durations(dt.timedelta(seconds=1.5), {1, 2, 3})]
+
+
+def test_pydantic_encoding_format() -> None:
+    converter = PydanticDataConverter(pydantic_encoding=True)
+
+    assert converter.to_data([dt.timedelta(seconds=5)]).data == b'"PT5S"'
+    assert converter.to_data([UTC_TIME]).data == b'"2024-01-02T03:04:05Z"'
+    assert converter.to_data([b"data"]).data == b'"data"'
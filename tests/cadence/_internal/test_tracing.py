@@ -0,0 +1,206 @@
+from unittest.mock import AsyncMock, Mock, PropertyMock
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from cadence import Client, workflow
+from cadence._internal.activity import ActivityExecutor
+from cadence._internal.context import header_from_dict
+from cadence._internal.tracing import (
+    ACTIVITY_EXECUTE_SPAN,
+    ACTIVITY_RESPOND_SPAN,
+    ACTIVITY_TASK_SPAN,
+    DECISION_FETCH_HISTORY_SPAN,
+    DECISION_REPLAY_SPAN,
+    DECISION_RESPOND_SPAN,
+    DECISION_TASK_SPAN,
+    NOOP_TASK_TRACER,
+    OpenTelemetryTaskTracer,
+    create_task_tracer,
+    inject_trace_headers,
+)
+from cadence.api.v1.common_pb2 import WorkflowExecution, WorkflowType
+from cadence.api.v1.history_pb2 import (
+    DecisionTaskScheduledEventAttributes,
+    DecisionTaskStartedEventAttributes,
+    History,
+    HistoryEvent,
+    WorkflowExecutionStartedEventAttributes,
+)
+from cadence.api.v1.service_worker_pb2 import PollForDecisionTaskResponse
+from cadence.data_converter import DefaultDataConverter
+from cadence.tracing import OpenTelemetryPropagator
+from cadence.worker import Registry
+from cadence.worker._decision_task_handler import DecisionTaskHandler
+from tests.cadence._internal.activity.test_activity_executor import fake_task
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def provider(exporter) -> TracerProvider:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider
+
+
+@pytest.fixture
+def client() -> Client:
+    client = Mock(spec=Client)
+    client.domain = "domain"
+    client.worker_stub = AsyncMock()
+    type(client).data_converter = PropertyMock(return_value=DefaultDataConverter())
+    return client
+
+
+def _by_name(exporter: InMemorySpanExporter) -> dict[str, ReadableSpan]:
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+def _parent_id(span: ReadableSpan) -> int | None:
+    return span.parent.span_id if span.parent is not None else None
+
+
+def test_noop_tracer():
+    headers = {"key": b"value"}
+
+    assert create_task_tracer(False) is NOOP_TASK_TRACER
+    assert not NOOP_TASK_TRACER.enabled
+    assert NOOP_TASK_TRACER.with_span_headers(headers) is headers
+    with NOOP_TASK_TRACER.span("span", headers):
+        pass
+
+
+def test_propagator_round_trip(provider):
+    propagator = OpenTelemetryPropagator()
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("parent") as parent:
+        headers = propagator.inject()
+
+    assert trace.get_current_span() is trace.INVALID_SPAN
+    with propagator.extract(headers):
+        current = trace.get_current_span().get_span_context()
+        assert current.trace_id == parent.get_span_context().trace_id
+        assert current.span_id == parent.get_span_context().span_id
+    assert trace.get_current_span() is trace.INVALID_SPAN
+
+
+def test_propagator_ignores_missing_trace():
+    propagator = OpenTelemetryPropagator()
+
+    assert propagator.inject() == {}
+    with propagator.extract({"other": b"value"}):
+        assert trace.get_current_span() is trace.INVALID_SPAN
+
+
+async def test_activity_task_spans(client, provider, exporter):
+    user_tracer = provider.get_tracer("test")
+    reg = Registry()
+
+    @reg.activity(name="activity_type")
+    async def activity_fn():
+        with user_tracer.start_as_current_span("user"):
+            return "success"
+
+    executor = ActivityExecutor(
+        client,
+        "task_list",
+        "identity",
+        1,
+        reg.get_activity,
+        context_propagators=(OpenTelemetryPropagator(),),
+        tracer=OpenTelemetryTaskTracer(provider),
+    )
+    with user_tracer.start_as_current_span("workflow") as workflow_span:
+        headers = inject_trace_headers()
+    task = fake_task("activity_type", "")
+    task.header.CopyFrom(header_from_dict(headers))
+
+    await executor.execute(task)
+
+    spans = _by_name(exporter)
+    task_span = spans[ACTIVITY_TASK_SPAN]
+    assert task_span.context.trace_id == workflow_span.get_span_context().trace_id
+    assert _parent_id(task_span) == workflow_span.get_span_context().span_id
+    assert task_span.attributes is not None
+    assert task_span.attributes["cadence.activity_type"] == "activity_type"
+    assert task_span.attributes["cadence.workflow_id"] == "workflow_id"
+    assert _parent_id(spans[ACTIVITY_EXECUTE_SPAN]) == task_span.context.span_id
+    assert _parent_id(spans[ACTIVITY_RESPOND_SPAN]) == task_span.context.span_id
+    assert _parent_id(spans["user"]) == spans[ACTIVITY_EXECUTE_SPAN].context.span_id
+
+
+async def test_decision_task_spans(client, provider, exporter):
+    user_tracer = provider.get_tracer("test")
+    reg = Registry()
+
+    @reg.workflow(name="test_workflow")
+    class TestWorkflow:
+        @workflow.run
+        async def run(self) -> str:
+            with user_tracer.start_as_current_span("user"):
+                return "done"
+
+    handler = DecisionTaskHandler(
+        client,
+        "task_list",
+        reg,
+        context_propagators=(OpenTelemetryPropagator(),),
+        enable_tracing=True,
+        tracer_provider=provider,
+    )
+    with user_tracer.start_as_current_span("starter") as starter:
+        headers = inject_trace_headers()
+    events = [
+        HistoryEvent(
+            event_id=1,
+            workflow_execution_started_event_attributes=WorkflowExecutionStartedEventAttributes(
+                header=header_from_dict(headers)
+            ),
+        ),
+        HistoryEvent(
+            event_id=2,
+            decision_task_scheduled_event_attributes=DecisionTaskScheduledEventAttributes(),
+        ),
+        HistoryEvent(
+            event_id=3,
+            decision_task_started_event_attributes=DecisionTaskStartedEventAttributes(
+                scheduled_event_id=2
+            ),
+        ),
+    ]
+    task = PollForDecisionTaskResponse(
+        task_token=b"token",
+        workflow_execution=WorkflowExecution(workflow_id="wf", run_id="run"),
+        workflow_type=WorkflowType(name="test_workflow"),
+        history=History(events=events),
+    )
+
+    await handler._handle_task_implementation(task)
+
+    spans = _by_name(exporter)
+    task_span = spans[DECISION_TASK_SPAN]
+    assert task_span.parent is None
+    assert task_span.context.trace_id != starter.get_span_context().trace_id
+    [link] = task_span.links
+    assert link.context.trace_id == starter.get_span_context().trace_id
+    assert link.context.span_id == starter.get_span_context().span_id
+    assert task_span.attributes is not None
+    assert task_span.attributes["cadence.workflow_type"] == "test_workflow"
+    for name in (
+        DECISION_FETCH_HISTORY_SPAN,
+        DECISION_REPLAY_SPAN,
+        DECISION_RESPOND_SPAN,
+    ):
+        assert _parent_id(spans[name]) == task_span.context.span_id
+    assert _parent_id(spans["user"]) == spans[DECISION_REPLAY_SPAN].context.span_id
+    client.worker_stub.RespondDecisionTaskCompleted.assert_called_once()
@@ -0,0 +1,117 @@
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock
+
+from cadence._internal.workflow.context import Context
+from cadence._internal.workflow.decoded_value_cache import DecodedValueCache
+from cadence.data_converter import DefaultDataConverter
+from cadence.workflow import WorkflowInfo
+
+
+@dataclass(frozen=True)
+class _Frozen:
+    name: str
+    count: int
+
+
+@dataclass(frozen=True)
+class _FrozenWithList:
+    items: list[str] = field(default_factory=list)
+
+
+def _converter() -> MagicMock:
+    return MagicMock(wraps=DefaultDataConverter())
+
+
+def test_disabled_cache_decodes_every_time() -> None:
+    converter = _converter()
+    cache = DecodedValueCache(converter)
+    payload = DefaultDataConverter().to_data(["value"])
+
+    assert cache.decode("k", payload, str) == "value"
+    assert cache.decode("k", payload, str) == "value"
+
+    assert converter.from_data.call_count == 2
+    assert cache.stats.decoded == 2
+    assert cache.stats.cache_hits == 0
+
+
+def test_enabled_cache_reuses_immutable_value_for_same_payload() -> None:
+    converter = _converter()
+    cache = DecodedValueCache(converter, enabled=True)
+    payload = DefaultDataConverter().to_data([{"name": "a", "count": 1}])
+
+    first = cache.decode("k", payload, _Frozen)
+    second = cache.decode("k", payload, _Frozen)
+
+    assert first is second
+    assert converter.from_data.call_count == 1
+    assert cache.stats.decoded == 1
+    assert cache.stats.cache_hits == 1
+    assert cache.stats.decode_ns > 0
+
+
+def test_enabled_cache_decodes_new_payload_for_same_key() -> None:
+    converter = _converter()
+    cache = DecodedValueCache(converter, enabled=True)
+    dc = DefaultDataConverter()
+
+    assert cache.decode("k", dc.to_data(["old"]), str) == "old"
+    assert cache.decode("k", dc.to_data(["new"]), str) == "new"
+
+    assert converter.from_data.call_count == 2
+
+
+def test_enabled_cache_decodes_for_different_result_type() -> None:
+    converter = _converter()
+    cache = DecodedValueCache(converter, enabled=True)
+    payload = DefaultDataConverter().to_data([1])
+
+    assert cache.decode("k", payload, int) == 1
+    assert cache.decode("k", payload, float) == 1.0
+
+    assert converter.from_data.call_count == 2
+
+
+def test_enabled_cache_skips_mutable_values() -> None:
+    converter = _converter()
+    cache = DecodedValueCache(converter, enabled=True)
+    dc = DefaultDataConverter()
+    list_payload = dc.to_data([["a"]])
+    frozen_payload = dc.to_data([{"items": ["a"]}])
+
+    first = cache.decode("list", list_payload, list[str])
+    first.append("b")
+    assert cache.decode("list", list_payload, list[str]) == ["a"]
+    cache.decode("frozen", frozen_payload, _FrozenWithList)
+    cache.decode("frozen", frozen_payload, _FrozenWithList)
+
+    assert converter.from_data.call_count == 4
+    assert cache.stats.cache_hits == 0
+
+
+def test_context_mutable_side_effect_decodes_stored_value_once() -> None:
+    converter = _converter()
+    dm = MagicMock()
+    info = WorkflowInfo(
+        workflow_type="Wf",
+        workflow_domain="domain",
+        workflow_id="wid",
+        workflow_run_id="rid",
+        workflow_task_list="tl",
+        data_converter=converter,
+    )
+    ctx = Context(info, dm, decoded_values=DecodedValueCache(converter, enabled=True))
+    ctx.set_replay_mode(True)
+    stored = DefaultDataConverter().to_data(["stored"])
+    dm.mutable_side_effect_value.side_effect = [
+        (0, stored, False),
+        (1, stored, False),
+    ]
+
+    for _ in range(2):
+        assert (
+            ctx.mutable_side_effect("config", lambda: "x", str, lambda a, b: a != b)
+            == "stored"
+        )
+
+    assert converter.from_data.call_count == 1
@@ -18,7 +18,7 @@ from cadence.api.v1.history_pb2 import (
     WorkflowExecutionCompletedEventAttributes,
     WorkflowExecutionStartedEventAttributes,
 )
-from cadence._internal.workflow.workflow_engine import WorkflowEngine
+from cadence._internal.workflow.workflow_engine import DecisionStats, WorkflowEngine
 from cadence import workflow
 from cadence.data_converter import DefaultDataConverter
 from cadence.workflow import WorkflowInfo, WorkflowDefinition, WorkflowDefinitionOptions
@@ -176,6 +176,36 @@ class TestWorkflowEngine:
             data=b'"echo: test-input"'
         )
 
+    def test_process_decision_records_phase_stats(
+        self,
+        echo_workflow_definition: WorkflowDefinition,
+        simple_workflow_events: List[HistoryEvent],
+    ):
+        stats = DecisionStats()
+        workflow_engine = WorkflowEngine(
+            info=WorkflowInfo(
+                workflow_type="test_workflow",
+                workflow_domain="test-domain",
+                workflow_id="test-workflow-id",
+                workflow_run_id="test-run-id",
+                workflow_task_list="test-task-list",
+                data_converter=DefaultDataConverter(),
+            ),
+            workflow_definition=echo_workflow_definition,
+            stats=stats,
+        )
+
+        workflow_engine.process_decision(simple_workflow_events[:3])
+
+        assert stats.started_ns > 0
+        # The only decision batch is new, so nothing was replayed
+        assert stats.replay_ns == 0
+        assert stats.new_events_ns > 0
+        assert 0 < stats.workflow_code_ns <= stats.new_events_ns
+        assert stats.serialization_ns > 0
+        assert stats.cpu_ns > 0
+        assert stats.replayed_events == 0
+
     def test_uncaught_workflow_cancellation_closes_as_canceled(self):
         workflow_engine = create_workflow_engine(
             WorkflowDefinition.wrap(
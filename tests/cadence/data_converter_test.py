@@ -109,3 +109,38 @@ def test_data_converter_to_data(values: list[Any], expected: str) -> None:
     converter._encoder = json.Encoder(order="deterministic")
     actual = converter.to_data(values)
     assert actual.data.decode() == expected
+
+
+@pytest.mark.parametrize(
+    "json,types,expected",
+    [
+        pytest.param('"a" "b"', [str], ["a"], id="single hint extra content"),
+        pytest.param("NaN", [float], [float("inf") * 0], id="std lib only literal"),
+        pytest.param('"a\tb"', [str], ["a\tb"], id="control characters"),
+    ],
+)
+def test_data_converter_from_data_single_value_fallback(
+    json: str, types: list[Type | None], expected: list[Any]
+) -> None:
+    converter = DefaultDataConverter()
+    actual = converter.from_data(Payload(data=json.encode()), types)
+    assert repr(expected) == repr(actual)
+
+
+def test_data_converter_decode_provided_values() -> None:
+    converter = DefaultDataConverter()
+    payload = Payload(data=b'"hello" 1')
+    assert converter._decode_provided_values(payload, [str, int, bool]) == [
+        "hello",
+        1,
+    ]
+    assert converter._decode_provided_values(Payload(), [str]) == []
+
+
+def test_data_converter_to_data_reuses_buffer() -> None:
+    converter = DefaultDataConverter()
+    assert converter.to_data(["a" * 64, "b" * 64]).data == (
+        f'"{"a" * 64}" "{"b" * 64}"'.encode()
+    )
+    assert converter.to_data([1, 2]).data == b"1 2"
+    assert converter.to_data([]).data == b""
@@ -0,0 +1,199 @@
+"""Tests for the aggregating metrics emitter."""
+
+import threading
+from datetime import timedelta
+from unittest.mock import Mock, call
+
+from prometheus_client import CollectorRegistry
+
+from cadence.metrics import (
+    AggregatingMetricsEmitter,
+    CardinalityLimitingEmitter,
+    MetricsEmitter,
+    PrometheusConfig,
+    PrometheusMetrics,
+)
+
+
+def _emitter() -> tuple[AggregatingMetricsEmitter, Mock]:
+    backend = Mock(spec=MetricsEmitter)
+    return AggregatingMetricsEmitter(backend, flush_interval=None), backend
+
+
+class TestAggregatingMetricsEmitter:
+    def test_nothing_reaches_backend_before_flush(self):
+        emitter, backend = _emitter()
+
+        emitter.counter("requests")
+        emitter.gauge("slots", 3.0)
+        emitter.histogram("latency_ns", timedelta(milliseconds=1))
+
+        backend.counter.assert_not_called()
+        backend.gauge.assert_not_called()
+        backend.histogram.assert_not_called()
+
+    def test_flush_sums_counters_per_series(self):
+        emitter, backend = _emitter()
+
+        emitter.counter("requests")
+        emitter.counter("requests", 2)
+        emitter.counter("requests", tags={"op": "a"})
+        emitter.with_tags({"op": "a"}).counter("requests", 4)
+        emitter.flush()
+
+        assert sorted(backend.counter.call_args_list, key=str) == sorted(
+            [call("requests", 3, None), call("requests", 5, {"op": "a"})], key=str
+        )
+
+    def test_flush_keeps_last_gauge(self):
+        emitter, backend = _emitter()
+
+        emitter.gauge("slots", 1.0)
+        emitter.gauge("slots", 2.0)
+        emitter.flush()
+
+        backend.gauge.assert_called_once_with("slots", 2.0, None)
+
+    def test_last_gauge_wins_across_threads(self):
+        emitter, backend = _emitter()
+
+        emitter.gauge("slots", 1.0)
+        thread = threading.Thread(target=emitter.gauge, args=("slots", 2.0))
+        thread.start()
+        thread.join()
+        emitter.flush()
+
+        backend.gauge.assert_called_once_with("slots", 2.0, None)
+
+    def test_histograms_keep_bucket_counts_and_sum(self):
+        emitter, backend = _emitter()
+
+        # 1.5ms and 1.7ms share the (1ms, 2ms] bucket, 30s has its own
+        emitter.histogram("latency_ns", timedelta(microseconds=1500))
+        emitter.histogram("latency_ns", timedelta(microseconds=1700))
+        emitter.histogram("latency_ns", timedelta(seconds=30))
+        emitter.flush()
+
+        assert backend.histogram.call_args_list == [
+            call("latency_ns", timedelta(microseconds=1600), None),
+            call("latency_ns", timedelta(microseconds=1600), None),
+            call("latency_ns", timedelta(seconds=30), None),
+        ]
+
+    def test_histogram_overflow_bucket(self):
+        emitter, backend = _emitter()
+
+        emitter.histogram("latency_ns", timedelta(seconds=200))
+        emitter.histogram("latency_ns", timedelta(seconds=400))
+        emitter.flush()
+
+        assert backend.histogram.call_args_list == [
+            call("latency_ns", timedelta(seconds=300), None),
+            call("latency_ns", timedelta(seconds=300), None),
+        ]
+
+    def test_histograms_use_the_backends_bucket_overrides(self):
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(
+            PrometheusConfig(
+                registry=registry, histogram_buckets={"latency_ns": [1_500_000]}
+            )
+        )
+        emitter = AggregatingMetricsEmitter(
+            CardinalityLimitingEmitter(metrics), flush_interval=None
+        )
+
+        # Both share the default (1ms, 2ms] bucket but not the overridden ones
+        emitter.histogram("latency_ns", timedelta(microseconds=1200))
+        emitter.histogram("latency_ns", timedelta(microseconds=1800))
+        emitter.flush()
+
+        bucket = "latency_ns_bucket"
+        assert registry.get_sample_value(bucket, {"le": "1.5e+06"}) == 1
+        assert registry.get_sample_value(bucket, {"le": "+Inf"}) == 2
+        assert registry.get_sample_value("latency_ns_sum") == 3_000_000
+
+    def test_histograms_use_the_given_bucket_resolver(self):
+        backend = Mock(spec=MetricsEmitter)
+        emitter = AggregatingMetricsEmitter(
+            backend,
+            flush_interval=None,
+            duration_bucket_resolver=lambda name: [10_000_000],
+        )
+
+        emitter.histogram("latency_ns", timedelta(milliseconds=2))
+        emitter.histogram("latency_ns", timedelta(milliseconds=8))
+        emitter.flush()
+
+        assert backend.histogram.call_args_list == [
+            call("latency_ns", timedelta(milliseconds=5), None),
+            call("latency_ns", timedelta(milliseconds=5), None),
+        ]
+
+    def test_memory_is_bounded_by_series(self):
+        emitter, _ = _emitter()
+
+        for _ in range(1000):
+            emitter.counter("requests")
+            emitter.histogram("latency_ns", timedelta(milliseconds=1))
+
+        aggregate = emitter._aggregate()
+        assert len(aggregate.counters) == 1
+        assert len(aggregate.histograms) == 1
+
+    def test_flush_drains_buffers(self):
+        emitter, backend = _emitter()
+
+        emitter.counter("requests")
+        emitter.flush()
+        emitter.flush()
+
+        backend.counter.assert_called_once_with("requests", 1, None)
+
+    def test_aggregates_across_threads(self):
+        emitter, backend = _emitter()
+
+        def record():
+            for _ in range(1000):
+                emitter.counter("requests")
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        emitter.flush()
+
+        backend.counter.assert_called_once_with("requests", 8000, None)
+
+    def test_max_series_triggers_an_early_flush(self):
+        backend = Mock(spec=MetricsEmitter)
+        flushed = threading.Event()
+        backend.counter.side_effect = lambda *args: flushed.set()
+        emitter = AggregatingMetricsEmitter(
+            backend, flush_interval=timedelta(hours=1), max_series=2
+        )
+
+        emitter.counter("requests", tags={"op": "a"})
+        assert not flushed.wait(0.05)
+        emitter.counter("requests", tags={"op": "b"})
+        assert flushed.wait(5)
+        emitter.close()
+
+    def test_background_flush_and_close(self):
+        backend = Mock(spec=MetricsEmitter)
+        flushed = threading.Event()
+        backend.counter.side_effect = lambda *args: flushed.set()
+        emitter = AggregatingMetricsEmitter(
+            backend, flush_interval=timedelta(milliseconds=10)
+        )
+
+        emitter.counter("requests")
+        assert flushed.wait(5)
+
+        emitter.counter("requests", 2)
+        emitter.close()
+        assert backend.counter.call_args_list == [
+            call("requests", 1, None),
+            call("requests", 2, None),
+        ]
@@ -0,0 +1,158 @@
+"""Tests for the cardinality limiting metrics emitter."""
+
+from datetime import timedelta
+from unittest.mock import Mock, call
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from cadence.metrics import (
+    CardinalityLimitingEmitter,
+    MetricsEmitter,
+    PrometheusConfig,
+    PrometheusMetrics,
+)
+from cadence.metrics.constants import (
+    METRIC_CARDINALITY_OVERFLOW_COUNTER,
+    TAG_DOMAIN,
+    TAG_METRIC_NAME,
+    TAG_WORKFLOW_TYPE,
+)
+
+
+def _tags(workflow_type: str) -> dict[str, str]:
+    return {TAG_DOMAIN: "domain", TAG_WORKFLOW_TYPE: workflow_type}
+
+
+def _emitter(max_tag_sets: int = 2) -> tuple[CardinalityLimitingEmitter, Mock]:
+    backend = Mock(spec=MetricsEmitter)
+    return CardinalityLimitingEmitter(backend, max_tag_sets=max_tag_sets), backend
+
+
+class TestCardinalityLimitingEmitter:
+    def test_passes_tag_sets_through_below_the_limit(self):
+        emitter, backend = _emitter()
+
+        emitter.counter("requests", tags=_tags("a"))
+        emitter.counter("requests", tags=_tags("b"))
+        emitter.counter("requests", tags=_tags("a"))
+
+        assert backend.counter.call_args_list == [
+            call("requests", 1, _tags("a")),
+            call("requests", 1, _tags("b")),
+            call("requests", 1, _tags("a")),
+        ]
+
+    def test_folds_new_tag_sets_over_the_limit(self):
+        emitter, backend = _emitter()
+
+        emitter.counter("requests", tags=_tags("a"))
+        emitter.counter("requests", tags=_tags("b"))
+        emitter.gauge("requests", 1.0, tags=_tags("c"))
+        emitter.histogram("requests", timedelta(seconds=1), tags=_tags("d"))
+
+        backend.gauge.assert_called_once_with("requests", 1.0, _tags("other"))
+        backend.histogram.assert_called_once_with(
+            "requests", timedelta(seconds=1), _tags("other")
+        )
+        assert (
+            backend.counter.call_args_list[2:]
+            == [
+                call(
+                    METRIC_CARDINALITY_OVERFLOW_COUNTER,
+                    tags={TAG_METRIC_NAME: "requests"},
+                )
+            ]
+            * 2
+        )
+
+    def test_limit_is_per_metric(self):
+        emitter, backend = _emitter(max_tag_sets=1)
+
+        emitter.counter("requests", tags=_tags("a"))
+        emitter.counter("errors", tags=_tags("b"))
+
+        assert backend.counter.call_args_list == [
+            call("requests", 1, _tags("a")),
+            call("errors", 1, _tags("b")),
+        ]
+        assert backend.counter.call_count == 2
+
+    def test_tag_sets_without_fold_tags_are_not_limited(self):
+        emitter, backend = _emitter(max_tag_sets=1)
+
+        emitter.counter("requests", tags={TAG_DOMAIN: "a"})
+        emitter.counter("requests", tags={TAG_DOMAIN: "b"})
+        emitter.counter("requests")
+
+        assert backend.counter.call_args_list == [
+            call("requests", 1, {TAG_DOMAIN: "a"}),
+            call("requests", 1, {TAG_DOMAIN: "b"}),
+            call("requests", 1, None),
+        ]
+
+    def test_bind_and_with_tags_are_limited(self):
+        emitter, backend = _emitter(max_tag_sets=1)
+
+        emitter.with_tags(_tags("a")).counter("requests")
+        emitter.with_tags(_tags("b")).counter("requests")
+
+        assert backend.counter.call_args_list == [
+            call("requests", 1, tags=_tags("a")),
+            call(
+                METRIC_CARDINALITY_OVERFLOW_COUNTER, tags={TAG_METRIC_NAME: "requests"}
+            ),
+            call("requests", 1, tags=_tags("other")),
+        ]
+
+    def test_bound_overflow_is_counted_per_observation(self):
+        emitter, backend = _emitter(max_tag_sets=1)
+        overflow = call(
+            METRIC_CARDINALITY_OVERFLOW_COUNTER, tags={TAG_METRIC_NAME: "requests"}
+        )
+
+        emitter.bind("requests", _tags("a")).counter()
+        bound = emitter.bind("requests", _tags("b"))
+        bound.counter()
+        bound.counter(2)
+
+        assert backend.counter.call_args_list == [
+            call("requests", tags=_tags("a")),
+            overflow,
+            call("requests", 1, tags=_tags("other")),
+            overflow,
+            call("requests", 2, tags=_tags("other")),
+        ]
+
+    def test_rejects_non_positive_limit(self):
+        with pytest.raises(ValueError):
+            CardinalityLimitingEmitter(Mock(spec=MetricsEmitter), max_tag_sets=0)
+
+    def test_caps_prometheus_series(self):
+        registry = CollectorRegistry()
+        prometheus = PrometheusMetrics(PrometheusConfig(registry=registry))
+        emitter = CardinalityLimitingEmitter(prometheus, max_tag_sets=3)
+
+        for i in range(10):
+            emitter.with_tags(_tags(f"type-{i}")).counter("workflow_requests")
+
+        workflow_types = {
+            sample.labels[TAG_WORKFLOW_TYPE]: sample.value
+            for metric in registry.collect()
+            if metric.name == "workflow_requests"
+            for sample in metric.samples
+            if sample.name == "workflow_requests_total"
+        }
+        assert workflow_types == {
+            "type-0": 1.0,
+            "type-1": 1.0,
+            "type-2": 1.0,
+            "other": 7.0,
+        }
+        assert (
+            registry.get_sample_value(
+                METRIC_CARDINALITY_OVERFLOW_COUNTER + "_total",
+                {TAG_METRIC_NAME: "workflow_requests"},
+            )
+            == 7.0
+        )
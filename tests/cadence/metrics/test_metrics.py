@@ -6,12 +6,14 @@ from unittest.mock import Mock
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from cadence.metrics import (
+    bind_metric,
     duration_between,
     duration_from_nanoseconds,
     MetricsEmitter,
     MetricType,
     NoOpMetricsEmitter,
 )
+from cadence.metrics.metrics import TaggedEmitterCache, _TaggedEmitter
 
 
 def _timestamp(seconds: int = 0, nanos: int = 0) -> Timestamp:
@@ -52,6 +54,74 @@ class TestMetricsEmitter:
             "test_histogram", timedelta(seconds=2, milliseconds=500), {"env": "prod"}
         )
 
+    def test_noop_emitter_bind(self):
+        bound = NoOpMetricsEmitter().bind("test_counter", {"label": "value"})
+
+        bound.counter()
+        bound.gauge(1.0)
+        bound.histogram(timedelta(milliseconds=5))
+
+    def test_bind_metric_falls_back_to_keyed_calls(self):
+        mock_emitter = Mock()
+
+        bound = bind_metric(mock_emitter, "test_counter")
+        bound.counter()
+        bound.histogram(timedelta(seconds=1))
+
+        mock_emitter.bind.assert_not_called()
+        mock_emitter.counter.assert_called_once_with("test_counter")
+        mock_emitter.histogram.assert_called_once_with(
+            "test_counter", timedelta(seconds=1)
+        )
+
+    def test_tagged_emitter_bind_merges_tags_once(self):
+        mock_emitter = Mock()
+        bound = _TaggedEmitter(mock_emitter, {"a": "1"}).bind("key", {"b": "2"})
+        bound.counter(3)
+        bound.gauge(4.0)
+
+        mock_emitter.counter.assert_called_once_with(
+            "key", 3, tags={"a": "1", "b": "2"}
+        )
+        mock_emitter.gauge.assert_called_once_with(
+            "key", 4.0, tags={"a": "1", "b": "2"}
+        )
+
+    def test_tagged_emitter_binds_each_key_once(self):
+        base = NoOpMetricsEmitter()
+        tagged = _TaggedEmitter(base, {"a": "1"})
+        bind = Mock(wraps=base.bind)
+        base.bind = bind  # type: ignore[method-assign]
+
+        tagged.counter("key")
+        tagged.counter("key", 2)
+        tagged.histogram("latency", timedelta(seconds=1))
+
+        assert bind.call_args_list == [
+            (("key", {"a": "1"}),),
+            (("latency", {"a": "1"}),),
+        ]
+
+    def test_tagged_emitter_merges_per_call_tags(self):
+        base = Mock()
+        tagged = _TaggedEmitter(base, {"a": "1"})
+
+        tagged.counter("key", 1, {"b": "2"})
+
+        base.counter.assert_called_once_with("key", 1, tags={"a": "1", "b": "2"})
+
+    def test_tagged_emitter_cache_reuses_emitters(self):
+        base = Mock()
+        cache = TaggedEmitterCache(base, ("Domain", "TaskList"), max_size=2)
+
+        first = cache.get("d", "tl")
+        assert cache.get("d", "tl") is first
+        base.with_tags.assert_called_once_with({"Domain": "d", "TaskList": "tl"})
+
+        cache.get("d", "other")
+        cache.get("d", "third")
+        assert base.with_tags.call_count == 3
+
 
 class TestMetricType:
     """Test cases for MetricType enum."""
@@ -0,0 +1,60 @@
+"""Tests for OpenTelemetry metrics integration."""
+
+from datetime import timedelta
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from cadence.metrics import DEFAULT_1MS_100S
+from cadence.metrics.opentelemetry import OpenTelemetryConfig, OpenTelemetryMetrics
+
+
+def _metrics(**kwargs) -> tuple[OpenTelemetryMetrics, InMemoryMetricReader]:
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    config = OpenTelemetryConfig(meter_provider=provider, **kwargs)
+    return OpenTelemetryMetrics(config), reader
+
+
+def _points(reader: InMemoryMetricReader) -> dict:
+    data = reader.get_metrics_data()
+    assert data is not None
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+
+
+class TestOpenTelemetryMetrics:
+    def test_counter_and_gauge(self):
+        metrics, reader = _metrics(default_attributes={"env": "test"})
+
+        metrics.counter("requests", 2, {"Domain": "d"})
+        metrics.with_tags({"Domain": "d"}).counter("requests")
+        metrics.gauge("slots", 4.0)
+
+        points = _points(reader)
+        assert points["requests"][0].value == 3
+        assert dict(points["requests"][0].attributes) == {"env": "test", "Domain": "d"}
+        assert points["slots"][0].value == 4.0
+
+    def test_duration_histogram_uses_default_buckets(self):
+        metrics, reader = _metrics()
+
+        bound = metrics.bind("cadence-latency_ns")
+        bound.histogram(timedelta(milliseconds=2))
+        bound.histogram(timedelta(milliseconds=3))
+
+        point = _points(reader)["cadence-latency_ns"][0]
+        assert point.count == 2
+        assert point.sum == 5_000_000
+        assert tuple(point.explicit_bounds) == DEFAULT_1MS_100S
+
+    def test_histogram_bucket_override(self):
+        metrics, reader = _metrics(histogram_buckets={"custom": [1.0, 10.0]})
+
+        metrics.histogram("custom", timedelta(microseconds=5))
+
+        assert tuple(_points(reader)["custom"][0].explicit_bounds) == (1.0, 10.0)
@@ -1,12 +1,24 @@
 """Tests for Prometheus metrics integration."""
 
+import os
+import subprocess
+import sys
+import urllib.request
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
 from cadence.metrics import (
+    AggregatingMetricsEmitter,
+    CardinalityLimitingEmitter,
     HIGH_1MS_24H,
+    NoOpMetricsEmitter,
+    PrometheusExporter,
     PrometheusMetrics,
     PrometheusConfig,
+    emitter_registry,
+    is_multiprocess,
+    mark_process_dead,
+    multiprocess_registry,
 )
 from cadence.metrics.histogram_buckets import DEFAULT_1MS_100S
 
@@ -176,6 +188,49 @@ class TestPrometheusMetrics:
         )
         mock_generate_latest.assert_called_once_with(metrics.registry)
 
+    def test_bound_metric_reuses_labelled_child(self):
+        """Test bound handles resolve the labelled child once."""
+        from prometheus_client import CollectorRegistry
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(
+            PrometheusConfig(default_labels={"env": "test"}, registry=registry)
+        )
+        bound = metrics.bind("test_bound_counter", {"operation": "start"})
+
+        with patch.object(
+            metrics, "_get_or_create_counter", wraps=metrics._get_or_create_counter
+        ) as get_counter:
+            bound.counter()
+            bound.counter(2)
+
+        get_counter.assert_called_once()
+        labels = {"env": "test", "operation": "start"}
+        assert registry.get_sample_value("test_bound_counter_total", labels) == 3
+
+    def test_bound_histogram_records_nanoseconds(self):
+        """Test bound histogram observations match histogram()."""
+        from prometheus_client import CollectorRegistry
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(PrometheusConfig(registry=registry))
+
+        metrics.bind("test_bound_latency_ns").histogram(timedelta(milliseconds=2))
+        metrics.histogram("test_bound_latency_ns", timedelta(milliseconds=3))
+
+        assert registry.get_sample_value("test_bound_latency_ns_sum") == 5_000_000
+        assert registry.get_sample_value("test_bound_latency_ns_count") == 2
+
+    def test_bound_metric_error_handling(self):
+        """Test bound handles log instead of raising."""
+        metrics = PrometheusMetrics()
+        bound = metrics.bind("test_counter")
+
+        with patch.object(
+            metrics, "_get_or_create_counter", side_effect=Exception("Test error")
+        ):
+            bound.counter()
+
     def test_error_handling_in_counter(self):
         """Test error handling in counter method."""
         metrics = PrometheusMetrics()
@@ -197,3 +252,87 @@ class TestPrometheusMetrics:
         ):
             metrics.gauge("test_gauge", 1.0)
             # Should not raise, just log error
+
+
+class TestPrometheusExporter:
+    """Test cases for the HTTP exporter and multiprocess mode."""
+
+    def test_serves_registry_over_http(self):
+        from prometheus_client import CollectorRegistry
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(PrometheusConfig(registry=registry))
+        metrics.counter("exported_requests", 2)
+
+        exporter = PrometheusExporter(0, "127.0.0.1", registry)
+        assert exporter.start()
+        try:
+            url = f"http://127.0.0.1:{exporter.port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            exporter.stop()
+
+        assert "exported_requests_total 2.0" in body
+        assert not exporter.serving
+
+    def test_port_in_use_skips_serving(self):
+        from prometheus_client import CollectorRegistry
+
+        registry = CollectorRegistry()
+        first = PrometheusExporter(0, "127.0.0.1", registry)
+        assert first.start()
+        try:
+            second = PrometheusExporter(first.port, "127.0.0.1", registry)
+            assert not second.start()
+            assert not second.serving
+        finally:
+            first.stop()
+
+    def test_multiprocess_registry_merges_processes(self, tmp_path, monkeypatch):
+        script = (
+            "from cadence.metrics import PrometheusMetrics\n"
+            "PrometheusMetrics().counter('multiprocess_requests', 3)\n"
+        )
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        assert is_multiprocess()
+        registry = multiprocess_registry()
+
+        assert registry.get_sample_value("multiprocess_requests_total") == 6
+
+    def test_emitter_registry_unwraps_backends(self):
+        from prometheus_client import CollectorRegistry
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(PrometheusConfig(registry=registry))
+        wrapped = AggregatingMetricsEmitter(
+            CardinalityLimitingEmitter(metrics), flush_interval=None
+        )
+
+        assert emitter_registry(wrapped) is registry
+        assert emitter_registry(NoOpMetricsEmitter()) is None
+
+    def test_mark_process_dead_drops_live_gauges(self, tmp_path, monkeypatch):
+        script = (
+            "from cadence.metrics import PrometheusConfig, PrometheusMetrics\n"
+            "PrometheusMetrics(PrometheusConfig(gauge_multiprocess_mode='livesum'))"
+            ".gauge('live_slots', 3)\n"
+        )
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        process = subprocess.run(
+            [sys.executable, "-c", script + "import os; print(os.getpid())"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        assert multiprocess_registry().get_sample_value("live_slots") == 3
+
+        mark_process_dead(int(process.stdout))
+
+        assert multiprocess_registry().get_sample_value("live_slots") is None
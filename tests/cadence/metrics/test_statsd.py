@@ -0,0 +1,86 @@
+"""Tests for StatsD metrics integration."""
+
+import socket
+from datetime import timedelta
+
+import pytest
+
+from cadence.metrics import StatsdConfig, StatsdMetrics
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(5)
+    yield sock
+    sock.close()
+
+
+def _metrics(receiver: socket.socket, **kwargs) -> StatsdMetrics:
+    config = StatsdConfig(port=receiver.getsockname()[1], flush_interval=None, **kwargs)
+    return StatsdMetrics(config)
+
+
+def _packet(receiver: socket.socket) -> list[str]:
+    return receiver.recv(65535).decode("utf-8").split("\n")
+
+
+class TestStatsdMetrics:
+    def test_lines_are_batched_until_flush(self, receiver):
+        metrics = _metrics(receiver, prefix="svc.")
+        metrics.counter("requests", 2)
+        metrics.gauge("slots", 3.5)
+        metrics.histogram("latency_ns", timedelta(microseconds=1500))
+        metrics.flush()
+
+        assert _packet(receiver) == [
+            "svc.requests:2|c",
+            "svc.slots:3.5|g",
+            "svc.latency_ms:1.5|ms",
+        ]
+        metrics.close()
+
+    def test_plain_statsd_drops_tags(self, receiver):
+        metrics = _metrics(receiver)
+        metrics.with_tags({"Domain": "d"}).counter("requests")
+        metrics.close()
+
+        assert _packet(receiver) == ["requests:1|c"]
+
+    def test_dogstatsd_tags(self, receiver):
+        metrics = _metrics(receiver, dogstatsd=True, default_tags={"env": "test"})
+        metrics.counter("requests", tags={"Domain": "d"})
+        metrics.bind("latency_ns", {"Domain": "d"}).histogram(timedelta(seconds=1))
+        metrics.close()
+
+        assert _packet(receiver) == [
+            "requests:1|c|#env:test,Domain:d",
+            "latency_ms:1000.0|ms|#env:test,Domain:d",
+        ]
+
+    def test_dogstatsd_tags_are_sanitized(self, receiver):
+        metrics = _metrics(receiver, dogstatsd=True)
+        metrics.counter("requests", tags={"Workflow:Type": "a,b|c:d\ne"})
+        metrics.close()
+
+        assert _packet(receiver) == ["requests:1|c|#Workflow_Type:a_b_c_d_e"]
+
+    def test_full_packet_is_sent_before_overflowing(self, receiver):
+        metrics = _metrics(receiver, max_packet_size=40)
+        for _ in range(5):
+            metrics.counter("requests_total")  # 18 bytes per line
+        metrics.close()
+
+        packets = [_packet(receiver) for _ in range(3)]
+        assert [len(p) for p in packets] == [2, 2, 1]
+
+    def test_background_flush(self, receiver):
+        config = StatsdConfig(
+            port=receiver.getsockname()[1], flush_interval=timedelta(milliseconds=10)
+        )
+        metrics = StatsdMetrics(config)
+        metrics.counter("requests")
+
+        assert _packet(receiver) == ["requests:1|c"]
+        metrics.close()
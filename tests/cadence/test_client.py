@@ -1,5 +1,6 @@
 import uuid
 from datetime import timedelta
+from unittest.mock import patch
 
 import grpc
 import grpc.aio
@@ -10,6 +11,8 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from cadence.api.v1.service_workflow_pb2 import (
+    GetWorkflowExecutionHistoryRequest,
+    GetWorkflowExecutionHistoryResponse,
     StartWorkflowExecutionRequest,
     StartWorkflowExecutionResponse,
     SignalWorkflowExecutionRequest,
@@ -21,19 +24,34 @@ from cadence.api.v1.service_workflow_pb2_grpc import (
     WorkflowAPIServicer,
     add_WorkflowAPIServicer_to_server,
 )
-from cadence.client import Client
+from cadence._internal.rpc.hedging import HedgingPolicy
+from cadence.client import ChannelSettings, Client, _channel_settings_to_arguments
 
 
 class _FakeWorkflowServicer(WorkflowAPIServicer):
     """Minimal servicer that returns canned responses for testing."""
 
+    def __init__(self) -> None:
+        # Client address of every call, one per distinct connection
+        self.peers: list[str] = []
+        self.history_peers: list[str] = []
+
     async def StartWorkflowExecution(
         self,
         request: StartWorkflowExecutionRequest,
         context: grpc.aio.ServicerContext,
     ) -> StartWorkflowExecutionResponse:
+        self.peers.append(context.peer())
         return StartWorkflowExecutionResponse(run_id=str(uuid.uuid4()))
 
+    async def GetWorkflowExecutionHistory(
+        self,
+        request: GetWorkflowExecutionHistoryRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> GetWorkflowExecutionHistoryResponse:
+        self.history_peers.append(context.peer())
+        return GetWorkflowExecutionHistoryResponse()
+
     async def SignalWorkflowExecution(
         self,
         request: SignalWorkflowExecutionRequest,
@@ -66,10 +84,15 @@ def otel_setup():
 
 
 @pytest.fixture()
-async def cadence_server():
+def servicer() -> _FakeWorkflowServicer:
+    return _FakeWorkflowServicer()
+
+
+@pytest.fixture()
+async def cadence_server(servicer: _FakeWorkflowServicer):
     """Start a gRPC aio server with the fake WorkflowAPI servicer."""
     server = grpc.aio.server()
-    add_WorkflowAPIServicer_to_server(_FakeWorkflowServicer(), server)
+    add_WorkflowAPIServicer_to_server(servicer, server)
     port = server.add_insecure_port("localhost:0")
     await server.start()
     yield port
@@ -207,3 +230,138 @@ class TestOpenTelemetryGrpcCompatibility:
             assert execution.run_id
         finally:
             await client.close()
+
+
+class TestChannelPool:
+    @pytest.mark.asyncio
+    async def test_pooled_client_round_trips(self, cadence_server: int):
+        client = Client(
+            domain="test-domain",
+            target=f"localhost:{cadence_server}",
+            channel_pool_size=3,
+            long_poll_channel_pool_size=1,
+        )
+        try:
+            await client.ready()
+            for _ in range(4):
+                await client.start_workflow(
+                    "MyWorkflow",
+                    task_list="test-tl",
+                    execution_start_to_close_timeout=timedelta(minutes=10),
+                )
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_each_pooled_channel_has_its_own_connection(
+        self, cadence_server: int, servicer: _FakeWorkflowServicer
+    ):
+        client = Client(
+            domain="test-domain",
+            target=f"localhost:{cadence_server}",
+            channel_pool_size=4,
+        )
+        try:
+            for _ in range(8):
+                await client.start_workflow(
+                    "MyWorkflow",
+                    task_list="test-tl",
+                    execution_start_to_close_timeout=timedelta(minutes=10),
+                )
+        finally:
+            await client.close()
+
+        assert len(set(servicer.peers)) == 4
+
+    @pytest.mark.asyncio
+    async def test_long_polls_use_their_own_connection(
+        self, cadence_server: int, servicer: _FakeWorkflowServicer
+    ):
+        client = Client(
+            domain="test-domain",
+            target=f"localhost:{cadence_server}",
+            long_poll_channel_pool_size=2,
+        )
+        try:
+            await client.start_workflow(
+                "MyWorkflow",
+                task_list="test-tl",
+                execution_start_to_close_timeout=timedelta(minutes=10),
+            )
+            for _ in range(2):
+                await client.workflow_stub.GetWorkflowExecutionHistory(
+                    GetWorkflowExecutionHistoryRequest(
+                        domain="test-domain", wait_for_new_event=True
+                    )
+                )
+        finally:
+            await client.close()
+
+        history_peers = set(servicer.history_peers)
+        assert len(history_peers) == 2
+        assert history_peers.isdisjoint(servicer.peers)
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError, match="channel_pool_size"):
+            Client(domain="test-domain", target="localhost:7933", channel_pool_size=0)
+
+
+class TestHedging:
+    def test_hedging_rejects_non_idempotent_methods(self):
+        with pytest.raises(ValueError, match="SignalWorkflowExecution"):
+            Client(
+                domain="test-domain",
+                target="localhost:7933",
+                rpc_hedging_policies={"SignalWorkflowExecution": HedgingPolicy()},
+            )
+
+
+class TestChannelSettings:
+    def test_settings_translate_to_channel_arguments(self):
+        assert _channel_settings_to_arguments(
+            ChannelSettings(
+                keepalive_time=timedelta(seconds=30),
+                keepalive_timeout=timedelta(milliseconds=500),
+                keepalive_permit_without_calls=True,
+                max_receive_message_length=64 * 1024 * 1024,
+            )
+        ) == {
+            "grpc.keepalive_time_ms": 30000,
+            "grpc.keepalive_timeout_ms": 500,
+            "grpc.keepalive_permit_without_calls": 1,
+            "grpc.max_receive_message_length": 64 * 1024 * 1024,
+        }
+
+    def test_long_poll_settings_get_a_dedicated_channel(self):
+        with patch("grpc.aio.insecure_channel") as insecure_channel:
+            Client(
+                domain="test-domain",
+                target="localhost:7933",
+                channel_arguments={"grpc.lb_policy_name": "round_robin"},
+                channel_settings=ChannelSettings(keepalive_time=timedelta(seconds=10)),
+                long_poll_channel_settings=ChannelSettings(
+                    keepalive_time=timedelta(seconds=90)
+                ),
+            )
+
+        channel_options = [
+            dict(c.kwargs["options"]) for c in insecure_channel.call_args_list
+        ]
+        assert channel_options == [
+            {
+                "grpc.lb_policy_name": "round_robin",
+                "grpc.keepalive_time_ms": 10000,
+                "grpc.use_local_subchannel_pool": 1,
+            },
+            {
+                "grpc.lb_policy_name": "round_robin",
+                "grpc.keepalive_time_ms": 90000,
+                "grpc.use_local_subchannel_pool": 1,
+            },
+        ]
+
+    def test_single_channel_by_default(self):
+        with patch("grpc.aio.insecure_channel") as insecure_channel:
+            Client(domain="test-domain", target="localhost:7933")
+
+        insecure_channel.assert_called_once()
@@ -1,22 +1,44 @@
+import asyncio
 import pytest
 import uuid
 from datetime import timedelta, datetime, timezone
 from typing import Any, cast
 from unittest.mock import AsyncMock, Mock, PropertyMock
 
-from cadence.api.v1.common_pb2 import WorkflowExecution
+from grpc import StatusCode
+
+from cadence.api.v1.common_pb2 import Failure, Payload, WorkflowExecution
+from cadence.api.v1.history_pb2 import (
+    EVENT_FILTER_TYPE_CLOSE_EVENT,
+    History,
+    HistoryEvent,
+    WorkflowExecutionCompletedEventAttributes,
+    WorkflowExecutionContinuedAsNewEventAttributes,
+    WorkflowExecutionFailedEventAttributes,
+)
 from cadence.api.v1.service_workflow_pb2 import (
     StartWorkflowExecutionRequest,
     StartWorkflowExecutionResponse,
     SignalWithStartWorkflowExecutionResponse,
+    SignalWithStartWorkflowExecutionAsyncResponse,
+    StartWorkflowExecutionAsyncResponse,
+    GetWorkflowExecutionHistoryResponse,
+    DescribeWorkflowExecutionResponse,
 )
 from cadence.client import (
     Client,
     StartWorkflowOptions,
+    WorkflowStartSpec,
     _validate_and_apply_defaults,
 )
 from cadence.api.v1 import workflow_pb2
+from cadence.api.v1.workflow_pb2 import WorkflowExecutionInfo
 from cadence.data_converter import DefaultDataConverter
+from cadence.error import (
+    CadenceRpcError,
+    WorkflowExecutionContinuedAsNewError,
+    WorkflowExecutionFailedError,
+)
 from cadence.workflow import (
     ActiveClusterSelectionPolicy,
     WorkflowDefinition,
@@ -906,3 +928,503 @@ class TestBuildStartWorkflowRequestRetryPolicy:
         assert request.start_request.HasField("retry_policy")
         assert request.start_request.retry_policy.initial_interval.seconds == 3
         assert request.start_request.retry_policy.maximum_attempts == 2
+
+
+class TestStartWorkflowsBulk:
+    """Test Client.start_workflows_bulk and signal_with_start_workflows_bulk."""
+
+    @staticmethod
+    def _options() -> StartWorkflowOptions:
+        return StartWorkflowOptions(
+            task_list="tl",
+            execution_start_to_close_timeout=timedelta(minutes=5),
+        )
+
+    @pytest.mark.asyncio
+    async def test_start_workflows_bulk_reports_each_spec(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+
+        async def start(request):
+            if request.workflow_id == "wf-1":
+                raise Exception("already started")
+            return StartWorkflowExecutionResponse(run_id=f"run-{request.workflow_id}")
+
+        client._workflow_stub.StartWorkflowExecution = AsyncMock(side_effect=start)
+
+        options = self._options()
+        specs = [
+            WorkflowStartSpec("WF", args=(i,), workflow_id=f"wf-{i}", options=options)
+            for i in range(3)
+        ]
+        results = sorted(
+            [r async for r in client.start_workflows_bulk(specs, max_concurrency=2)],
+            key=lambda r: r.index,
+        )
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[0].ok
+        assert results[0].execution is not None
+        assert results[0].execution.run_id == "run-wf-0"
+        assert not results[1].ok
+        assert str(results[1].error) == "already started"
+        assert results[2].execution is not None
+        assert results[2].execution.workflow_id == "wf-2"
+
+        requests = [
+            c.args[0]
+            for c in client._workflow_stub.StartWorkflowExecution.call_args_list
+        ]
+        assert len({r.request_id for r in requests}) == 3
+        for request in requests:
+            assert request.task_list.name == "tl"
+            assert request.task_start_to_close_timeout.seconds == 10
+            assert (
+                request.workflow_id_reuse_policy
+                == workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE_FAILED_ONLY
+            )
+        # Defaults are applied to a copy, never to the caller's options.
+        assert "task_start_to_close_timeout" not in options
+
+    @pytest.mark.asyncio
+    async def test_start_workflows_bulk_invalid_options_fail_per_spec(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.StartWorkflowExecution = AsyncMock(
+            return_value=StartWorkflowExecutionResponse(run_id="run")
+        )
+
+        specs = [
+            WorkflowStartSpec("WF", options=StartWorkflowOptions(task_list="tl")),
+            WorkflowStartSpec("WF", options=self._options()),
+        ]
+        results = {r.index: r async for r in client.start_workflows_bulk(specs)}
+
+        assert isinstance(results[0].error, ValueError)
+        assert results[1].ok
+        client._workflow_stub.StartWorkflowExecution.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_signal_with_start_workflows_bulk(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.SignalWithStartWorkflowExecution = AsyncMock(
+            return_value=SignalWithStartWorkflowExecutionResponse(run_id="run")
+        )
+
+        options = self._options()
+        specs = [
+            WorkflowStartSpec(
+                "WF",
+                workflow_id="wf",
+                options=options,
+                signal_name="sig",
+                signal_args=("payload",),
+            ),
+            WorkflowStartSpec("WF", options=options),
+        ]
+        results = {
+            r.index: r async for r in client.signal_with_start_workflows_bulk(specs)
+        }
+
+        assert results[0].execution is not None
+        assert results[0].execution.workflow_id == "wf"
+        assert isinstance(results[1].error, ValueError)
+
+        request = client._workflow_stub.SignalWithStartWorkflowExecution.call_args[0][0]
+        assert request.signal_name == "sig"
+        assert request.signal_input.data == b'"payload"'
+        assert (
+            request.start_request.workflow_id_reuse_policy
+            == workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE
+        )
+
+
+class TestStartWorkflowAsync:
+    """Test Client.start_workflow_async and signal_with_start_workflow_async."""
+
+    @pytest.mark.asyncio
+    async def test_start_workflow_async(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.StartWorkflowExecutionAsync = AsyncMock(
+            return_value=StartWorkflowExecutionAsyncResponse()
+        )
+
+        execution = await client.start_workflow_async(
+            "WF",
+            "arg",
+            task_list="tl",
+            workflow_id="wf-id",
+            execution_start_to_close_timeout=timedelta(minutes=5),
+        )
+
+        assert execution.workflow_id == "wf-id"
+        assert execution.run_id == ""
+        request = client._workflow_stub.StartWorkflowExecutionAsync.call_args[0][0]
+        assert request.request.workflow_id == "wf-id"
+        assert request.request.workflow_type.name == "WF"
+        assert request.request.input.data == b'"arg"'
+
+    @pytest.mark.asyncio
+    async def test_signal_with_start_workflow_async(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.SignalWithStartWorkflowExecutionAsync = AsyncMock(
+            return_value=SignalWithStartWorkflowExecutionAsyncResponse()
+        )
+
+        execution = await client.signal_with_start_workflow_async(
+            "WF",
+            "sig",
+            ["payload"],
+            task_list="tl",
+            execution_start_to_close_timeout=timedelta(minutes=5),
+        )
+
+        request = client._workflow_stub.SignalWithStartWorkflowExecutionAsync.call_args[
+            0
+        ][0]
+        assert execution.workflow_id == request.request.start_request.workflow_id
+        assert execution.workflow_id
+        assert request.request.signal_name == "sig"
+        assert request.request.signal_input.data == b'"payload"'
+        assert (
+            request.request.start_request.workflow_id_reuse_policy
+            == workflow_pb2.WORKFLOW_ID_REUSE_POLICY_ALLOW_DUPLICATE
+        )
+
+
+async def _describe_current_run(request) -> DescribeWorkflowExecutionResponse:
+    workflow_id = request.workflow_execution.workflow_id
+    return DescribeWorkflowExecutionResponse(
+        workflow_execution_info=WorkflowExecutionInfo(
+            workflow_execution=WorkflowExecution(
+                workflow_id=workflow_id, run_id=f"{workflow_id}-current"
+            )
+        )
+    )
+
+
+class TestGetWorkflowResult:
+    """Test Client.get_workflow_result."""
+
+    @staticmethod
+    def _history(*events: HistoryEvent) -> GetWorkflowExecutionHistoryResponse:
+        return GetWorkflowExecutionHistoryResponse(history=History(events=events))
+
+    @pytest.mark.asyncio
+    async def test_long_polls_until_closed_and_follows_continue_as_new(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            side_effect=[
+                self._history(),
+                CadenceRpcError("deadline", StatusCode.DEADLINE_EXCEEDED),
+                self._history(
+                    HistoryEvent(
+                        workflow_execution_continued_as_new_event_attributes=WorkflowExecutionContinuedAsNewEventAttributes(
+                            new_execution_run_id="run-2"
+                        )
+                    )
+                ),
+                self._history(
+                    HistoryEvent(
+                        workflow_execution_completed_event_attributes=WorkflowExecutionCompletedEventAttributes(
+                            result=Payload(data=b'{"value": 3}')
+                        )
+                    )
+                ),
+            ]
+        )
+
+        result = await client.get_workflow_result("wf", result_type=dict)
+
+        assert result == {"value": 3}
+        requests = [
+            c.args[0]
+            for c in client._workflow_stub.GetWorkflowExecutionHistory.call_args_list
+        ]
+        assert [r.workflow_execution.run_id for r in requests] == [
+            "wf-current",
+            "wf-current",
+            "wf-current",
+            "run-2",
+        ]
+        for request in requests:
+            assert request.wait_for_new_event
+            assert request.history_event_filter_type == EVENT_FILTER_TYPE_CLOSE_EVENT
+
+    @pytest.mark.asyncio
+    async def test_raises_on_failure(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            return_value=self._history(
+                HistoryEvent(
+                    workflow_execution_failed_event_attributes=WorkflowExecutionFailedEventAttributes(
+                        failure=Failure(reason="boom")
+                    )
+                )
+            )
+        )
+
+        with pytest.raises(WorkflowExecutionFailedError, match="boom") as exc_info:
+            await client.get_workflow_result("wf", "run-1")
+
+        assert exc_info.value.run_id == "run-1"
+
+    @pytest.mark.asyncio
+    async def test_current_run_reports_its_run_id(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            return_value=self._history(
+                HistoryEvent(
+                    workflow_execution_failed_event_attributes=WorkflowExecutionFailedEventAttributes(
+                        failure=Failure(reason="boom")
+                    )
+                )
+            )
+        )
+
+        with pytest.raises(WorkflowExecutionFailedError) as exc_info:
+            await client.get_workflow_result("wf")
+
+        assert exc_info.value.run_id == "wf-current"
+        describe = client._workflow_stub.DescribeWorkflowExecution.call_args.args[0]
+        assert describe.domain == "test-domain"
+        assert describe.workflow_execution.workflow_id == "wf"
+
+    @pytest.mark.asyncio
+    async def test_continue_as_new_without_following(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            return_value=self._history(
+                HistoryEvent(
+                    workflow_execution_continued_as_new_event_attributes=WorkflowExecutionContinuedAsNewEventAttributes(
+                        new_execution_run_id="run-2"
+                    )
+                )
+            )
+        )
+
+        with pytest.raises(WorkflowExecutionContinuedAsNewError) as exc_info:
+            await client.get_workflow_result("wf", "run-1", follow_runs=False)
+
+        assert exc_info.value.new_run_id == "run-2"
+
+    @pytest.mark.asyncio
+    async def test_propagates_other_rpc_errors(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            side_effect=CadenceRpcError("not found", StatusCode.NOT_FOUND)
+        )
+
+        with pytest.raises(CadenceRpcError, match="not found"):
+            await client.get_workflow_result("wf")
+
+
+class TestWorkflowResultWaiter:
+    """Test Client.result_waiter."""
+
+    @staticmethod
+    def _completed(value: int) -> GetWorkflowExecutionHistoryResponse:
+        return GetWorkflowExecutionHistoryResponse(
+            history=History(
+                events=[
+                    HistoryEvent(
+                        workflow_execution_completed_event_attributes=WorkflowExecutionCompletedEventAttributes(
+                            result=Payload(data=str(value).encode())
+                        )
+                    )
+                ]
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight_polls_and_rotates(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        in_flight = 0
+        peak = 0
+        polls: list[str] = []
+
+        async def poll(request, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            workflow_id = request.workflow_execution.workflow_id
+            polls.append(workflow_id)
+            # Each workflow closes on its second poll
+            if polls.count(workflow_id) == 1:
+                return GetWorkflowExecutionHistoryResponse()
+            return self._completed(int(workflow_id))
+
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(side_effect=poll)
+
+        async with client.result_waiter(
+            max_concurrent_polls=2, min_repoll_interval=timedelta(0)
+        ) as waiter:
+            futures = [waiter.wait(str(i), result_type=int) for i in range(5)]
+            assert waiter.pending == 5
+            results = await asyncio.gather(*futures)
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert waiter.pending == 0
+        # Every workflow gets its first poll before any gets a second one.
+        assert sorted(polls[:5]) == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_errors_resolve_only_their_future(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+
+        async def poll(request, timeout):
+            if request.workflow_execution.workflow_id == "bad":
+                raise CadenceRpcError("not found", StatusCode.NOT_FOUND)
+            return self._completed(1)
+
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(side_effect=poll)
+
+        async with client.result_waiter() as waiter:
+            bad = waiter.wait("bad")
+            good = waiter.wait("good", result_type=int)
+            with pytest.raises(CadenceRpcError):
+                await bad
+            assert await good == 1
+
+    @pytest.mark.asyncio
+    async def test_current_run_is_resolved_before_polling(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(
+            return_value=GetWorkflowExecutionHistoryResponse(
+                history=History(
+                    events=[
+                        HistoryEvent(
+                            workflow_execution_failed_event_attributes=WorkflowExecutionFailedEventAttributes(
+                                failure=Failure(reason="boom")
+                            )
+                        )
+                    ]
+                )
+            )
+        )
+
+        async with client.result_waiter() as waiter:
+            with pytest.raises(WorkflowExecutionFailedError) as exc_info:
+                await waiter.wait("wf")
+
+        assert exc_info.value.run_id == "wf-current"
+        poll = client._workflow_stub.GetWorkflowExecutionHistory.call_args.args[0]
+        assert poll.workflow_execution.run_id == "wf-current"
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_unresolved(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+
+        async def poll(request, timeout):
+            await asyncio.sleep(0)
+            return GetWorkflowExecutionHistoryResponse()
+
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(side_effect=poll)
+
+        waiter = client.result_waiter(max_concurrent_polls=1)
+        futures = [waiter.wait("a"), waiter.wait("b")]
+        await asyncio.sleep(0.01)
+        await waiter.close()
+
+        assert all(f.cancelled() for f in futures)
+        with pytest.raises(RuntimeError):
+            waiter.wait("c")
+
+    @pytest.mark.asyncio
+    async def test_cancelling_future_cancels_in_flight_poll(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        started = asyncio.Event()
+        poll_cancelled = asyncio.Event()
+
+        async def poll(request, timeout):
+            if request.workflow_execution.workflow_id == "fast":
+                return self._completed(1)
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                poll_cancelled.set()
+                raise
+
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(side_effect=poll)
+
+        async with client.result_waiter(max_concurrent_polls=1) as waiter:
+            slow = waiter.wait("slow")
+            await started.wait()
+            fast = waiter.wait("fast", result_type=int)
+            slow.cancel()
+
+            await asyncio.wait_for(poll_cancelled.wait(), timeout=1)
+            # The freed slot moves on to the next execution
+            assert await asyncio.wait_for(fast, timeout=1) == 1
+
+    @pytest.mark.asyncio
+    async def test_immediate_deadline_exceeded_waits_before_repolling(self):
+        client = Client(domain="test-domain", target="localhost:7933")
+        client._workflow_stub = Mock()
+        client._workflow_stub.DescribeWorkflowExecution = AsyncMock(
+            side_effect=_describe_current_run
+        )
+        poll_times: list[float] = []
+
+        async def poll(request, timeout):
+            poll_times.append(asyncio.get_running_loop().time())
+            if len(poll_times) < 3:
+                raise CadenceRpcError("deadline", StatusCode.DEADLINE_EXCEEDED)
+            return self._completed(1)
+
+        client._workflow_stub.GetWorkflowExecutionHistory = AsyncMock(side_effect=poll)
+
+        interval = timedelta(milliseconds=50)
+        async with client.result_waiter(min_repoll_interval=interval) as waiter:
+            assert await waiter.wait("wf", result_type=int) == 1
+
+        gaps = [b - a for a, b in zip(poll_times, poll_times[1:])]
+        assert len(gaps) == 2
+        assert all(gap >= interval.total_seconds() * 0.9 for gap in gaps)
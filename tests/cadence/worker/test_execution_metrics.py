@@ -1,6 +1,7 @@
 """Tests for decision task execution and workflow lifecycle metrics."""
 
 import asyncio
+import time
 from datetime import timedelta
 from typing import cast
 import pytest
@@ -21,12 +22,21 @@ from cadence.client import Client
 from cadence.data_converter import DefaultDataConverter
 from cadence.metrics import MetricsEmitter
 from cadence.metrics.constants import (
+    DECISION_CPU_TIME,
     DECISION_EXECUTION_FAILED_COUNTER,
     DECISION_EXECUTION_LATENCY,
+    DECISION_EXECUTOR_QUEUE_LATENCY,
+    DECISION_HISTORY_BYTES_COUNTER,
+    DECISION_HISTORY_EVENTS_COUNTER,
+    DECISION_HISTORY_FETCH_LATENCY,
+    DECISION_NEW_EVENTS_LATENCY,
+    DECISION_REPLAY_LATENCY,
     DECISION_RESPONSE_FAILED_COUNTER,
     DECISION_RESPONSE_LATENCY,
     DECISION_TASK_COMPLETED_COUNTER,
+    DECISION_SERIALIZATION_LATENCY,
     DECISION_TASK_PANIC_COUNTER,
+    DECISION_WORKFLOW_CODE_LATENCY,
     TAG_DOMAIN,
     TAG_TASK_LIST,
     TAG_WORKFLOW_TYPE,
@@ -37,11 +47,15 @@ from cadence.metrics.constants import (
     WORKFLOW_FAILED_COUNTER,
     WORKFLOW_GET_HISTORY_COUNTER,
     WORKFLOW_GET_HISTORY_LATENCY,
+    WORKFLOW_REPLAY_COUNTER,
+    WORKFLOW_REPLAYED_EVENTS_COUNTER,
 )
 from cadence.worker._decision_task_handler import DecisionTaskHandler
 from cadence.worker._registry import Registry
+from cadence.worker._replay_cost import RunCost, RunKey
 from cadence._internal.workflow.workflow_engine import (
     DecisionResult,
+    DecisionStats,
     _outcome_from_decision,
 )
 
@@ -117,7 +131,7 @@ def _make_task(with_query: bool = False) -> Mock:
     return task
 
 
-def _make_handler(emitter=None, registry=None) -> DecisionTaskHandler:
+def _make_handler(emitter=None, registry=None, **options) -> DecisionTaskHandler:
     client = _mock_client()
     if registry is None:
         registry = Registry()
@@ -127,6 +141,7 @@ def _make_handler(emitter=None, registry=None) -> DecisionTaskHandler:
         registry=registry,
         identity="test-id",
         metrics_emitter=emitter or _mock_emitter(),
+        **options,
     )
 
 
@@ -228,6 +243,65 @@ class TestDecisionExecutionMetrics:
         histogram_names = [c.args[0] for c in _tagged(emitter).histogram.call_args_list]
         assert DECISION_EXECUTION_LATENCY in histogram_names
 
+    @pytest.mark.asyncio
+    async def test_emits_history_size_and_phase_latencies(self):
+        emitter = _mock_emitter()
+        handler = _make_handler(
+            emitter, _mock_registry(), replay_cost_log_interval=timedelta(minutes=1)
+        )
+        task = _make_task()
+        events = [_make_started_event(), _make_started_event(event_time_seconds=5)]
+        dr = DecisionResult(decisions=[])
+
+        def process_decision(stats: DecisionStats):
+            stats.started_ns = time.monotonic_ns()
+            stats.replay_ns = 3_000
+            stats.new_events_ns = 2_000
+            stats.workflow_code_ns = 1_000
+            stats.serialization_ns = 500
+            stats.cpu_ns = 4_000
+            stats.replayed_events = 7
+            return dr
+
+        with (
+            patch(
+                "cadence.worker._decision_task_handler.iterate_history_events",
+                return_value=_async_iter(events),
+            ),
+            patch("cadence.worker._decision_task_handler.WorkflowEngine") as engine_cls,
+            patch.object(handler, "_respond_decision_task_completed", new=AsyncMock()),
+        ):
+            loop = asyncio.get_event_loop()
+
+            async def run_in_executor(executor, fn, *args):
+                return process_decision(engine_cls.call_args.kwargs["stats"])
+
+            with patch.object(loop, "run_in_executor", new=run_in_executor):
+                await handler._handle_task_implementation(task)
+
+        tagged = _tagged(emitter)
+        tagged.counter.assert_any_call(DECISION_HISTORY_EVENTS_COUNTER, 2)
+        tagged.counter.assert_any_call(
+            DECISION_HISTORY_BYTES_COUNTER, sum(e.ByteSize() for e in events)
+        )
+        histograms = {c.args[0]: c.args[1] for c in tagged.histogram.call_args_list}
+        assert DECISION_HISTORY_FETCH_LATENCY in histograms
+        assert histograms[DECISION_EXECUTOR_QUEUE_LATENCY] >= timedelta(0)
+        assert histograms[DECISION_REPLAY_LATENCY] == timedelta(microseconds=3)
+        assert histograms[DECISION_NEW_EVENTS_LATENCY] == timedelta(microseconds=2)
+        assert histograms[DECISION_WORKFLOW_CODE_LATENCY] == timedelta(microseconds=1)
+        assert DECISION_SERIALIZATION_LATENCY in histograms
+        assert histograms[DECISION_CPU_TIME] == timedelta(microseconds=4)
+        tagged.counter.assert_any_call(WORKFLOW_REPLAY_COUNTER)
+        tagged.counter.assert_any_call(WORKFLOW_REPLAYED_EVENTS_COUNTER, 7)
+        assert handler.replay_costs is not None
+        assert handler.replay_costs.heaviest() == [
+            (
+                RunKey(WF_TYPE, "wf-id", "run-id"),
+                RunCost(cpu_ns=4_000, events=2, decision_tasks=1),
+            )
+        ]
+
 
 # ---------------------------------------------------------------------------
 # DecisionTaskHandler: response metrics
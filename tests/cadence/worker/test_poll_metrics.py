@@ -24,9 +24,12 @@ from cadence.metrics.constants import (
     DECISION_POLL_SUCCEED_COUNTER,
     DECISION_POLL_TRANSIENT_FAILED_COUNTER,
     DECISION_SCHEDULED_TO_START_LATENCY,
+    POLLER_BACKOFF_GAUGE,
+    POLLER_CONSECUTIVE_FAILURES_GAUGE,
     POLLER_START_COUNTER,
     TAG_DOMAIN,
     TAG_TASK_LIST,
+    TAG_WORKER_TYPE,
     WORKER_PANIC_COUNTER,
     WORKER_START_COUNTER,
 )
@@ -129,6 +132,19 @@ class TestDecisionWorkerRunMetrics:
 
         emitter.counter.assert_any_call(WORKER_PANIC_COUNTER, 1, tags=EXPECTED_TAGS)
 
+    @pytest.mark.asyncio
+    async def test_poll_backoff_gauges_tagged_with_worker_type(self):
+        emitter = _mock_emitter()
+        worker = DecisionWorker(
+            _mock_client(), TASK_LIST, Registry(), _worker_options(emitter)
+        )
+
+        worker._poller._report_backoff(2, timedelta(milliseconds=500))
+
+        tags = {**EXPECTED_TAGS, TAG_WORKER_TYPE: "DecisionWorker"}
+        emitter.gauge.assert_any_call(POLLER_CONSECUTIVE_FAILURES_GAUGE, 2, tags=tags)
+        emitter.gauge.assert_any_call(POLLER_BACKOFF_GAUGE, 0.5, tags=tags)
+
     @pytest.mark.asyncio
     async def test_no_panic_counter_on_normal_exit(self):
         emitter = _mock_emitter()
@@ -1,9 +1,13 @@
 import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from grpc import StatusCode
 
-from cadence.worker._poller import Poller
+from cadence._internal.rpc.retry import ExponentialRetryPolicy
+from cadence.error import CircuitOpenError, ServiceBusyError
+from cadence.worker._poller import DEFAULT_POLL_BACKOFF, Poller
 
 
 @pytest.mark.asyncio
@@ -176,3 +180,185 @@ async def test_poller_execute_error():
 
     assert result == "second"
     task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_poller_waits_while_circuit_open():
+    permits = asyncio.Semaphore(1)
+    call_count = 0
+
+    async def poll_func():
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise CircuitOpenError(
+                "open",
+                StatusCode.UNAVAILABLE,
+                "PollForDecisionTask",
+                timedelta(seconds=3),
+            )
+        return "foo"
+
+    outgoing = asyncio.Queue[str]()
+    poller = Poller(1, permits, poll_func, outgoing.put)
+
+    with patch("cadence.worker._poller.asyncio.sleep", new=AsyncMock()) as sleep:
+        task = asyncio.create_task(poller.run())
+        result = await outgoing.get()
+        task.cancel()
+
+    assert result == "foo"
+    sleep.assert_awaited_once_with(3.0)
+
+
+@pytest.mark.asyncio
+async def test_poller_never_retries_a_rejected_poll_immediately():
+    permits = asyncio.Semaphore(1)
+    call_count = 0
+
+    async def poll_func():
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise CircuitOpenError(
+                "open", StatusCode.UNAVAILABLE, "PollForDecisionTask", timedelta(0)
+            )
+        return "foo"
+
+    outgoing = asyncio.Queue[str]()
+    poller = Poller(1, permits, poll_func, outgoing.put)
+
+    with patch("cadence.worker._poller.asyncio.sleep", new=AsyncMock()) as sleep:
+        task = asyncio.create_task(poller.run())
+        result = await outgoing.get()
+        task.cancel()
+
+    assert result == "foo"
+    sleep.assert_awaited_once_with(
+        DEFAULT_POLL_BACKOFF.initial_interval.total_seconds()
+    )
+
+
+@pytest.mark.asyncio
+async def test_poller_backs_off_on_consecutive_failures():
+    permits = asyncio.Semaphore(1)
+    errors: list[Exception] = [
+        RuntimeError("oh no"),
+        RuntimeError("oh no"),
+        ServiceBusyError("busy", StatusCode.RESOURCE_EXHAUSTED, "reason"),
+    ]
+
+    async def poll_func():
+        if errors:
+            raise errors.pop(0)
+        return "foo"
+
+    backoff = ExponentialRetryPolicy(
+        initial_interval=timedelta(milliseconds=100),
+        backoff_coefficient=2,
+        max_interval=timedelta(seconds=10),
+        max_attempts=0,
+    )
+    reports: list[tuple[int, timedelta]] = []
+    outgoing = asyncio.Queue[str]()
+    poller = Poller(
+        1,
+        permits,
+        poll_func,
+        outgoing.put,
+        backoff=backoff,
+        on_backoff=lambda failures, delay: reports.append((failures, delay)),
+    )
+
+    with patch("cadence.worker._poller.asyncio.sleep", new=AsyncMock()) as sleep:
+        task = asyncio.create_task(poller.run())
+        result = await outgoing.get()
+        task.cancel()
+
+    assert result == "foo"
+    assert reports == [
+        (1, timedelta(milliseconds=100)),
+        (2, timedelta(milliseconds=200)),
+        # ServiceBusyError never backs off less than a second
+        (3, timedelta(seconds=1)),
+        (0, timedelta(0)),
+    ]
+    assert [c.args[0] for c in sleep.await_args_list] == [0.1, 0.2, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_poller_keeps_polling_at_max_interval_through_long_outages():
+    permits = asyncio.Semaphore(1)
+    failures = 150
+    polls = 0
+
+    async def poll_func():
+        nonlocal polls
+        polls += 1
+        if polls <= failures:
+            raise RuntimeError("frontend down")
+        return "foo"
+
+    backoff = ExponentialRetryPolicy(
+        initial_interval=timedelta(microseconds=1),
+        backoff_coefficient=2,
+        max_interval=timedelta(milliseconds=1),
+        max_attempts=0,
+    )
+    reports: list[tuple[int, timedelta]] = []
+    outgoing = asyncio.Queue[str]()
+    poller = Poller(
+        1,
+        permits,
+        poll_func,
+        outgoing.put,
+        backoff=backoff,
+        on_backoff=lambda failures, delay: reports.append((failures, delay)),
+    )
+
+    with patch("cadence.worker._poller.logger"):
+        task = asyncio.create_task(poller.run())
+        result = await asyncio.wait_for(outgoing.get(), timeout=5)
+        task.cancel()
+
+    assert result == "foo"
+    assert len(reports) == failures + 1
+    assert reports[-2] == (failures, timedelta(milliseconds=1))
+    assert all(delay == timedelta(milliseconds=1) for _, delay in reports[10:-1])
+
+
+@pytest.mark.asyncio
+async def test_poller_tracks_permits_and_in_flight_tasks():
+    permits = asyncio.Semaphore(3)
+    incoming = asyncio.Queue[str]()
+    started = asyncio.Queue[str]()
+    done = asyncio.Event()
+    waits: list[timedelta] = []
+
+    async def execute(item: str):
+        await started.put(item)
+        await done.wait()
+
+    poller = Poller(2, permits, incoming.get, execute, on_permit_wait=waits.append)
+    task = asyncio.create_task(poller.run())
+
+    await incoming.put("foo")
+    async with asyncio.timeout(1):
+        await started.get()
+
+    assert poller.active_pollers == 2
+    assert poller.in_flight_tasks == 1
+    # One executing task plus two polls waiting on the queue
+    assert poller.held_permits == 3
+    assert len(waits) == 3
+    assert all(wait >= timedelta(0) for wait in waits)
+
+    done.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert poller.in_flight_tasks == 0
+    assert poller.held_permits == 2
+
+    task.cancel()
+    await task
+    assert poller.active_pollers == 0
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+import pytest
+
+from cadence.worker._replay_cost import ReplayCostTracker, RunCost, RunKey
+
+LIGHT = RunKey("Light", "wf-light", "run-light")
+HEAVY = RunKey("Heavy", "wf-heavy", "run-heavy")
+MEDIUM = RunKey("Medium", "wf-medium", "run-medium")
+
+
+def test_heaviest_orders_runs_by_cpu_time():
+    tracker = ReplayCostTracker(top_n=2)
+    tracker.record(LIGHT, cpu_ns=100, events=10)
+    tracker.record(HEAVY, cpu_ns=5_000, events=1_000)
+    tracker.record(MEDIUM, cpu_ns=1_000, events=100)
+    tracker.record(HEAVY, cpu_ns=5_000, events=1_001)
+
+    assert tracker.heaviest() == [
+        (HEAVY, RunCost(cpu_ns=10_000, events=2_001, decision_tasks=2)),
+        (MEDIUM, RunCost(cpu_ns=1_000, events=100, decision_tasks=1)),
+    ]
+
+
+def test_log_heaviest_resets(caplog):
+    tracker = ReplayCostTracker()
+    tracker.record(HEAVY, cpu_ns=2_000_000, events=50)
+
+    with caplog.at_level(logging.INFO, logger="cadence.worker._replay_cost"):
+        tracker.log_heaviest()
+
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.workflow_type == "Heavy"
+    assert record.run_id == "run-heavy"
+    assert record.cpu_ms == 2.0
+    assert tracker.heaviest() == []
+
+
+@pytest.mark.asyncio
+async def test_run_logs_until_cancelled(caplog):
+    tracker = ReplayCostTracker()
+    tracker.record(HEAVY, cpu_ns=1, events=1)
+
+    with caplog.at_level(logging.INFO, logger="cadence.worker._replay_cost"):
+        task = asyncio.create_task(tracker.run(timedelta(milliseconds=1)))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert [r.run_id for r in caplog.records] == ["run-heavy"]
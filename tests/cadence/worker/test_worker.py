@@ -1,8 +1,11 @@
 import asyncio
+import urllib.request
+from datetime import timedelta
 
 import pytest
+from prometheus_client import CollectorRegistry
 
-from unittest.mock import AsyncMock, Mock, PropertyMock
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
 from cadence.api.v1.service_worker_pb2 import (
     PollForDecisionTaskRequest,
@@ -10,6 +13,7 @@ from cadence.api.v1.service_worker_pb2 import (
 )
 from cadence.api.v1.tasklist_pb2 import TaskList, TaskListKind
 from cadence.client import Client
+from cadence.metrics import PrometheusConfig, PrometheusMetrics
 from cadence.worker import Worker, Registry
 
 
@@ -65,3 +69,89 @@ async def test_worker():
         ),
         timeout=60.0,
     )
+
+
+@pytest.mark.asyncio
+async def test_worker_serves_metrics():
+    client = Mock(spec=Client)
+    # The worker serves its emitter's registry rather than the global one
+    emitter = PrometheusMetrics(PrometheusConfig(registry=CollectorRegistry()))
+    emitter.counter("worker_test_requests")
+    done = asyncio.Event()
+
+    async def poll(_, timeout=0.0):
+        await done.wait()
+        return None
+
+    worker_stub = Mock()
+    worker_stub.PollForDecisionTask = AsyncMock(side_effect=poll)
+    worker_stub.PollForActivityTask = AsyncMock(side_effect=poll)
+    client.worker_stub = worker_stub
+    type(client).domain = PropertyMock(return_value="domain")
+    type(client).identity = PropertyMock(return_value="identity")
+    type(client).context_propagators = PropertyMock(return_value=())
+
+    worker = Worker(
+        client,
+        "task_list",
+        Registry(),
+        identity="identity",
+        metrics_emitter=emitter,
+        metrics_server_port=0,
+        metrics_server_address="127.0.0.1",
+    )
+    exporter = worker._metrics_exporter
+    assert exporter is not None
+
+    with patch("cadence.worker._worker.mark_process_dead") as mark_process_dead:
+        async with worker:
+            serving = exporter.serving
+            url = f"http://127.0.0.1:{exporter.port}/metrics"
+            body = await asyncio.to_thread(_fetch, url)
+
+    assert serving
+    assert "worker_test_requests_total 1.0" in body
+    assert not exporter.serving
+    mark_process_dead.assert_called_once_with()
+
+
+def _fetch(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read().decode("utf-8")  # type: ignore[no-any-return]
+
+
+@pytest.mark.asyncio
+async def test_worker_dumps_profile_on_close(tmp_path):
+    client = Mock(spec=Client)
+    done = asyncio.Event()
+
+    async def poll(_, timeout=0.0):
+        await done.wait()
+        return None
+
+    worker_stub = Mock()
+    worker_stub.PollForDecisionTask = AsyncMock(side_effect=poll)
+    worker_stub.PollForActivityTask = AsyncMock(side_effect=poll)
+    client.worker_stub = worker_stub
+    type(client).domain = PropertyMock(return_value="domain")
+    type(client).identity = PropertyMock(return_value="identity")
+    type(client).context_propagators = PropertyMock(return_value=())
+
+    output = tmp_path / "profile.folded"
+    worker = Worker(
+        client,
+        "task_list",
+        Registry(),
+        identity="identity",
+        profiler_sample_interval=timedelta(milliseconds=1),
+        profiler_output_path=str(output),
+    )
+    profiler = worker.profiler
+    assert profiler is not None
+
+    async with worker:
+        running = profiler.running
+
+    assert running
+    assert not profiler.running
+    assert output.exists()
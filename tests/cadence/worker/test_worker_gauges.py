@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from datetime import timedelta
+from unittest.mock import Mock, call
+
+import pytest
+
+from cadence._internal.concurrency import CountingThreadPoolExecutor
+from cadence.metrics import MetricsEmitter
+from cadence.metrics.constants import (
+    POLLER_ACTIVE_GAUGE,
+    TAG_WORKER_TYPE,
+    WORKER_IN_FLIGHT_TASKS_GAUGE,
+    WORKER_PERMIT_WAIT_LATENCY,
+    WORKER_TASK_SLOTS_AVAILABLE_GAUGE,
+    WORKER_TASK_SLOTS_USED_GAUGE,
+    WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE,
+)
+from cadence.worker._poller import Poller
+from cadence.worker._worker_gauges import WorkerGauges
+
+TAGS = {TAG_WORKER_TYPE: "ActivityWorker"}
+
+
+def _poller(held_permits: int, in_flight: int, active: int) -> Mock:
+    poller = Mock(spec=Poller)
+    poller.held_permits = held_permits
+    poller.in_flight_tasks = in_flight
+    poller.active_pollers = active
+    return poller
+
+
+def test_sample_reports_slots_and_pollers():
+    emitter = Mock(spec=MetricsEmitter)
+    gauges = WorkerGauges(
+        emitter=emitter,
+        worker_type="ActivityWorker",
+        max_slots=10,
+        poller=_poller(held_permits=4, in_flight=3, active=2),
+    )
+
+    gauges.sample()
+
+    emitter.gauge.assert_has_calls(
+        [
+            call(WORKER_TASK_SLOTS_USED_GAUGE, 4, tags=TAGS),
+            call(WORKER_TASK_SLOTS_AVAILABLE_GAUGE, 6, tags=TAGS),
+            call(WORKER_IN_FLIGHT_TASKS_GAUGE, 3, tags=TAGS),
+            call(POLLER_ACTIVE_GAUGE, 2, tags=TAGS),
+        ]
+    )
+    assert emitter.gauge.call_count == 4
+
+
+def test_sample_reports_thread_pool_queue_depth():
+    emitter = Mock(spec=MetricsEmitter)
+    pool = CountingThreadPoolExecutor(max_workers=1)
+    running = threading.Event()
+    release = threading.Event()
+
+    def block() -> None:
+        running.set()
+        release.wait()
+
+    try:
+        pool.submit(block)
+        running.wait()
+        queued = [pool.submit(lambda: None) for _ in range(2)]
+        gauges = WorkerGauges(
+            emitter=emitter,
+            worker_type="ActivityWorker",
+            max_slots=1,
+            poller=_poller(held_permits=0, in_flight=0, active=0),
+            thread_pool=pool,
+        )
+
+        gauges.sample()
+
+        emitter.gauge.assert_any_call(
+            WORKER_THREAD_POOL_QUEUE_DEPTH_GAUGE, 2, tags=TAGS
+        )
+        release.set()
+        for future in queued:
+            future.result()
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_record_permit_wait():
+    emitter = Mock(spec=MetricsEmitter)
+    gauges = WorkerGauges(
+        emitter=emitter,
+        worker_type="ActivityWorker",
+        max_slots=1,
+        poller=_poller(held_permits=0, in_flight=0, active=0),
+    )
+
+    gauges.record_permit_wait(timedelta(milliseconds=5))
+
+    emitter.histogram.assert_called_once_with(
+        WORKER_PERMIT_WAIT_LATENCY, timedelta(milliseconds=5), tags=TAGS
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_samples_until_cancelled():
+    emitter = Mock(spec=MetricsEmitter)
+    gauges = WorkerGauges(
+        emitter=emitter,
+        worker_type="ActivityWorker",
+        max_slots=1,
+        poller=_poller(held_permits=0, in_flight=0, active=1),
+    )
+
+    task = asyncio.create_task(gauges.run(timedelta(milliseconds=1)))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert emitter.gauge.call_count >= 8